@@ -0,0 +1,71 @@
+"""Compare the precompiled ActionMatcher against the previous linear scan over the Action enum.
+
+Usage: python benchmarks/action_matcher.py
+"""
+
+import string
+import timeit
+
+from private_assistant_time_skill.action_matcher import ActionMatcher
+from private_assistant_time_skill.time_skill import Action
+
+UTTERANCES = [
+    "set a timer for 10 minutes",
+    "please set timer for one hour and 30 minutes",
+    "can you list the timers?",
+    "list all active timers please",
+    "delete the last timer",
+    "what's the time?",
+    "hey assistant, whats the time right now",
+    "help",
+    "turn on the lights in the kitchen",
+    "play some jazz music in the living room",
+    "what's the weather like tomorrow in Berlin?",
+    "remind me to buy milk when I leave work",
+    "how late is it",
+    "cancel the timer",
+]
+ROUNDS = 20_000
+VOCABULARY_SIZES = (5, 50, 500)
+
+
+def legacy_match(text: str, patterns: list[tuple[str, list[str]]]) -> str | None:
+    """The previous algorithm: rebuild the translation table and check every pattern in turn."""
+    text = text.translate(str.maketrans("", "", string.punctuation))
+    text_words = set(text.lower().split())
+    for name, words in patterns:
+        if all(word in text_words for word in words):
+            return name
+    return None
+
+
+def legacy_enum_match(text: str) -> Action | None:
+    text = text.translate(str.maketrans("", "", string.punctuation))
+    text_words = set(text.lower().split())
+    for action in Action:
+        if all(word in text_words for word in action.value):
+            return action
+    return None
+
+
+def per_call_us(function, rounds: int) -> float:
+    total = timeit.timeit(lambda: [function(text) for text in UTTERANCES], number=rounds)
+    return total / (rounds * len(UTTERANCES)) * 1e6
+
+
+def main() -> None:
+    legacy = per_call_us(legacy_enum_match, ROUNDS)
+    matcher = per_call_us(Action.find_matching_action, ROUNDS)
+    print(f"Action enum: legacy {legacy:.2f}us, matcher {matcher:.2f}us per utterance")
+
+    # Grow the vocabulary with synthetic two-word actions that never match the corpus
+    for size in VOCABULARY_SIZES:
+        patterns = [(f"action-{i}", [f"word{i}", f"other{i}"]) for i in range(size)]
+        synthetic = ActionMatcher(keywords={name: [words] for name, words in patterns})
+        legacy = per_call_us(lambda text, patterns=patterns: legacy_match(text, patterns), ROUNDS // 10)
+        matcher = per_call_us(synthetic.match, ROUNDS // 10)
+        print(f"{size:>4} actions: legacy {legacy:.2f}us, matcher {matcher:.2f}us per utterance")
+
+
+if __name__ == "__main__":
+    main()
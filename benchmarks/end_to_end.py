@@ -0,0 +1,268 @@
+"""End-to-end benchmark of request handling and timer triggering against the in-process broker.
+
+Each request goes through ``handle_client_request_message`` (JSON validation, certainty, process_request)
+and is timed until its response arrives on the broker. Intents meant for other skills, which make up most
+of the traffic on the bus, are timed until the skill has rejected them. A burst of HELP requests handled back to back
+measures how publishing holds up when replies pile up. Results are compared with the stored baseline;
+pass ``--save`` to overwrite the baseline after an intended change. ``--metrics`` runs the skill with a
+metrics registry attached to measure the instrumentation overhead.
+
+Usage: python benchmarks/end_to_end.py [--save] [--metrics] [--requests N]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import pathlib
+import statistics
+import time
+import tracemalloc
+import uuid
+
+import jinja2
+from private_assistant_commons import messages
+
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.local_broker import LocalBroker, LocalClient
+from private_assistant_time_skill.metrics import MetricsRegistry
+from private_assistant_time_skill.schedules import Schedule
+from private_assistant_time_skill.time_skill import Action, Parameters, TimeSkill
+
+BASELINE_PATH = pathlib.Path(__file__).parent / "results" / "end_to_end.json"
+ALLOCATION_SAMPLES = 200
+TRIGGER_COUNT = 1_000
+
+REQUESTS = {
+    Action.HELP: ("help", []),
+    Action.SET: ("set a timer for 10 minutes", [messages.NumberAnalysisResult(number_token=10, next_token="minutes")]),
+    Action.LIST: ("list all timers", []),
+    Action.DELETE_LAST: ("delete the last timer", []),
+    Action.CURRENT_TIME: ("whats the time", []),
+    Action.SET_ALARM: ("wake me at 6:30", []),
+    Action.LIST_ALARMS: ("list my alarms", []),
+    Action.STOP_ALARM: ("stop the alarm", []),
+    Action.DELETE_ALARM: ("delete the alarm at 6:30", []),
+    Action.PAUSE: ("pause the pasta timer", []),
+    Action.RESUME: ("resume the pasta timer", []),
+    Action.EXTEND: (
+        "add 5 minutes to the pasta timer",
+        [messages.NumberAnalysisResult(number_token=5, next_token="minutes")],
+    ),
+    Action.DELETE: ("delete the pasta timer", []),
+}
+
+# Requests for other skills as the intent analysis reports them: text, numbers, nouns and verbs
+IRRELEVANT_REQUESTS = [
+    ("turn on the lights in the kitchen", [], ["lights", "kitchen"], ["turn"]),
+    ("play some jazz music", [], ["jazz", "music"], ["play"]),
+    # Contains "second", so it passes the payload pre-filter and is rejected by calculate_certainty
+    ("turn off the lights on the second floor", [], ["lights", "floor"], ["turn"]),
+    ("what's the weather like tomorrow", [], ["weather"], ["is"]),
+    (
+        "set the heating to 21 degrees",
+        [messages.NumberAnalysisResult(number_token=21, next_token="degrees")],
+        ["heating"],
+        ["set"],
+    ),
+]
+
+
+def make_payload(
+    text: str,
+    numbers: list[messages.NumberAnalysisResult],
+    room: str,
+    nouns: list[str] | None = None,
+    verbs: list[str] | None = None,
+) -> str:
+    return messages.IntentAnalysisResult(
+        client_request=messages.ClientRequest(id=uuid.uuid4(), text=text, room=room, output_topic=f"bench/{room}"),
+        numbers=numbers,
+        nouns=["timer", "time"] if nouns is None else nouns,
+        verbs=verbs or [],
+    ).model_dump_json()
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def request_round_trip(skill: TimeSkill, observer: LocalClient, payload: str) -> float:
+    start = time.perf_counter()
+    await skill.handle_client_request_message(payload)
+    await observer.queue.get()
+    return time.perf_counter() - start
+
+
+async def benchmark_action(
+    skill: TimeSkill, observer: LocalClient, action: Action, request_count: int
+) -> dict[str, float]:
+    text, numbers = REQUESTS[action]
+    # Distinct rooms give the delete actions something to delete and keep list answers at a fixed size
+    rooms = [f"{action.name.lower()}-{i}" for i in range(request_count)]
+    if action in (Action.DELETE_LAST, Action.LIST):
+        for room in rooms:
+            client_request = messages.ClientRequest(id=uuid.uuid4(), text="", room=room, output_topic="unused")
+            for minutes in range(1, 11 if action == Action.LIST else 2):
+                skill.register_timer(Parameters(minutes=minutes), client_request)
+    if action in (Action.DELETE_ALARM, Action.LIST_ALARMS, Action.STOP_ALARM):
+        for room in rooms:
+            client_request = messages.ClientRequest(id=uuid.uuid4(), text="", room=room, output_topic="unused")
+            for hour in range(6, 9 if action == Action.LIST_ALARMS else 7):
+                skill.register_alarm(Parameters(schedule=Schedule(hour, 30)), client_request)
+    if action in (Action.PAUSE, Action.RESUME, Action.EXTEND, Action.DELETE):
+        for room in rooms:
+            client_request = messages.ClientRequest(id=uuid.uuid4(), text="", room=room, output_topic="unused")
+            skill.register_timer(Parameters(minutes=10, label="pasta"), client_request)
+            if action == Action.RESUME:
+                skill.pause_timer(Parameters(label="pasta"), room)
+    payloads = [make_payload(text, numbers, room) for room in rooms]
+
+    latencies = [await request_round_trip(skill, observer, payload) for payload in payloads]
+    total = sum(latencies)
+
+    tracemalloc.start()
+    peaks = []
+    for payload in payloads[:ALLOCATION_SAMPLES]:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await request_round_trip(skill, observer, payload)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    return {
+        "p50_us": percentile(latencies, 0.5) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+        "throughput_rps": request_count / total,
+        "peak_alloc_kib": statistics.mean(peaks) / 1024,
+    }
+
+
+async def benchmark_burst(skill: TimeSkill, observer: LocalClient, request_count: int) -> dict[str, float]:
+    payloads = [make_payload("help", [], f"burst-{i}") for i in range(request_count)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    # Handled back to back like the MQTT listener does, without waiting for the replies in between
+    for payload in payloads:
+        await skill.handle_client_request_message(payload)
+    for _ in payloads:
+        await observer.queue.get()
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"total_ms": total * 1e3, "throughput_rps": request_count / total, "peak_alloc_mib": peak / 2**20}
+
+
+async def benchmark_irrelevant(skill: TimeSkill, request_count: int) -> dict[str, float]:
+    payloads = [
+        make_payload(text, numbers, f"irrelevant-{i}", nouns, verbs)
+        for i in range(request_count)
+        for text, numbers, nouns, verbs in IRRELEVANT_REQUESTS
+    ]
+    start = time.perf_counter()
+    for payload in payloads:
+        await skill.handle_client_request_message(payload)
+    total = time.perf_counter() - start
+    return {"per_request_us": total / len(payloads) * 1e6, "throughput_rps": len(payloads) / total}
+
+
+async def benchmark_components(skill: TimeSkill, request_count: int) -> dict[str, dict[str, float]]:
+    intent = messages.IntentAnalysisResult.model_validate_json(make_payload("whats the time", [], "component"))
+    start = time.perf_counter()
+    for _ in range(request_count):
+        await skill.calculate_certainty(intent)
+    certainty = (time.perf_counter() - start) / request_count
+
+    parameters = Parameters(minutes=10, timers=[{"id": "5 minutes", "time_left": "3 minutes"}] * 5)
+    render = {}
+    for action in Action:
+        start = time.perf_counter()
+        for _ in range(request_count):
+            skill.get_answer(action, parameters)
+        render[f"render_{action.name.lower()}_us"] = (time.perf_counter() - start) / request_count * 1e6
+    return {"components": {"calculate_certainty_us": certainty * 1e6, **render}}
+
+
+async def benchmark_triggers(skill: TimeSkill, observer: LocalClient) -> dict[str, float]:
+    loop = asyncio.get_running_loop()
+    deadlines: dict[str, float] = {}
+    for i in range(TRIGGER_COUNT):
+        client_request = messages.ClientRequest(
+            id=uuid.uuid4(), text="", room=f"trigger-{i}", output_topic=f"bench/trigger-{i}"
+        )
+        skill.register_timer(Parameters(seconds=1), client_request)
+        deadline = skill.scheduler.deadline(skill.active_timers[client_request.room]["1 second"])
+        assert deadline is not None
+        deadlines[client_request.output_topic] = deadline
+
+    lateness = []
+    for _ in range(TRIGGER_COUNT):
+        message = await observer.queue.get()
+        lateness.append(loop.time() - deadlines[message.topic.value])
+    return {
+        "p50_lateness_ms": percentile(lateness, 0.5) * 1e3,
+        "p99_lateness_ms": percentile(lateness, 0.99) * 1e3,
+    }
+
+
+async def run(request_count: int, with_metrics: bool) -> dict[str, dict[str, float]]:
+    broker = LocalBroker()
+    observer = broker.client()
+    await observer.subscribe("bench/#")
+    logger = logging.getLogger("benchmark")
+    logger.setLevel(logging.WARNING)
+    template_env = jinja2.Environment(loader=jinja2.PackageLoader("private_assistant_time_skill", "templates"))
+
+    results: dict[str, dict[str, float]] = {}
+    async with asyncio.TaskGroup() as task_group:
+        skill = TimeSkill(
+            TimeSkillConfig(),
+            broker.client(),  # type: ignore[arg-type]
+            template_env,
+            task_group,
+            logger,
+            metrics_registry=MetricsRegistry() if with_metrics else None,
+        )
+        await skill.skill_preparations()
+        for action in Action:
+            results[action.name] = await benchmark_action(skill, observer, action, request_count)
+        results["BURST"] = await benchmark_burst(skill, observer, request_count)
+        results["IRRELEVANT"] = await benchmark_irrelevant(skill, request_count)
+        results.update(await benchmark_components(skill, request_count))
+        results["TRIGGER"] = await benchmark_triggers(skill, observer)
+        # Stop the scheduler and any pending publishes so the task group can exit
+        for task in asyncio.all_tasks() - {asyncio.current_task()}:
+            task.cancel()
+    return results
+
+
+def report(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]]) -> None:
+    for group, metrics in results.items():
+        print(group)
+        for name, value in metrics.items():
+            previous = baseline.get(group, {}).get(name)
+            change = f" ({(value - previous) / previous:+.0%} vs baseline)" if previous else ""
+            print(f"  {name:<28}{value:>12.1f}{change}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="overwrite the stored baseline")
+    parser.add_argument("--metrics", action="store_true", help="attach a metrics registry to the skill")
+    parser.add_argument("--requests", type=int, default=2_000, help="requests per action")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.requests, args.metrics))
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    report(results, baseline)
+    if args.save:
+        rounded = {
+            group: {name: round(value, 1) for name, value in metrics.items()} for group, metrics in results.items()
+        }
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(rounded, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Replay a 24-hour timer workload on simulated time and check when every timer fired.
+
+Requests arrive at random times over one simulated day and set timers of up to two hours, each through
+``handle_client_request_message`` against the in-process broker. The ``VirtualTimeEventLoop`` skips the
+idle time between events, so the run takes seconds. Every announcement must arrive in deadline order and
+without lateness; the script reports the wall and CPU time the replay took.
+
+Usage: python benchmarks/simulated_day.py [TIMERS]
+"""
+
+import asyncio
+import logging
+import random
+import sys
+import time
+import uuid
+
+import jinja2
+from private_assistant_commons import messages
+
+from private_assistant_time_skill.clock import VirtualTimeEventLoop, run_simulated
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.local_broker import LocalBroker
+from private_assistant_time_skill.time_skill import TimeSkill
+
+DEFAULT_TIMERS = 5_000
+DAY = 86400
+MAX_DURATION = 2 * 3600
+# Float rounding is all the lateness simulated time allows
+MAX_LATENESS = 1e-6
+
+
+def make_trace(count: int) -> list[tuple[float, int, str, str]]:
+    """Return (arrival offset, duration in seconds, output topic, payload) per request, ordered by arrival."""
+    rng = random.Random(0)
+    trace = []
+    for i in range(count):
+        duration = rng.randrange(1, MAX_DURATION)
+        hours, remainder = divmod(duration, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        numbers = [
+            messages.NumberAnalysisResult(number_token=value, next_token=unit)
+            for value, unit in ((hours, "hours"), (minutes, "minutes"), (seconds, "seconds"))
+            if value
+        ]
+        payload = messages.IntentAnalysisResult(
+            client_request=messages.ClientRequest(
+                id=uuid.uuid4(), text="set a timer", room=f"room-{i}", output_topic=f"sim/room-{i}"
+            ),
+            numbers=numbers,
+            nouns=["timer"],
+            verbs=["set"],
+        ).model_dump_json()
+        trace.append((rng.uniform(0, DAY), duration, f"sim/room-{i}", payload))
+    return sorted(trace)
+
+
+async def replay(trace: list[tuple[float, int, str, str]]) -> list[float]:
+    """Replay the trace and return the lateness of every announcement, in the order they arrived."""
+    loop = asyncio.get_running_loop()
+    assert isinstance(loop, VirtualTimeEventLoop)
+    broker = LocalBroker()
+    observer = broker.client()
+    await observer.subscribe("sim/#")
+    logger = logging.getLogger("simulation")
+    logger.setLevel(logging.WARNING)
+    template_env = jinja2.Environment(loader=jinja2.PackageLoader("private_assistant_time_skill", "templates"))
+
+    due: dict[str, float] = {}
+    lateness: list[float] = []
+    async with asyncio.TaskGroup() as task_group:
+        skill = TimeSkill(
+            TimeSkillConfig(),
+            broker.client(),  # type: ignore[arg-type]
+            template_env,
+            task_group,
+            logger,
+            wall_clock=loop.wall_time,
+        )
+        await skill.skill_preparations()
+
+        async def collect() -> None:
+            while len(lateness) < len(trace):
+                message = await observer.queue.get()
+                if isinstance(message.payload, bytes) and b"is due" in message.payload:
+                    lateness.append(loop.time() - due[message.topic.value])
+
+        collector = asyncio.create_task(collect())
+        for arrival, duration, topic, payload in trace:
+            await asyncio.sleep(max(arrival - loop.time(), 0.0))
+            due[topic] = loop.time() + duration
+            await skill.handle_client_request_message(payload)
+        await collector
+        for task in asyncio.all_tasks() - {asyncio.current_task()}:
+            task.cancel()
+    return lateness
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TIMERS
+    trace = make_trace(count)
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    lateness = run_simulated(replay(trace))
+    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+    assert len(lateness) == count
+    # Simulated time only moves between events, so an announcement lands exactly on its deadline
+    assert max(abs(value) for value in lateness) < MAX_LATENESS
+    print(f"{count:,} timers over a simulated day in {wall:.2f}s wall, {cpu:.2f}s CPU")
+    print(f"  CPU per timer (request, schedule, fire, announce): {cpu / count * 1e6:.0f} µs")
+    print(f"  lateness: max {max(lateness) * 1e3:.3f} ms, min {min(lateness) * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
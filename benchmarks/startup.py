@@ -0,0 +1,146 @@
+"""Startup benchmark: time from process start to the first handled request.
+
+Every run starts a fresh interpreter that imports an entry point, builds a ``TimeSkill`` on ``LocalBroker``
+like ``start_skill`` does against MQTT, and sends one "what's the time" request through
+``handle_client_request_message``. The ``cli`` mode imports the typer CLI in ``main`` and parses the
+templates; the ``service`` mode imports ``service`` and loads templates compiled beforehand with
+``service.compile_templates``, as the container does. The parent times each run from spawning the process
+until the child reports its answer; the child reports when its imports, setup and first request finished.
+Results are compared with the stored baseline; pass ``--save`` to overwrite it.
+
+Usage: python benchmarks/startup.py [--save] [--runs N]
+"""
+
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+BASELINE_PATH = pathlib.Path(__file__).parent / "results" / "startup.json"
+MODES = {
+    "cli": "private_assistant_time_skill.main",
+    "service": "private_assistant_time_skill.service",
+}
+
+
+def child(mode: str, compiled_templates: str) -> None:
+    """Run in the spawned interpreter: start the skill, answer one request and print the phase times."""
+    start = time.perf_counter()
+    import asyncio  # noqa: PLC0415
+    import importlib  # noqa: PLC0415
+    import logging  # noqa: PLC0415
+
+    importlib.import_module(MODES[mode])
+    # Already imported by either entry point, apart from the broker stand-in
+    from private_assistant_commons import messages, skill_logger  # noqa: PLC0415
+
+    from private_assistant_time_skill import config, local_broker, service, time_skill  # noqa: PLC0415
+
+    imported = time.perf_counter()
+
+    async def first_request() -> dict[str, float]:
+        broker = local_broker.LocalBroker()
+        observer = broker.client()
+        await observer.subscribe("bench/#")
+        logger = skill_logger.SkillLogger.get_logger("startup benchmark", logging.WARNING)
+        async with asyncio.TaskGroup() as task_group:
+            skill = time_skill.TimeSkill(
+                config.TimeSkillConfig(),
+                broker.client(),  # type: ignore[arg-type]
+                # Only the service mode loads the compiled templates
+                service.create_template_env(pathlib.Path(compiled_templates) if mode == "service" else None),
+                task_group,
+                logger,
+            )
+            await skill.setup_mqtt_subscriptions()
+            await skill.skill_preparations()
+            ready = time.perf_counter()
+            payload = messages.IntentAnalysisResult(
+                client_request=messages.ClientRequest(
+                    id=uuid.uuid4(),
+                    text="whats the time",
+                    room="startup",
+                    output_topic="bench/startup",
+                ),
+                numbers=[],
+                nouns=["time"],
+                verbs=[],
+            ).model_dump_json()
+            await skill.handle_client_request_message(payload)
+            await observer.queue.get()
+            answered = time.perf_counter()
+            for task in asyncio.all_tasks() - {asyncio.current_task()}:
+                task.cancel()
+        return {
+            "import_ms": (imported - start) * 1e3,
+            "ready_ms": (ready - start) * 1e3,
+            "first_request_ms": (answered - start) * 1e3,
+        }
+
+    print(json.dumps(asyncio.run(first_request())), flush=True)
+
+
+def run_once(mode: str, compiled_templates: str) -> dict[str, float]:
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, __file__, "--child", mode, compiled_templates], stdout=subprocess.PIPE, text=True
+    )
+    assert process.stdout is not None
+    line = process.stdout.readline()
+    answered = time.perf_counter()
+    process.wait()
+    if process.returncode != 0 or not line:
+        raise RuntimeError(f"Startup run in {mode} mode failed with exit code {process.returncode}.")
+    return {"process_ms": (answered - start) * 1e3, **json.loads(line)}
+
+
+def run(runs: int) -> dict[str, dict[str, float]]:
+    from private_assistant_time_skill import service  # noqa: PLC0415
+
+    results = {}
+    with tempfile.TemporaryDirectory() as compiled_templates:
+        service.compile_templates(pathlib.Path(compiled_templates))
+        for mode in MODES:
+            # The first run writes the bytecode caches a deployed package ships with
+            run_once(mode, compiled_templates)
+            samples = [run_once(mode, compiled_templates) for _ in range(runs)]
+            results[mode] = {name: statistics.median(sample[name] for sample in samples) for name in samples[0]}
+    return results
+
+
+def report(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]]) -> None:
+    for group, metrics in results.items():
+        print(group)
+        for name, value in metrics.items():
+            previous = baseline.get(group, {}).get(name)
+            change = f" ({(value - previous) / previous:+.0%} vs baseline)" if previous else ""
+            print(f"  {name:<28}{value:>12.1f}{change}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="overwrite the stored baseline")
+    parser.add_argument("--runs", type=int, default=10, help="process starts per mode")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    report(results, baseline)
+    if args.save:
+        rounded = {
+            group: {name: round(value, 1) for name, value in metrics.items()} for group, metrics in results.items()
+        }
+        BASELINE_PATH.parent.mkdir(exist_ok=True)
+        BASELINE_PATH.write_text(json.dumps(rounded, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main()
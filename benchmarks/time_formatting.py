@@ -0,0 +1,114 @@
+"""Compare the phrase-table time formatting and zone clocks against the previous per-call versions.
+
+Usage: python benchmarks/time_formatting.py
+"""
+
+import random
+import timeit
+import zoneinfo
+from datetime import datetime, timedelta
+
+from private_assistant_time_skill.time_skill import Parameters
+from private_assistant_time_skill.time_zones import get_zone_clock
+from private_assistant_time_skill.tools_time_units import format_time_difference, format_time_for_tts
+
+ROUNDS = 20
+SAMPLES = 10_000
+
+
+def legacy_format_time_difference(time_diff: timedelta) -> str:
+    total_seconds = int(time_diff.total_seconds())
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    parts = []
+    if hours > 0:
+        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+    if minutes > 0:
+        parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
+    if seconds > 0:
+        parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
+    return " and ".join(parts)
+
+
+def legacy_format_time_for_tts(time: datetime, with_date: bool = False) -> str:
+    hour = time.hour
+    minute = time.minute
+    minute_threshold = 10
+
+    if minute == 0:
+        time_str = f"{hour} o'clock"
+    elif minute < minute_threshold:
+        time_str = f"{minute} past {hour}"
+    else:
+        time_str = f"{minute} past {hour}"
+
+    if with_date:
+        date_str = time.strftime("%A, %B %d")
+        return f"{date_str} at {time_str}"
+    return time_str
+
+
+def legacy_duration_name(parameters: Parameters) -> str:
+    parts = []
+    if parameters.hours is not None and parameters.hours > 0:
+        parts.append(f"{parameters.hours} hour{'s' if parameters.hours != 1 else ''}")
+    if parameters.minutes is not None and parameters.minutes > 0:
+        parts.append(f"{parameters.minutes} minute{'s' if parameters.minutes != 1 else ''}")
+    if parameters.seconds is not None and parameters.seconds > 0:
+        parts.append(f"{parameters.seconds} second{'s' if parameters.seconds != 1 else ''}")
+    return " and ".join(parts)
+
+
+def per_call_ns(function, inputs: list) -> float:
+    total = timeit.timeit(lambda: [function(value) for value in inputs], number=ROUNDS)
+    return total / (ROUNDS * len(inputs)) * 1e9
+
+
+def report(name: str, legacy: float, tables: float) -> None:
+    print(f"{name:<24} legacy {legacy:7.0f}ns, tables {tables:7.0f}ns")
+
+
+def main() -> None:
+    rng = random.Random(0)
+    # Remaining times as LIST reports them, mostly within the phrase table
+    time_diffs = [timedelta(seconds=rng.randrange(4 * 3600)) for _ in range(SAMPLES)]
+    times = [datetime(2024, 1, 1, rng.randrange(24), rng.randrange(60)) for _ in range(SAMPLES)]
+    parameters = [
+        Parameters(hours=rng.randrange(3), minutes=rng.randrange(60), seconds=rng.randrange(60)) for _ in range(SAMPLES)
+    ]
+    assert [format_time_difference(value) for value in time_diffs] == list(
+        map(legacy_format_time_difference, time_diffs)
+    )
+    assert [format_time_for_tts(value) for value in times] == list(map(legacy_format_time_for_tts, times))
+
+    report(
+        "format_time_difference",
+        per_call_ns(legacy_format_time_difference, time_diffs),
+        per_call_ns(format_time_difference, time_diffs),
+    )
+    report(
+        "format_time_for_tts", per_call_ns(legacy_format_time_for_tts, times), per_call_ns(format_time_for_tts, times)
+    )
+    report(
+        "duration_name",
+        per_call_ns(legacy_duration_name, parameters),
+        per_call_ns(lambda value: value.duration_name, parameters),
+    )
+    calls = list(range(SAMPLES))
+    local_clock = get_zone_clock()
+    report(
+        "now (host zone)",
+        per_call_ns(lambda _: datetime.now().astimezone(), calls),
+        per_call_ns(lambda _: local_clock.now(), calls),
+    )
+    berlin = zoneinfo.ZoneInfo("Europe/Berlin")
+    berlin_clock = get_zone_clock("Europe/Berlin")
+    report(
+        "now (Europe/Berlin)",
+        per_call_ns(lambda _: datetime.now(berlin), calls),
+        per_call_ns(lambda _: berlin_clock.now(), calls),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measure the memory each active timer keeps alive in a TimeSkill.
+
+Timers are registered through ``TimeSkill.register_timer`` from freshly parsed client requests, as on the
+request path, spread over 1,000 rooms with 100 durations each. Only what the skill retains is counted.
+
+Usage: python benchmarks/timer_memory.py [COUNT]
+"""
+
+import asyncio
+import gc
+import logging
+import sys
+import tracemalloc
+import uuid
+
+import jinja2
+from private_assistant_commons import messages
+
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.local_broker import LocalBroker
+from private_assistant_time_skill.time_skill import Parameters, TimeSkill
+
+DEFAULT_COUNT = 100_000
+DURATIONS_PER_ROOM = 100
+
+
+async def measure(count: int) -> float:
+    template_env = jinja2.Environment(loader=jinja2.PackageLoader("private_assistant_time_skill", "templates"))
+    logger = logging.getLogger("benchmark")
+    logger.setLevel(logging.WARNING)
+    async with asyncio.TaskGroup() as task_group:
+        skill = TimeSkill(TimeSkillConfig(), LocalBroker().client(), template_env, task_group, logger)  # type: ignore[arg-type]
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(count):
+            room = f"room-{i // DURATIONS_PER_ROOM}"
+            client_request = messages.ClientRequest.model_validate_json(
+                messages.ClientRequest(
+                    id=uuid.uuid4(), text="set a timer", room=room, output_topic=f"assistant/{room}/output"
+                ).model_dump_json()
+            )
+            skill.register_timer(Parameters(minutes=i % DURATIONS_PER_ROOM + 1), client_request)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(skill.scheduler) == count
+    return (after - before) / count
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    per_timer = asyncio.run(measure(count))
+    print(f"{count:,} timers: {per_timer:.0f} bytes per timer, {per_timer * count / 2**20:.1f} MiB total")
+
+
+if __name__ == "__main__":
+    main()
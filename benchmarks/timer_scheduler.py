@@ -0,0 +1,99 @@
+"""Compare memory and CPU cost of per-task timers against the heap-backed TimerScheduler.
+
+Usage: python benchmarks/timer_scheduler.py [COUNT ...]
+"""
+
+import asyncio
+import gc
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Coroutine
+from datetime import datetime, timedelta
+from typing import Any
+
+from private_assistant_time_skill.scheduler import TimerScheduler
+
+FIRE_WINDOW = 1.0
+DEFAULT_COUNTS = (10_000, 100_000)
+
+
+async def per_task_model(count: int, delays: list[float], done: Callable[[], None]) -> Callable[[], None]:
+    """Mirror the previous register_timer: one sleeping task, a done-callback lambda and a dict per timer."""
+    active_timers: dict[str, dict] = {}
+
+    async def timer_task(total_diff: timedelta) -> None:
+        await asyncio.sleep(total_diff.total_seconds())
+        done()
+
+    for i in range(count):
+        name = f"timer-{i}"
+        total_diff = timedelta(seconds=delays[i])
+        task = asyncio.create_task(timer_task(total_diff))
+        task.add_done_callback(lambda _, name=name: active_timers.pop(name, None))  # type: ignore[misc]
+        active_timers[name] = {"task": task, "start_time": datetime.now(), "total_duration": total_diff}
+
+    def cleanup() -> None:
+        for timer in list(active_timers.values()):
+            timer["task"].cancel()
+
+    return cleanup
+
+
+async def scheduler_model(count: int, delays: list[float], done: Callable[[], None]) -> Callable[[], None]:
+    scheduler = TimerScheduler(lambda _: done(), logging.getLogger(__name__))
+    for i in range(count):
+        scheduler.schedule(f"timer-{i}", delays[i])
+    run_task = asyncio.create_task(scheduler.run())
+
+    def cleanup() -> None:
+        run_task.cancel()
+
+    return cleanup
+
+
+async def measure(
+    model: Callable[[int, list[float], Callable[[], None]], Coroutine[Any, Any, Callable[[], None]]], count: int
+) -> dict[str, float]:
+    delays = [random.uniform(FIRE_WINDOW, 2 * FIRE_WINDOW) for _ in range(count)]
+    all_fired = asyncio.Event()
+    fired = 0
+
+    def done() -> None:
+        nonlocal fired
+        fired += 1
+        if fired == count:
+            all_fired.set()
+
+    gc.collect()
+    tracemalloc.start()
+    cpu_start = time.process_time()
+    cleanup = await model(count, delays, done)
+    register_cpu = time.process_time() - cpu_start
+    await asyncio.sleep(0)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cpu_start = time.process_time()
+    await all_fired.wait()
+    fire_cpu = time.process_time() - cpu_start
+    cleanup()
+    await asyncio.sleep(0)
+    return {"memory_mib": memory / 2**20, "register_cpu_s": register_cpu, "fire_cpu_s": fire_cpu}
+
+
+async def main(counts: list[int]) -> None:
+    print(f"{'model':<12}{'timers':>10}{'memory MiB':>14}{'register CPU s':>16}{'fire CPU s':>12}")
+    for count in counts:
+        for name, model in (("per-task", per_task_model), ("scheduler", scheduler_model)):
+            result = await measure(model, count)
+            print(
+                f"{name:<12}{count:>10}{result['memory_mib']:>14.1f}"
+                f"{result['register_cpu_s']:>16.3f}{result['fire_cpu_s']:>12.3f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or list(DEFAULT_COUNTS)))
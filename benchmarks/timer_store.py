@@ -0,0 +1,62 @@
+"""Measure warm restart time: reading persisted timers from the store and rescheduling them.
+
+Usage: python benchmarks/timer_store.py [COUNT]
+"""
+
+import asyncio
+import logging
+import pathlib
+import sys
+import tempfile
+import time
+from unittest.mock import Mock
+
+import jinja2
+
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.time_skill import TimeSkill
+from private_assistant_time_skill.timer_store import TimerRecord, TimerStore
+
+DEFAULT_COUNT = 100_000
+
+
+async def main(count: int) -> None:
+    logger = logging.getLogger(__name__)
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "timers.sqlite3"
+        store = TimerStore(path, logger)
+        store.open()
+        now = time.time()
+        for i in range(count):
+            store.record_create(
+                TimerRecord(
+                    f"room-{i % 100}", f"timer-{i}", f"room-{i % 100}/output", i % 24, i % 60, None, now + 60 + i % 3600
+                )
+            )
+        start = time.perf_counter()
+        await store.flush()
+        print(f"persisted {count} timers in {time.perf_counter() - start:.3f}s")
+        store.close()
+
+        skill = TimeSkill(
+            config_obj=TimeSkillConfig(timer_store_path=path),
+            mqtt_client=Mock(),
+            template_env=jinja2.Environment(loader=jinja2.PackageLoader("private_assistant_time_skill", "templates")),
+            task_group=Mock(),
+            logger=logger,
+        )
+        assert skill.timer_store is not None
+        start = time.perf_counter()
+        skill.timer_store.open()
+        timer_records = skill.timer_store.load()
+        loaded = time.perf_counter()
+        skill.restore_timers(timer_records)
+        restored = time.perf_counter()
+        skill.timer_store.close()
+
+    print(f"loaded {len(timer_records)} timers in {loaded - start:.3f}s")
+    print(f"rescheduled in {restored - loaded:.3f}s, total warm restart {restored - start:.3f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT))
@@ -0,0 +1,81 @@
+import string
+from collections.abc import Hashable, Iterable, Mapping
+from typing import Any
+
+_PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+
+def tokenize(text: str) -> list[str]:
+    return text.translate(_PUNCTUATION_TABLE).lower().split()
+
+
+class ActionMatcher:
+    """Match request text against keyword sets and phrases using an inverted index built once.
+
+    A keyword pattern matches when all of its words occur anywhere in the text, a phrase pattern when its
+    words occur consecutively. Tokens are mapped through ``synonyms`` before matching, so synonyms cost a
+    single dict lookup per token. Matching visits only the patterns indexed under the request's tokens,
+    which keeps it independent of the vocabulary size. When several actions match, the one registered
+    first wins.
+    """
+
+    def __init__(
+        self,
+        keywords: Mapping[Hashable, Iterable[Iterable[str]]],
+        phrases: Mapping[Hashable, Iterable[str]] | None = None,
+        synonyms: Mapping[str, str] | None = None,
+    ) -> None:
+        self.synonyms = dict(synonyms or {})
+        self._actions: list[Any] = []
+        self._required: list[int] = []
+        self._keyword_index: dict[str, list[int]] = {}
+        self._phrase_index: dict[str, list[tuple[int, tuple[str, ...]]]] = {}
+        priorities: dict[Hashable, int] = {}
+
+        for action, keyword_sets in keywords.items():
+            priorities.setdefault(action, len(priorities))
+            for keyword_set in keyword_sets:
+                words = {self.synonyms.get(word, word) for word in keyword_set}
+                pattern = self._add_pattern(action, len(words))
+                for word in words:
+                    self._keyword_index.setdefault(word, []).append(pattern)
+
+        for action, action_phrases in (phrases or {}).items():
+            priorities.setdefault(action, len(priorities))
+            for phrase in action_phrases:
+                words_tuple = tuple(self.synonyms.get(word, word) for word in tokenize(phrase))
+                pattern = self._add_pattern(action, len(words_tuple))
+                self._phrase_index.setdefault(words_tuple[0], []).append((pattern, words_tuple))
+
+        self._priorities = [priorities[action] for action in self._actions]
+
+    def _add_pattern(self, action: Hashable, required: int) -> int:
+        self._actions.append(action)
+        self._required.append(required)
+        return len(self._actions) - 1
+
+    def match(self, text: str) -> Any | None:
+        tokens = [self.synonyms.get(token, token) for token in tokenize(text)]
+        hits: dict[int, int] = {}
+        seen: set[str] = set()
+        best: int | None = None
+
+        for position, token in enumerate(tokens):
+            for pattern, words in self._phrase_index.get(token, ()):
+                if tuple(tokens[position : position + len(words)]) == words:
+                    best = self._better(best, pattern)
+            if token in seen:
+                continue
+            seen.add(token)
+            for pattern in self._keyword_index.get(token, ()):
+                count = hits.get(pattern, 0) + 1
+                hits[pattern] = count
+                if count == self._required[pattern]:
+                    best = self._better(best, pattern)
+
+        return self._actions[best] if best is not None else None
+
+    def _better(self, current: int | None, candidate: int) -> int:
+        if current is None or self._priorities[candidate] < self._priorities[current]:
+            return candidate
+        return current
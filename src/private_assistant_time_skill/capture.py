@@ -0,0 +1,198 @@
+import asyncio
+import json
+import logging
+import pathlib
+import time
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from private_assistant_time_skill.local_broker import LocalClient
+from private_assistant_time_skill.metrics import summarize
+
+CAPTURE_VERSION = 1
+INCOMING = "in"
+OUTGOING = "out"
+
+
+class CapturedMessage(NamedTuple):
+    # Seconds since the first message of the capture, on the event loop's clock
+    offset: float
+    direction: str
+    topic: str
+    payload: str
+
+
+class TrafficRecorder:
+    """Append every incoming intent analysis result and every outgoing message to a JSONL capture file.
+
+    Each recording process first writes a header holding the format version and the epoch second it
+    started at, so a file reused across restarts holds one segment per process. Each further line is one
+    ``CapturedMessage`` as a compact JSON array. Recording only appends the encoded line to a buffer; the
+    ``run`` task appends the buffer to the file from a worker thread.
+    """
+
+    def __init__(self, path: pathlib.Path, logger: logging.Logger, flush_interval: float = 1.0) -> None:
+        self.path = path
+        self.logger = logger
+        self.flush_interval = flush_interval
+        self.recorded = 0
+        self._loop_start: float | None = None
+        self._lines: list[str] = []
+
+    def record(self, direction: str, topic: str, payload: str) -> None:
+        now = asyncio.get_running_loop().time()
+        if self._loop_start is None:
+            self._loop_start = now
+            self._lines.append(json.dumps({"version": CAPTURE_VERSION, "started": time.time()}) + "\n")
+        self.recorded += 1
+        self._lines.append(
+            json.dumps([round(now - self._loop_start, 6), direction, topic, payload], separators=(",", ":")) + "\n"
+        )
+
+    def write(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        with self.path.open("a", encoding="utf-8") as file:
+            file.writelines(lines)
+
+    def _take_lines(self) -> list[str]:
+        lines, self._lines = self._lines, []
+        return lines
+
+    async def run(self) -> None:
+        """Append recorded messages to the file periodically until cancelled, then once more."""
+        self.logger.info("Capturing traffic into %s", self.path)
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await asyncio.to_thread(self.write, self._take_lines())
+        finally:
+            self.write(self._take_lines())
+
+
+def read_capture(path: pathlib.Path) -> tuple[float, list[CapturedMessage]]:
+    """Return the epoch second a capture started at and its messages in recorded order.
+
+    Each header after the first starts a segment recorded by a later process. The offsets of its messages
+    are moved by the time between both starts, so all offsets count from the first header.
+    """
+    started: float | None = None
+    shift = 0.0
+    traffic = []
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if isinstance(entry, dict):
+                if entry.get("version") != CAPTURE_VERSION:
+                    raise ValueError(f"Unsupported capture version {entry.get('version')!r} in {path}.")
+                if started is None:
+                    started = entry["started"]
+                shift = entry["started"] - started
+            elif started is None:
+                raise ValueError(f"Capture {path} does not start with a header.")
+            else:
+                offset, direction, topic, payload = entry
+                traffic.append(CapturedMessage(offset + shift, direction, topic, payload))
+    return (time.time() if started is None else started), traffic
+
+
+def _output_topic(payload: str) -> str | None:
+    try:
+        topic = json.loads(payload)["client_request"]["output_topic"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None
+    return topic if isinstance(topic, str) else None
+
+
+def output_topics(traffic: Iterable[CapturedMessage]) -> set[str]:
+    """Return every topic the skill answered or would answer on."""
+    topics = set()
+    for message in traffic:
+        topic = message.topic if message.direction == OUTGOING else _output_topic(message.payload)
+        if topic is not None:
+            topics.add(topic)
+    return topics
+
+
+def summarize_traffic(traffic: Iterable[CapturedMessage]) -> dict[str, object]:
+    """Count requests, responses and triggers and estimate response latency from a capture.
+
+    Responses carry no request id, so a response is attributed to the latest unanswered request that
+    named its topic as output topic. Requests the skill did not answer then never distort a later match.
+    """
+    requests = responses = triggers = 0
+    last_request: dict[str, float] = {}
+    latencies = []
+    for message in traffic:
+        if message.direction == INCOMING:
+            requests += 1
+            topic = _output_topic(message.payload)
+            if topic is not None:
+                last_request[topic] = message.offset
+        elif "alert" in json.loads(message.payload):
+            triggers += 1
+        else:
+            responses += 1
+            if message.topic in last_request:
+                latencies.append(message.offset - last_request.pop(message.topic))
+    return {
+        "requests": requests,
+        "responses": responses,
+        "triggers": triggers,
+        "response_latency": summarize(latencies),
+    }
+
+
+def count_mismatches(recorded: Iterable[CapturedMessage], replayed: Iterable[CapturedMessage]) -> int:
+    """Count outgoing messages that differ between two captures, comparing each topic's messages in order."""
+    texts: list[defaultdict[str, list[str]]] = []
+    for traffic in (recorded, replayed):
+        by_topic: defaultdict[str, list[str]] = defaultdict(list)
+        for message in traffic:
+            if message.direction == OUTGOING:
+                by_topic[message.topic].append(json.loads(message.payload).get("text", ""))
+        texts.append(by_topic)
+    mismatches = 0
+    for topic in texts[0].keys() | texts[1].keys():
+        first, second = texts[0][topic], texts[1][topic]
+        mismatches += sum(a != b for a, b in zip(first, second, strict=False)) + abs(len(first) - len(second))
+    return mismatches
+
+
+async def replay_traffic(
+    client: LocalClient, intent_topic: str, traffic: list[CapturedMessage], speed: float, drain: float
+) -> list[CapturedMessage]:
+    """Publish the incoming messages of a capture to ``intent_topic`` and record what the skill sends back.
+
+    Messages keep their recorded spacing divided by ``speed``; a speed of 0 sends them back to back. The
+    replay lasts until the capture's last message would have happened, plus ``drain`` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    for topic in output_topics(traffic):
+        await client.subscribe(topic)
+    start = loop.time()
+    replayed: list[CapturedMessage] = []
+
+    async def collect() -> None:
+        while True:
+            message = await client.queue.get()
+            payload = message.payload.decode("utf-8") if isinstance(message.payload, bytes) else str(message.payload)
+            replayed.append(CapturedMessage(loop.time() - start, OUTGOING, message.topic.value, payload))
+
+    collector = asyncio.create_task(collect())
+    try:
+        for message in traffic:
+            if message.direction != INCOMING:
+                continue
+            if speed > 0:
+                await asyncio.sleep(max(start + message.offset / speed - loop.time(), 0.0))
+            replayed.append(CapturedMessage(loop.time() - start, INCOMING, message.topic, message.payload))
+            await client.publish(intent_topic, message.payload)
+        end = start + (traffic[-1].offset / speed if speed > 0 and traffic else 0.0) + drain
+        await asyncio.sleep(max(end - loop.time(), 0.0))
+    finally:
+        collector.cancel()
+    return replayed
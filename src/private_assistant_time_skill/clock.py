@@ -0,0 +1,53 @@
+import asyncio
+import selectors
+import time
+from collections.abc import Coroutine
+from typing import Any
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """Selector that jumps the loop's clock forward instead of blocking until the next scheduled callback."""
+
+    def __init__(self, loop: "VirtualTimeEventLoop") -> None:
+        super().__init__()
+        self._loop = loop
+
+    def select(self, timeout: float | None = None) -> list[tuple[selectors.SelectorKey, int]]:
+        events = super().select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            # Nothing is scheduled, only I/O or a worker thread can wake the loop
+            return super().select(None)
+        self._loop.advance(timeout)
+        return []
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock advances instantly to the next scheduled callback.
+
+    Like a monotonic clock, ``time`` starts near zero, which keeps float steps far below the loop's clock
+    resolution. ``wall_time`` adds the epoch second ``start`` and is what a simulated ``TimeSkill`` takes
+    as its ``wall_clock``. Sleeps, timeouts and the timer scheduler then run on simulated time, while
+    sockets and worker threads still work as usual.
+    """
+
+    def __init__(self, start: float | None = None) -> None:
+        self.start = time.time() if start is None else start
+        self._virtual_time = 0.0
+        super().__init__(selector=_VirtualSelector(self))
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def wall_time(self) -> float:
+        return self.start + self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        self._virtual_time += seconds
+
+
+def run_simulated(main: Coroutine[Any, Any, Any], start: float | None = None) -> Any:
+    """Run ``main`` like ``asyncio.run`` on a ``VirtualTimeEventLoop`` starting at epoch second ``start``."""
+    with asyncio.Runner(loop_factory=lambda: VirtualTimeEventLoop(start)) as runner:
+        return runner.run(main)
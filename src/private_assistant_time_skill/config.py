@@ -0,0 +1,54 @@
+import pathlib
+
+from private_assistant_commons import skill_config
+from pydantic import Field
+
+from private_assistant_time_skill import locales, publish_queue, tools_time_units
+
+
+class TimeSkillConfig(skill_config.SkillConfig):
+    # SQLite file used to persist running timers across restarts; None keeps timers in memory only
+    timer_store_path: pathlib.Path | None = None
+    timer_store_flush_interval: float = 0.5
+    # Fire timers early by the measured event loop lag instead of letting every trigger run late
+    timer_drift_compensation: bool = False
+    # Triggers later than this many seconds are logged as a sign of a saturated event loop
+    timer_lateness_warning: float = 1.0
+    # Timers of one client due within this many seconds are announced together in a single publish
+    trigger_coalescing_window: float = 0.0
+    # Outbound messages wait in a queue of this many entries, drained by publish_workers in batches of up to
+    # publish_batch_size. Replies to requests wait for space; timer announcements are dropped when it is full
+    publish_queue_size: int = publish_queue.DEFAULT_MAX_SIZE
+    publish_workers: int = publish_queue.DEFAULT_WORKERS
+    publish_batch_size: int = publish_queue.DEFAULT_BATCH_SIZE
+    # Serve Prometheus text metrics on this local port; None disables the endpoint
+    metrics_port: int | None = None
+    metrics_host: str = "127.0.0.1"
+    # Publish a JSON metrics snapshot to metrics_topic every this many seconds; None disables it
+    metrics_publish_interval: float | None = None
+    # Locale code (see locales.LOCALES) for rooms not listed in client_locales, which maps room to locale code
+    default_locale: str = locales.DEFAULT_LOCALE
+    client_locales: dict[str, str] = Field(default_factory=dict)
+    # IANA zone (e.g. "Europe/Berlin") for rooms not listed in client_time_zones; None uses the host's zone
+    default_time_zone: str | None = None
+    client_time_zones: dict[str, str] = Field(default_factory=dict)
+    # Remaining times below this many seconds are spoken from a precomputed phrase table
+    duration_phrase_table_seconds: int = tools_time_units.DEFAULT_DURATION_TABLE_SECONDS
+    # Name of this instance in a sharded deployment; None runs unsharded and owns every room. Sharded
+    # instances hand timers off through timer_store_path, which must point to the same file for all of them
+    shard_instance_id: str | None = None
+    shard_heartbeat_interval: float = 1.0
+    # Peers silent for this many seconds are dropped from the hash ring and their rooms adopted
+    shard_member_timeout: float = 5.0
+
+    @property
+    def metrics_topic(self) -> str:
+        return f"{self.base_topic}/{self.client_id}/metrics"
+
+    @property
+    def metrics_enabled(self) -> bool:
+        return self.metrics_port is not None or self.metrics_publish_interval is not None
+
+    @property
+    def shard_topic(self) -> str:
+        return f"{self.base_topic}/{self.client_id}/shards"
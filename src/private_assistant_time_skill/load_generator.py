@@ -0,0 +1,174 @@
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import aiomqtt
+from private_assistant_commons import messages
+
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.metrics import summarize
+
+OUTPUT_TOPIC_PREFIX = "loadtest"
+
+REQUEST_TEXTS = {
+    "set": "set a timer for {seconds} seconds",
+    "list": "list my timers",
+    "delete_last": "delete the last timer",
+    "current_time": "whats the time",
+    "help": "help",
+}
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    """Parse an action mix such as ``set=4,list=1`` into relative weights."""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip().lower()
+        if name not in REQUEST_TEXTS:
+            raise ValueError(f"Unknown action '{name}' in mix, expected one of {', '.join(REQUEST_TEXTS)}.")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+@dataclass
+class LoadProfile:
+    rooms: int = 100
+    duration: float = 60.0
+    # Requests per second issued by each simulated room, spread as a Poisson process
+    rate: float = 0.1
+    mix: Mapping[str, float] = field(default_factory=lambda: {"set": 4, "list": 2, "delete_last": 1, "current_time": 3})
+    timer_durations: list[int] = field(default_factory=lambda: [5, 30, 60])
+    # Time to wait for outstanding responses and triggers after the last request
+    drain: float = 5.0
+
+
+@dataclass
+class LoadReport:
+    requests_sent: int = 0
+    responses: int = 0
+    triggers: int = 0
+    response_latency: list[float] = field(default_factory=list)
+    trigger_lateness: list[float] = field(default_factory=list)
+    loop_lag: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "requests_sent": self.requests_sent,
+            "responses": self.responses,
+            "missing_responses": self.requests_sent - self.responses,
+            "triggers": self.triggers,
+            "response_latency": summarize(self.response_latency),
+            "trigger_lateness": summarize(self.trigger_lateness),
+            "loop_lag": summarize(self.loop_lag),
+        }
+
+
+class LoadGenerator:
+    """Simulate voice clients in many rooms sending intent results to the skill over MQTT.
+
+    Responses and triggers are told apart by the alert the skill attaches to triggers. A room's responses
+    arrive in request order, so latency is measured against a per-room FIFO of send times. Trigger
+    lateness is measured against the time the SET confirmation arrived plus the timer duration.
+    """
+
+    def __init__(
+        self,
+        client: aiomqtt.Client,
+        config_obj: TimeSkillConfig,
+        profile: LoadProfile,
+        logger: logging.Logger,
+        lag_interval: float = 0.1,
+    ) -> None:
+        self.client = client
+        self.config_obj = config_obj
+        self.profile = profile
+        self.logger = logger
+        self.lag_interval = lag_interval
+        self.report = LoadReport()
+        self._pending: dict[str, deque[tuple[float, str, int]]] = {}
+        self._expected_triggers: dict[str, dict[int, float]] = {}
+        self._last_set: dict[str, int] = {}
+        self._actions = list(profile.mix)
+        self._weights = list(profile.mix.values())
+
+    async def run(self) -> LoadReport:
+        await self.client.subscribe(f"{OUTPUT_TOPIC_PREFIX}/+/output", qos=1)
+        async with asyncio.TaskGroup() as task_group:
+            receiver = task_group.create_task(self._receive())
+            monitor = task_group.create_task(self._monitor_loop_lag())
+            rooms = [task_group.create_task(self._simulate_room(f"room-{i}")) for i in range(self.profile.rooms)]
+            await asyncio.gather(*rooms)
+            await asyncio.sleep(self.profile.drain)
+            receiver.cancel()
+            monitor.cancel()
+        return self.report
+
+    async def _simulate_room(self, room: str) -> None:
+        self._pending[room] = deque()
+        self._expected_triggers[room] = {}
+        loop = asyncio.get_running_loop()
+        end = loop.time() + self.profile.duration
+        while True:
+            await asyncio.sleep(min(random.expovariate(self.profile.rate), max(end - loop.time(), 0.0)))
+            if loop.time() >= end:
+                return
+            action = random.choices(self._actions, self._weights)[0]
+            await self._send(room, action)
+
+    async def _send(self, room: str, action: str) -> None:
+        seconds = random.choice(self.profile.timer_durations) if action == "set" else 0
+        numbers = [messages.NumberAnalysisResult(number_token=seconds, next_token="seconds")] if seconds else []
+        intent = messages.IntentAnalysisResult(
+            client_request=messages.ClientRequest(
+                id=uuid.uuid4(),
+                text=REQUEST_TEXTS[action].format(seconds=seconds),
+                room=room,
+                output_topic=f"{OUTPUT_TOPIC_PREFIX}/{room}/output",
+            ),
+            numbers=numbers,
+            nouns=["timer", "time"],
+            verbs=[],
+        )
+        self._pending[room].append((time.perf_counter(), action, seconds))
+        await self.client.publish(self.config_obj.intent_analysis_result_topic, intent.model_dump_json(), qos=1)
+        self.report.requests_sent += 1
+
+    async def _receive(self) -> None:
+        async for message in self.client.messages:
+            received = time.perf_counter()
+            room = message.topic.value.split("/")[1]
+            response = json.loads(message.payload)
+            if response.get("alert") is not None:
+                self._record_trigger(room, received)
+            elif self._pending.get(room):
+                sent, action, seconds = self._pending[room].popleft()
+                self.report.responses += 1
+                self.report.response_latency.append(received - sent)
+                if action == "set":
+                    self._expected_triggers[room][seconds] = received + seconds
+                    self._last_set[room] = seconds
+                elif action == "delete_last" and room in self._last_set:
+                    self._expected_triggers[room].pop(self._last_set.pop(room), None)
+            else:
+                self.logger.warning("Unexpected response for room %s: %s", room, response.get("text"))
+
+    def _record_trigger(self, room: str, received: float) -> None:
+        self.report.triggers += 1
+        expected = self._expected_triggers.get(room)
+        if expected:
+            seconds = min(expected, key=expected.__getitem__)
+            self.report.trigger_lateness.append(max(received - expected.pop(seconds), 0.0))
+
+    async def _monitor_loop_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.lag_interval)
+            self.report.loop_lag.append(loop.time() - start - self.lag_interval)
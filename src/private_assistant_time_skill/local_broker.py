@@ -0,0 +1,235 @@
+import asyncio
+import base64
+import collections
+import contextlib
+import itertools
+import json
+from collections.abc import AsyncIterator
+from types import TracebackType
+from typing import Self
+
+import aiomqtt
+
+
+class LocalBroker:
+    """In-process stand-in for an MQTT broker, used by benchmarks and load tests that must run offline.
+
+    Messages are delivered to every subscribed ``LocalClient`` through an unbounded queue on the same
+    event loop. There is no persistence, retained-message or QoS handling.
+    """
+
+    def __init__(self) -> None:
+        self.clients: list[LocalClient] = []
+        self.published = 0
+        self._mids = itertools.count(1)
+
+    def client(self) -> "LocalClient":
+        client = LocalClient(self)
+        self.clients.append(client)
+        return client
+
+    def route(self, topic: str, payload: bytes, qos: int, retain: bool) -> None:
+        self.published += 1
+        message = aiomqtt.Message(topic, payload, qos, retain, next(self._mids), None)
+        for client in self.clients:
+            if any(message.topic.matches(subscription) for subscription in client.subscriptions):
+                client.queue.put_nowait(message)
+
+
+class LocalClient:
+    """Implements the subset of ``aiomqtt.Client`` the skill and ``BaseSkill`` rely on."""
+
+    def __init__(self, broker: LocalBroker) -> None:
+        self.broker = broker
+        self.subscriptions: set[str] = set()
+        self.queue: asyncio.Queue[aiomqtt.Message] = asyncio.Queue()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.subscriptions.clear()
+
+    async def subscribe(self, topic: str, qos: int = 0) -> None:
+        del qos
+        self.subscriptions.add(topic)
+
+    async def unsubscribe(self, topic: str) -> None:
+        self.subscriptions.discard(topic)
+
+    async def publish(self, topic: str, payload: str | bytes | None = None, qos: int = 0, retain: bool = False) -> None:
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        self.broker.route(topic, payload or b"", qos, retain)
+
+    @property
+    def messages(self) -> AsyncIterator[aiomqtt.Message]:
+        return self._iterate_messages()
+
+    async def _iterate_messages(self) -> AsyncIterator[aiomqtt.Message]:
+        while True:
+            yield await self.queue.get()
+
+
+def _encode_frame(frame: dict[str, object]) -> bytes:
+    return json.dumps(frame, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+class SocketBroker:
+    """Stand-in for an MQTT broker on a local TCP port, for tests that run skills in several processes.
+
+    Each connection is served by a ``LocalClient`` of an inner ``LocalBroker``, so routing works as it does
+    in-process, and ``client`` adds participants from the broker's own process. Frames are JSON lines:
+    ``subscribe`` and ``unsubscribe`` carry a topic and are acknowledged, ``publish`` carries a topic, the
+    base64 encoded payload, qos and retain, and the broker forwards matching publishes as ``message``.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.broker = LocalBroker()
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    def client(self) -> LocalClient:
+        return self.broker.client()
+
+    async def __aenter__(self) -> Self:
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in self._writers:
+                writer.close()
+            await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        client = self.broker.client()
+        self._writers.add(writer)
+        forward = asyncio.create_task(self._forward(client, writer))
+        try:
+            while line := await reader.readline():
+                frame = json.loads(line)
+                if frame["op"] == "publish":
+                    payload = base64.b64decode(frame["payload"])
+                    self.broker.route(frame["topic"], payload, frame["qos"], frame["retain"])
+                    continue
+                if frame["op"] == "subscribe":
+                    await client.subscribe(frame["topic"])
+                else:
+                    await client.unsubscribe(frame["topic"])
+                writer.write(_encode_frame({"op": "ack"}))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            forward.cancel()
+            self.broker.clients.remove(client)
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _forward(self, client: LocalClient, writer: asyncio.StreamWriter) -> None:
+        while True:
+            message = await client.queue.get()
+            payload = message.payload if isinstance(message.payload, bytes) else str(message.payload).encode("utf-8")
+            frame = {
+                "op": "message",
+                "topic": message.topic.value,
+                "payload": base64.b64encode(payload).decode("ascii"),
+                "qos": message.qos,
+                "retain": message.retain,
+                "mid": message.mid,
+            }
+            writer.write(_encode_frame(frame))
+            await writer.drain()
+
+
+class SocketClient:
+    """Implements the same subset of ``aiomqtt.Client`` as ``LocalClient``, over a ``SocketBroker`` connection.
+
+    Subscribing waits for the broker's acknowledgement, so a message published afterwards is delivered.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self.queue: asyncio.Queue[aiomqtt.Message] = asyncio.Queue()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._receiver: asyncio.Task[None] | None = None
+        self._acks: collections.deque[asyncio.Future[None]] = collections.deque()
+
+    async def __aenter__(self) -> Self:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self._receiver = asyncio.create_task(self._receive(self._reader))
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._receiver is not None:
+            self._receiver.cancel()
+        if self._writer is not None:
+            self._writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self._writer.wait_closed()
+
+    async def _send(self, frame: dict[str, object]) -> None:
+        if self._writer is None:
+            raise aiomqtt.MqttError("Not connected to the socket broker.")
+        self._writer.write(_encode_frame(frame))
+        await self._writer.drain()
+
+    async def _acknowledged(self, frame: dict[str, object]) -> None:
+        ack = asyncio.get_running_loop().create_future()
+        self._acks.append(ack)
+        await self._send(frame)
+        await ack
+
+    async def subscribe(self, topic: str, qos: int = 0) -> None:
+        del qos
+        await self._acknowledged({"op": "subscribe", "topic": topic})
+
+    async def unsubscribe(self, topic: str) -> None:
+        await self._acknowledged({"op": "unsubscribe", "topic": topic})
+
+    async def publish(self, topic: str, payload: str | bytes | None = None, qos: int = 0, retain: bool = False) -> None:
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        encoded = base64.b64encode(payload or b"").decode("ascii")
+        await self._send({"op": "publish", "topic": topic, "payload": encoded, "qos": qos, "retain": retain})
+
+    async def _receive(self, reader: asyncio.StreamReader) -> None:
+        while line := await reader.readline():
+            frame = json.loads(line)
+            if frame["op"] == "ack":
+                self._acks.popleft().set_result(None)
+                continue
+            payload = base64.b64decode(frame["payload"])
+            self.queue.put_nowait(
+                aiomqtt.Message(frame["topic"], payload, frame["qos"], frame["retain"], frame["mid"], None)
+            )
+
+    @property
+    def messages(self) -> AsyncIterator[aiomqtt.Message]:
+        return self._iterate_messages()
+
+    async def _iterate_messages(self) -> AsyncIterator[aiomqtt.Message]:
+        while True:
+            yield await self.queue.get()
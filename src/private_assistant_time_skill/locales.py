@@ -0,0 +1,119 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Locale:
+    """Language data for spoken times and durations.
+
+    Clock patterns receive ``hour``, ``minute`` and ``period`` (empty for 24 hour locales), the date pattern
+    receives ``weekday``, ``month``, ``day`` and the formatted ``time``. Schedule patterns receive ``time``
+    and ``days``, see ``TimeFormatter.describe_schedule`` for their keys. Templates are read from
+    ``template_dir`` below the package templates, the root directory holding the English ones.
+    """
+
+    code: str
+    # Singular and plural form per unit
+    units: Mapping[str, tuple[str, str]]
+    conjunction: str
+    full_hour: str
+    past_hour: str
+    date_format: str
+    weekdays: tuple[str, ...]
+    months: tuple[str, ...]
+    schedule_phrases: Mapping[str, str]
+    twelve_hour: bool = False
+    periods: tuple[str, str] = ("", "")
+    # Counts that take the singular form
+    singular_values: frozenset[int] = field(default_factory=lambda: frozenset({1}))
+    template_dir: str = ""
+
+    def unit(self, value: int, unit: str) -> str:
+        singular, plural = self.units[unit]
+        return f"{value} {singular if value in self.singular_values else plural}"
+
+
+_ENGLISH_UNITS = {"hour": ("hour", "hours"), "minute": ("minute", "minutes"), "second": ("second", "seconds")}
+_ENGLISH_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_ENGLISH_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+_ENGLISH_SCHEDULE_PHRASES = {
+    "once": "{time}",
+    "on": "{time} on {days}",
+    "daily": "{time} every day",
+    "every": "{time} every {days}",
+    "weekdays": "{time} on weekdays",
+    "weekends": "{time} on weekends",
+}
+
+LOCALES = {
+    "en": Locale(
+        code="en",
+        units=_ENGLISH_UNITS,
+        conjunction=" and ",
+        full_hour="{hour} o'clock",
+        past_hour="{minute} past {hour}",
+        date_format="{weekday}, {month} {day:02d} at {time}",
+        weekdays=_ENGLISH_WEEKDAYS,
+        months=_ENGLISH_MONTHS,
+        schedule_phrases=_ENGLISH_SCHEDULE_PHRASES,
+    ),
+    "en-US": Locale(
+        code="en-US",
+        units=_ENGLISH_UNITS,
+        conjunction=" and ",
+        full_hour="{hour} o'clock {period}",
+        past_hour="{minute} past {hour} {period}",
+        date_format="{weekday}, {month} {day} at {time}",
+        weekdays=_ENGLISH_WEEKDAYS,
+        months=_ENGLISH_MONTHS,
+        schedule_phrases=_ENGLISH_SCHEDULE_PHRASES,
+        twelve_hour=True,
+        periods=("a.m.", "p.m."),
+    ),
+    "de": Locale(
+        code="de",
+        units={"hour": ("Stunde", "Stunden"), "minute": ("Minute", "Minuten"), "second": ("Sekunde", "Sekunden")},
+        conjunction=" und ",
+        full_hour="{hour} Uhr",
+        past_hour="{hour} Uhr {minute}",
+        date_format="{weekday}, {day}. {month} um {time}",
+        weekdays=("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"),
+        months=(
+            "Januar",
+            "Februar",
+            "März",
+            "April",
+            "Mai",
+            "Juni",
+            "Juli",
+            "August",
+            "September",
+            "Oktober",
+            "November",
+            "Dezember",
+        ),
+        schedule_phrases={
+            "once": "{time}",
+            "on": "am {days} um {time}",
+            "daily": "täglich um {time}",
+            "every": "jeden {days} um {time}",
+            "weekdays": "werktags um {time}",
+            "weekends": "am Wochenende um {time}",
+        },
+        template_dir="de/",
+    ),
+}
+DEFAULT_LOCALE = "en"
@@ -1,46 +1,221 @@
 import asyncio
+import json
+import logging
 import pathlib
+import time
 from typing import Annotated
 
-import jinja2
+import aiomqtt
+import click
 import typer
-from private_assistant_commons import mqtt_connection_handler, skill_config, skill_logger
+import typer.core
+from private_assistant_commons import skill_config, skill_logger
 
-from private_assistant_time_skill import time_skill
+from private_assistant_time_skill import (
+    capture,
+    clock,
+    config,
+    load_generator,
+    local_broker,
+    service,
+    time_skill,
+)
 
-app = typer.Typer()
 
+class _DefaultCommandGroup(typer.core.TyperGroup):
+    """Run ``main`` when the arguments name no command, so ``private-assistant-time-skill CONFIG_PATH``
+    keeps working next to the other commands.
+    """
 
-@app.command()
-def main(config_path: Annotated[pathlib.Path, typer.Argument(envvar="PRIVATE_ASSISTANT_CONFIG_PATH")]) -> None:
-    asyncio.run(start_skill(config_path))
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        group_options = {option for param in self.get_params(ctx) for option in param.opts}
+        if not args or (args[0] not in self.commands and args[0].partition("=")[0] not in group_options):
+            args = ["main", *args]
+        return super().parse_args(ctx, args)
 
 
-async def start_skill(
-    config_path: pathlib.Path,
-):
-    # Load configuration
-    config_obj = skill_config.load_config(config_path, skill_config.SkillConfig)
+app = typer.Typer(cls=_DefaultCommandGroup)
 
-    # Set up logger
-    logger = skill_logger.SkillLogger.get_logger("Private Assistant TimeSkill")
 
-    # Set up Jinja2 template environment
-    template_env = jinja2.Environment(
-        loader=jinja2.PackageLoader(
-            "private_assistant_time_skill",
-            "templates",
-        )
+class _StopEmbeddedSkillError(Exception):
+    pass
+
+
+@app.command()
+def main(  # noqa: PLR0913, PLR0917
+    config_path: Annotated[pathlib.Path, typer.Argument(envvar=service.CONFIG_PATH_ENV)],
+    profile_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--profile",
+            envvar=service.PROFILE_ENV,
+            help="Sample request and trigger stage timings into this folded-stack file.",
+        ),
+    ] = None,
+    profile_rate: Annotated[
+        float,
+        typer.Option(envvar=service.PROFILE_RATE_ENV, min=0.0, max=1.0, help="Fraction of calls to sample."),
+    ] = service.DEFAULT_PROFILE_RATE,
+    shard_id: Annotated[
+        str | None,
+        typer.Option(
+            envvar=service.SHARD_ID_ENV,
+            help="Run as this instance of a sharded deployment, overriding shard_instance_id from the config.",
+        ),
+    ] = None,
+    capture_path: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--capture",
+            envvar=service.CAPTURE_ENV,
+            help="Append every intent analysis result and outgoing message to this JSONL capture file.",
+        ),
+    ] = None,
+    compiled_templates: Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            envvar=service.COMPILED_TEMPLATES_ENV,
+            help="Load the templates from modules written by compile-templates instead of parsing them.",
+        ),
+    ] = None,
+) -> None:
+    asyncio.run(
+        service.start_skill(config_path, profile_path, profile_rate, shard_id, capture_path, compiled_templates)
     )
 
-    # Start the skill using the async MQTT connection handler
-    await mqtt_connection_handler.mqtt_connection_handler(
-        time_skill.TimeSkill,
-        config_obj,
-        retry_interval=5,
-        logger=logger,
-        template_env=template_env,
+
+@app.command()
+def compile_templates(
+    target: Annotated[pathlib.Path, typer.Argument(help="Folder to write the compiled template modules to.")],
+) -> None:
+    """Precompile the templates to Python modules, to be loaded with --compiled-templates."""
+    names = service.compile_templates(target)
+    typer.echo(f"Compiled {len(names)} templates into {target}")
+
+
+@app.command()
+def loadtest(  # noqa: PLR0913, PLR0917
+    rooms: Annotated[int, typer.Option(help="Number of simulated rooms.")] = 100,
+    duration: Annotated[float, typer.Option(help="Seconds to keep sending requests.")] = 60.0,
+    rate: Annotated[float, typer.Option(help="Requests per second per room.")] = 0.1,
+    mix: Annotated[str, typer.Option(help="Relative action weights.")] = "set=4,list=2,delete_last=1,current_time=3",
+    timer_durations: Annotated[str, typer.Option(help="Comma separated timer durations in seconds.")] = "5,30,60",
+    drain: Annotated[float, typer.Option(help="Seconds to wait for late responses and triggers.")] = 5.0,
+    config_path: Annotated[
+        pathlib.Path | None,
+        typer.Option("--config", help="Drive the skill behind this config's broker instead of an embedded one."),
+    ] = None,
+) -> None:
+    """Drive the skill with synthetic traffic and report latency, trigger lateness and loop lag."""
+    profile = load_generator.LoadProfile(
+        rooms=rooms,
+        duration=duration,
+        rate=rate,
+        mix=load_generator.parse_mix(mix),
+        timer_durations=[int(seconds) for seconds in timer_durations.split(",")],
+        drain=drain,
     )
+    report = asyncio.run(run_load_test(profile, config_path))
+    typer.echo(json.dumps(report.summary(), indent=2))
+
+
+@app.command()
+def replay(
+    capture_path: Annotated[pathlib.Path, typer.Argument(help="Capture file written by main --capture.")],
+    speed: Annotated[
+        float, typer.Option(min=0.0, help="Replay this many times faster than recorded, 0 for back to back.")
+    ] = 1.0,
+    simulated: Annotated[
+        bool,
+        typer.Option(help="Run on simulated time from the capture's start, so timers fire without waiting."),
+    ] = False,
+    drain: Annotated[float, typer.Option(help="Seconds to wait for late responses and triggers.")] = 5.0,
+    config_path: Annotated[
+        pathlib.Path | None,
+        typer.Option("--config", help="Configure the embedded skill from this file; its broker is not used."),
+    ] = None,
+) -> None:
+    """Feed a capture into an embedded skill and compare what it sends with what was recorded."""
+    started, traffic = capture.read_capture(capture_path)
+    replay_main = run_replay(traffic, speed, drain, config_path)
+    replayed = clock.run_simulated(replay_main, started) if simulated else asyncio.run(replay_main)
+    report = {
+        "recorded": capture.summarize_traffic(traffic),
+        "replayed": capture.summarize_traffic(replayed),
+        "mismatched_messages": capture.count_mismatches(traffic, replayed),
+    }
+    typer.echo(json.dumps(report, indent=2))
+
+
+async def run_load_test(
+    profile: load_generator.LoadProfile, config_path: pathlib.Path | None
+) -> load_generator.LoadReport:
+    logger = skill_logger.SkillLogger.get_logger("Private Assistant TimeSkill load test")
+
+    if config_path is not None:
+        config_obj = skill_config.load_config(config_path, config.TimeSkillConfig)
+        async with aiomqtt.Client(config_obj.mqtt_server_host, port=config_obj.mqtt_server_port) as client:
+            return await load_generator.LoadGenerator(client, config_obj, profile, logger).run()
+
+    # Embedded mode: run a skill on the local broker stand-in within the same event loop
+    config_obj = config.TimeSkillConfig()
+    broker = local_broker.LocalBroker()
+    skill_client = broker.client()
+    skill_logger_obj = skill_logger.SkillLogger.get_logger("Private Assistant TimeSkill (embedded)", logging.WARNING)
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            skill = time_skill.TimeSkill(
+                config_obj,
+                skill_client,  # type: ignore[arg-type]
+                service.create_template_env(),
+                task_group,
+                skill_logger_obj,
+            )
+            await skill.setup_mqtt_subscriptions()
+            await skill.skill_preparations()
+            task_group.create_task(skill.listen_to_messages(skill_client))  # type: ignore[arg-type]
+            generator = load_generator.LoadGenerator(broker.client(), config_obj, profile, logger)  # type: ignore[arg-type]
+            report = await generator.run()
+            # Leaving the task group through an exception cancels the embedded skill's tasks
+            raise _StopEmbeddedSkillError
+    except* _StopEmbeddedSkillError:
+        pass
+    return report
+
+
+async def run_replay(
+    traffic: list[capture.CapturedMessage], speed: float, drain: float, config_path: pathlib.Path | None
+) -> list[capture.CapturedMessage]:
+    config_obj = config.TimeSkillConfig()
+    if config_path is not None:
+        # Keep the replay away from the production timer store and shard group
+        config_obj = skill_config.load_config(config_path, config.TimeSkillConfig).model_copy(
+            update={"timer_store_path": None, "shard_instance_id": None}
+        )
+    loop = asyncio.get_running_loop()
+    broker = local_broker.LocalBroker()
+    skill_client = broker.client()
+    skill_logger_obj = skill_logger.SkillLogger.get_logger("Private Assistant TimeSkill (replay)", logging.WARNING)
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            skill = time_skill.TimeSkill(
+                config_obj,
+                skill_client,  # type: ignore[arg-type]
+                service.create_template_env(),
+                task_group,
+                skill_logger_obj,
+                wall_clock=loop.wall_time if isinstance(loop, clock.VirtualTimeEventLoop) else time.time,
+            )
+            await skill.setup_mqtt_subscriptions()
+            await skill.skill_preparations()
+            task_group.create_task(skill.listen_to_messages(skill_client))  # type: ignore[arg-type]
+            replayed = await capture.replay_traffic(
+                broker.client(), config_obj.intent_analysis_result_topic, traffic, speed, drain
+            )
+            raise _StopEmbeddedSkillError
+    except* _StopEmbeddedSkillError:
+        pass
+    return replayed
 
 
 if __name__ == "__main__":
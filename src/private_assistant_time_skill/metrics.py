@@ -0,0 +1,204 @@
+import asyncio
+import bisect
+import logging
+import statistics
+from collections.abc import Callable, Iterable
+from typing import Any
+
+# Seconds; covers sub-millisecond handling up to multi-second loop stalls
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    """Current value, either set explicitly or read from ``function`` at collection time."""
+
+    def __init__(self, function: Callable[[], float] | None = None) -> None:
+        self.function = function
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        return self.function() if self.function is not None else self._value
+
+
+class Histogram:
+    """Fixed-bucket histogram following the Prometheus model of cumulative ``le`` buckets.
+
+    Observing is a bisect and two additions, so it is cheap enough for every request and trigger.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        # One slot per bucket plus the implicit +Inf bucket
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list[tuple[float, int]]:
+        """Return ``(upper bound, observations <= bound)`` pairs ending with ``+Inf``."""
+        total = 0
+        result = []
+        for bound, count in zip((*self.buckets, float("inf")), self.bucket_counts, strict=True):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, fraction: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket it falls into."""
+        if self.count == 0:
+            return 0.0
+        rank = fraction * self.count
+        for bound, cumulative in self.cumulative_counts():
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels.items()) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+class MetricsRegistry:
+    """Named metric families with labels, rendered in the Prometheus text format or as a JSON snapshot.
+
+    Asking for an existing name and label set returns the same metric, so a registry created once per
+    process keeps counting across reconnects that recreate the skill.
+    """
+
+    def __init__(self) -> None:
+        self._families: dict[str, tuple[str, str, dict[tuple[tuple[str, str], ...], Any]]] = {}
+
+    def _get(self, kind: str, name: str, help_text: str, labels: dict[str, str], factory: Callable[[], Any]) -> Any:
+        family = self._families.setdefault(name, (kind, help_text, {}))
+        if family[0] != kind:
+            raise ValueError(f"Metric '{name}' is already registered as a {family[0]}.")
+        key = tuple(sorted(labels.items()))
+        metric = family[2].get(key)
+        if metric is None:
+            metric = family[2][key] = factory()
+        return metric
+
+    def counter(self, name: str, help_text: str, **labels: str) -> Counter:
+        counter: Counter = self._get("counter", name, help_text, labels, Counter)
+        return counter
+
+    def gauge(self, name: str, help_text: str, function: Callable[[], float] | None = None, **labels: str) -> Gauge:
+        gauge: Gauge = self._get("gauge", name, help_text, labels, Gauge)
+        if function is not None:
+            gauge.function = function
+        return gauge
+
+    def histogram(
+        self, name: str, help_text: str, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS, **labels: str
+    ) -> Histogram:
+        histogram: Histogram = self._get("histogram", name, help_text, labels, lambda: Histogram(buckets))
+        return histogram
+
+    def render_prometheus(self) -> str:
+        lines = []
+        for name, (kind, help_text, metrics) in self._families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, metric in metrics.items():
+                labels = dict(key)
+                if isinstance(metric, Histogram):
+                    for bound, cumulative in metric.cumulative_counts():
+                        bucket_labels = _format_labels({**labels, "le": _format_bound(bound)})
+                        lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {metric.sum}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {metric.count}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {metric.value}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """Summarise every metric for the periodic MQTT stats message."""
+        result: dict[str, list[dict[str, Any]]] = {}
+        for name, (_, _, metrics) in self._families.items():
+            entries = result[name] = []
+            for key, metric in metrics.items():
+                entry: dict[str, Any] = dict(key)
+                if isinstance(metric, Histogram):
+                    entry.update(
+                        count=metric.count, sum=metric.sum, p50=metric.quantile(0.5), p99=metric.quantile(0.99)
+                    )
+                else:
+                    entry["value"] = metric.value
+                entries.append(entry)
+        return result
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Return the median, 99th percentile and maximum of latency samples in seconds, as milliseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1e3, 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e3, 3),
+        "max_ms": round(ordered[-1] * 1e3, 3),
+    }
+
+
+async def serve_prometheus(registry: MetricsRegistry, host: str, port: int, logger: logging.Logger) -> None:
+    """Serve ``GET /metrics`` in the Prometheus text format until cancelled."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            # Skip headers, the request body is never needed
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            method, path, *_ = [*request_line.split(), b"", b""]
+            if method == b"GET" and path in (b"/metrics", b"/"):
+                status, body = "200 OK", registry.render_prometheus().encode("utf-8")
+            else:
+                status, body = "404 Not Found", b"Not Found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        except ConnectionError as e:
+            logger.debug("Metrics client disconnected: %s", e)
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    logger.info("Serving metrics on http://%s:%d/metrics", host, port)
+    async with server:
+        await server.serve_forever()
+
+
+async def monitor_loop_lag(histogram: Histogram, interval: float = 0.5) -> None:
+    """Observe how much later than requested the event loop resumes a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        histogram.observe(loop.time() - start - interval)
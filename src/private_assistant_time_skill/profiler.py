@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import pathlib
+import random
+import time
+from collections import defaultdict
+
+
+class ProfileSample:
+    """Stage timings of one sampled invocation; ``mark`` closes the stage that ran since the previous mark."""
+
+    __slots__ = ("_last", "profiler", "stages")
+
+    def __init__(self, profiler: "StageProfiler") -> None:
+        self.profiler = profiler
+        self.stages: list[tuple[str, float]] = []
+        self._last = time.perf_counter()
+
+    def mark(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last))
+        self._last = now
+
+    def finish(self, stack: str) -> None:
+        """Hand the stages to the profiler below ``stack``, a ``;`` separated frame path."""
+        self.profiler.record(self, stack)
+
+
+class StageProfiler:
+    """Sample a fraction of hot-path invocations and accumulate their stage timings as folded stacks.
+
+    The output file uses the folded format understood by flamegraph.pl and speedscope: one
+    ``frame;frame;stage microseconds`` line per stack, holding totals since the profiler started.
+    Unsampled invocations cost a single ``random()`` call, and the totals are keyed by stack rather
+    than by invocation, so memory stays constant at any sampling rate.
+    """
+
+    def __init__(
+        self, output_path: pathlib.Path, sample_rate: float, logger: logging.Logger, flush_interval: float = 10.0
+    ) -> None:
+        self.output_path = output_path
+        self.sample_rate = sample_rate
+        self.logger = logger
+        self.flush_interval = flush_interval
+        self.samples = 0
+        self._totals: defaultdict[str, float] = defaultdict(float)
+
+    def sample(self) -> ProfileSample | None:
+        """Start a sample for this invocation, or return None if it is not selected."""
+        if random.random() >= self.sample_rate:
+            return None
+        return ProfileSample(self)
+
+    def record(self, sample: ProfileSample, stack: str) -> None:
+        self.samples += 1
+        for stage, duration in sample.stages:
+            self._totals[f"{stack};{stage}"] += duration
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {round(total * 1e6)}\n" for stack, total in sorted(self._totals.items()))
+
+    def write(self, folded: str) -> None:
+        # Replace atomically so a reader never sees a partially written profile
+        temporary_path = self.output_path.with_name(f".{self.output_path.name}.tmp")
+        temporary_path.write_text(folded)
+        temporary_path.replace(self.output_path)
+
+    async def run(self) -> None:
+        """Rewrite the output file periodically until cancelled, then once more."""
+        self.logger.info("Profiling %.2f%% of requests into %s", self.sample_rate * 100, self.output_path)
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                # Render on the loop, the totals keep changing while the thread writes
+                await asyncio.to_thread(self.write, self.folded())
+                self.logger.debug("Wrote profile of %d samples to %s", self.samples, self.output_path)
+        finally:
+            self.write(self.folded())
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from private_assistant_time_skill.metrics import Counter, Histogram
+
+DEFAULT_MAX_SIZE = 1000
+DEFAULT_WORKERS = 2
+DEFAULT_BATCH_SIZE = 32
+
+
+class PublishQueue:
+    """Bounded outbound queue drained by a fixed number of publisher workers.
+
+    Each topic is assigned to one worker, so the messages of a client are published in the order they were
+    queued while different clients publish concurrently. A worker takes up to ``batch_size`` messages per
+    wake-up. ``put`` waits for space, which slows down the caller to the publish rate. ``offer`` is for
+    callers that cannot wait: it drops the message when the queue is full and counts it in ``shed``.
+    ``publish`` is expected to handle its own errors; ``latency`` observes enqueue to published.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        publish: Callable[[str, str], Awaitable[None]],
+        logger: logging.Logger,
+        *,
+        max_size: int = DEFAULT_MAX_SIZE,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        latency: Histogram | None = None,
+        shed: Counter | None = None,
+    ) -> None:
+        self.publish = publish
+        self.logger = logger
+        self.batch_size = batch_size
+        self.latency = latency if latency is not None else Histogram()
+        self.shed = shed if shed is not None else Counter()
+        # The bound is split over the workers, one queue each
+        self._queues: list[asyncio.Queue[tuple[str, str, float]]] = [
+            asyncio.Queue(maxsize=max(max_size // workers, 1)) for _ in range(workers)
+        ]
+
+    def __len__(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
+
+    def _queue_for(self, topic: str) -> asyncio.Queue[tuple[str, str, float]]:
+        return self._queues[hash(topic) % len(self._queues)]
+
+    async def put(self, topic: str, payload: str) -> None:
+        await self._queue_for(topic).put((topic, payload, time.perf_counter()))
+
+    def offer(self, topic: str, payload: str) -> bool:
+        try:
+            self._queue_for(topic).put_nowait((topic, payload, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.shed.inc()
+            self.logger.warning("Publish queue full, dropped message to topic '%s'.", topic)
+            return False
+        return True
+
+    async def join(self) -> None:
+        """Wait until every queued message has been published."""
+        for queue in self._queues:
+            await queue.join()
+
+    async def _work(self, queue: asyncio.Queue[tuple[str, str, float]]) -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            for topic, payload, queued_at in batch:
+                await self.publish(topic, payload)
+                self.latency.observe(time.perf_counter() - queued_at)
+                queue.task_done()
+
+    async def run(self) -> None:
+        """Publish queued messages until cancelled. Meant to be started once via ``BaseSkill.add_task``."""
+        await asyncio.gather(*(self._work(queue) for queue in self._queues))
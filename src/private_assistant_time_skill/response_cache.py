@@ -0,0 +1,30 @@
+from collections.abc import Hashable
+
+# Entries are cheap to re-render, so a full cache is simply emptied instead of tracking recency
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ResponseCache:
+    """Rendered answers keyed by action and the template inputs that determine them.
+
+    A key must capture everything the template reads, so equal keys always render equal answers.
+    Entries that go stale with the clock are dropped per action through ``invalidate``.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: dict[tuple[Hashable, Hashable], str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, action: Hashable, key: Hashable) -> str | None:
+        return self._entries.get((action, key))
+
+    def put(self, action: Hashable, key: Hashable, answer: str) -> None:
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+        self._entries[action, key] = answer
+
+    def invalidate(self, action: Hashable) -> None:
+        self._entries = {entry: answer for entry, answer in self._entries.items() if entry[0] != action}
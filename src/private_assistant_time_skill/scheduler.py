@@ -0,0 +1,184 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Any
+
+from private_assistant_time_skill.metrics import Histogram
+
+# Heap entries are mutable lists so a cancel can blank out the key in place (lazy deletion).
+_DEADLINE, _SEQUENCE, _KEY = 0, 1, 2
+
+# Lateness histogram buckets in seconds; negative values (compensated early fires) land in the first one
+LATENESS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+# Upper bound and smoothing factor for the drift compensation wake-up lead
+MAX_WAKEUP_LEAD = 0.25
+WAKEUP_LEAD_SMOOTHING = 0.2
+
+
+class TimerScheduler:
+    """Drive any number of timers from a single task using a min-heap keyed by deadline.
+
+    Deadlines are expressed on the event loop clock, which is monotonic. The run loop sleeps until the
+    earliest deadline and is woken early whenever an insert moves the head of the heap forward.
+    Cancellation is lazy: the heap entry is marked dead and discarded once it reaches the top.
+
+    Every fire records its lateness (fire time minus deadline) in ``lateness``, which may be passed in to
+    share it with a metrics registry. With ``compensate_drift``
+    the scheduler tracks how late the loop wakes it up and arms its wake-up that much earlier, firing
+    entries due within that lead, so an overloaded loop no longer delays every timer by its lag.
+    """
+
+    def __init__(
+        self,
+        on_fire: Callable[[Any], None],
+        logger: logging.Logger,
+        compensate_drift: bool = False,
+        lateness_warning: float = 1.0,
+        lateness: Histogram | None = None,
+    ) -> None:
+        self.on_fire = on_fire
+        self.logger = logger
+        self.compensate_drift = compensate_drift
+        self.lateness_warning = lateness_warning
+        self.lateness = lateness if lateness is not None else Histogram(LATENESS_BUCKETS)
+        self.wakeup_lead = 0.0
+        self._timer_expired = False
+        self._heap: list[list] = []
+        self._entries: dict[Hashable, list] = {}
+        self._counter = itertools.count()
+        self._dead_entries = 0
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @staticmethod
+    def now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def schedule(self, key: Hashable, delay: float) -> float:
+        """Schedule ``key`` to fire after ``delay`` seconds, replacing any pending entry with the same key."""
+        return self._push(key, self.now() + delay)
+
+    def postpone(self, key: Hashable, delay: float) -> float | None:
+        """Move a pending entry's deadline ``delay`` seconds later, returning the new deadline or None if
+        the key is not scheduled. The old entry is cancelled lazily like any replaced one.
+        """
+        deadline = self.deadline(key)
+        if deadline is None:
+            return None
+        return self._push(key, deadline + delay)
+
+    def _push(self, key: Hashable, deadline: float) -> float:
+        self.cancel(key)
+        entry = [deadline, next(self._counter), key]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wakeup.set()
+        return deadline
+
+    def schedule_many(self, delays: Iterable[tuple[Hashable, float]]) -> None:
+        """Bulk variant of ``schedule`` that rebuilds the heap once instead of pushing per entry."""
+        now = self.now()
+        for key, delay in delays:
+            self.cancel(key)
+            entry = [now + delay, next(self._counter), key]
+            self._entries[key] = entry
+            self._heap.append(entry)
+        heapq.heapify(self._heap)
+        self._wakeup.set()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel a pending entry. Returns False if the key was not scheduled."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        entry[_KEY] = None
+        self._dead_entries += 1
+        # Rebuild once dead entries dominate so mass cancellation cannot grow the heap unbounded.
+        if self._dead_entries > len(self._entries):
+            self._heap = [entry for entry in self._heap if entry[_KEY] is not None]
+            heapq.heapify(self._heap)
+            self._dead_entries = 0
+        return True
+
+    def deadline(self, key: Hashable) -> float | None:
+        entry = self._entries.get(key)
+        return entry[_DEADLINE] if entry is not None else None
+
+    def time_left(self, key: Hashable) -> float | None:
+        deadline = self.deadline(key)
+        return deadline - self.now() if deadline is not None else None
+
+    def items(self) -> Iterator[tuple[Hashable, float]]:
+        """Iterate over pending keys and their deadlines in insertion order."""
+        for key, entry in self._entries.items():
+            yield key, entry[_DEADLINE]
+
+    def _pop_due(self, horizon: float) -> list[tuple[Hashable, float]]:
+        due: list[tuple[Hashable, float]] = []
+        while self._heap and self._heap[0][_DEADLINE] <= horizon:
+            entry = heapq.heappop(self._heap)
+            key = entry[_KEY]
+            if key is None:
+                self._dead_entries -= 1
+                continue
+            del self._entries[key]
+            due.append((key, entry[_DEADLINE]))
+        return due
+
+    def _fire(self, key: Hashable, deadline: float, now: float) -> None:
+        lateness = now - deadline
+        self.lateness.observe(lateness)
+        if lateness > self.lateness_warning:
+            self.logger.warning("Timer '%s' fired %.3fs late, the event loop may be saturated.", key, lateness)
+        try:
+            self.on_fire(key)
+        except Exception as e:
+            self.logger.error("Failed to fire timer '%s': %s", key, e, exc_info=True)
+
+    def _expire(self) -> None:
+        self._timer_expired = True
+        self._wakeup.set()
+
+    def _drop_dead_head(self) -> None:
+        while self._heap and self._heap[0][_KEY] is None:
+            heapq.heappop(self._heap)
+            self._dead_entries -= 1
+
+    async def run(self) -> None:
+        """Fire due timers until cancelled. Meant to be started once via ``BaseSkill.add_task``."""
+        loop = asyncio.get_running_loop()
+        # Lead the current wake-up was armed with; the smoothed lead may shrink after waking
+        armed_lead = 0.0
+        while True:
+            self._wakeup.clear()
+            now = loop.time()
+            for key, deadline in self._pop_due(now + max(self.wakeup_lead, armed_lead)):
+                self._fire(key, deadline, now)
+
+            self._drop_dead_head()
+            handle = None
+            armed_at = 0.0
+            if self._heap:
+                armed_lead = self.wakeup_lead
+                armed_at = self._heap[0][_DEADLINE] - armed_lead
+                self._timer_expired = False
+                handle = loop.call_at(armed_at, self._expire)
+            try:
+                await self._wakeup.wait()
+            finally:
+                if handle is not None:
+                    handle.cancel()
+            # Only wake-ups by the armed timer say something about loop lag, inserts wake us at arbitrary times
+            if self.compensate_drift and handle is not None and self._timer_expired:
+                observed_lag = max(loop.time() - armed_at, 0.0)
+                self.wakeup_lead = min(
+                    self.wakeup_lead + WAKEUP_LEAD_SMOOTHING * (observed_lag - self.wakeup_lead), MAX_WAKEUP_LEAD
+                )
@@ -0,0 +1,104 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, tzinfo
+
+from private_assistant_time_skill.action_matcher import tokenize
+
+_DAY_HOURS = 24
+_HALF_DAY_HOURS = 12
+_HOUR_MINUTES = 60
+WORKING_DAYS = frozenset(range(5))
+WEEKEND = frozenset({5, 6})
+
+# Weekday names in English, indexed like ``date.weekday``; the plural form makes a schedule repeat
+_DAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_DAY_WORDS: dict[str, tuple[frozenset[int], bool]] = {
+    **{name: (frozenset({day}), False) for day, name in enumerate(_DAY_NAMES)},
+    **{f"{name}s": (frozenset({day}), True) for day, name in enumerate(_DAY_NAMES)},
+    "weekday": (WORKING_DAYS, False),
+    "weekdays": (WORKING_DAYS, True),
+    "weekend": (WEEKEND, False),
+    "weekends": (WEEKEND, True),
+}
+_REPEAT_WORDS = frozenset({"every", "daily"})
+# Matches times of day like "at 6:30", "for 7 pm", "at 6.30 a.m." and "at 7 o'clock", but not durations
+# like "for 10 minutes"
+_TIME_PATTERN = re.compile(
+    r"\b(?:at|for)\s+(\d{1,2})(?!\d)(?:[:.](\d{2}))?(?:\s*o'?clock)?(?:\s*([ap])\.?m\b\.?)?"
+    r"(?!\s*(?:hours?|minutes?|seconds?)\b)",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Schedule:
+    """A wall-clock time of day, limited to some ``weekdays`` (Monday is 0) unless that is empty.
+
+    A schedule that does not ``repeat`` fires at its next occurrence only.
+    """
+
+    hour: int
+    minute: int
+    weekdays: frozenset[int] = frozenset()
+    repeat: bool = False
+
+    def next_fire(self, after: float, zone: tzinfo | None) -> float:
+        """Return the epoch second of the first occurrence after ``after``, in ``zone`` or the host's zone.
+
+        The occurrence is derived from the calendar each time, so a DST change needs no special casing:
+        the wall time stays put and the zone rules map it to the right second. A wall time skipped by
+        a spring-forward change fires at the pre-transition offset, one repeated in the autumn fires
+        on its first pass.
+        """
+        today = datetime.fromtimestamp(after, zone).date()
+        at = time(self.hour, self.minute)
+        # One day more than a week, the first candidate may already have passed today
+        for days in range(8):
+            day = today + timedelta(days=days)
+            if self.weekdays and day.weekday() not in self.weekdays:
+                continue
+            timestamp = datetime.combine(day, at, zone).timestamp()
+            if timestamp > after:
+                return timestamp
+        raise ValueError(f"{self} has no occurrence within a week.")
+
+    def to_spec(self) -> str:
+        """Encode as ``HH:MM/weekday digits/repeat flag``, e.g. ``07:00/01234/1``, for the timer store."""
+        weekdays = "".join(str(day) for day in sorted(self.weekdays))
+        return f"{self.hour:02d}:{self.minute:02d}/{weekdays}/{int(self.repeat)}"
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "Schedule":
+        clock, weekdays, repeat = spec.split("/")
+        hour, minute = clock.split(":")
+        return cls(int(hour), int(minute), frozenset(int(day) for day in weekdays), repeat == "1")
+
+
+def parse_schedule(text: str) -> Schedule | None:
+    """Read a schedule such as "wake me at 6:30" or "every weekday at 7 pm" from English request text.
+
+    Returns None without a time of day or with one that does not exist.
+    """
+    match = _TIME_PATTERN.search(text)
+    if match is None:
+        return None
+    hour, minute = int(match[1]), int(match[2] or 0)
+    period = (match[3] or "").lower()
+    if period:
+        if not 1 <= hour <= _HALF_DAY_HOURS:
+            return None
+        # 12 a.m. is midnight and 12 p.m. noon
+        hour = hour % _HALF_DAY_HOURS + (_HALF_DAY_HOURS if period == "p" else 0)
+    if hour >= _DAY_HOURS or minute >= _HOUR_MINUTES:
+        return None
+
+    weekdays: frozenset[int] = frozenset()
+    repeat = False
+    for token in tokenize(text):
+        if token in _REPEAT_WORDS:
+            repeat = True
+        elif token in _DAY_WORDS:
+            days, plural = _DAY_WORDS[token]
+            weekdays |= days
+            repeat = repeat or plural
+    return Schedule(hour, minute, weekdays, repeat)
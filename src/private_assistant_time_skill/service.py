@@ -0,0 +1,145 @@
+"""Start the skill as a long-running service with as little work as possible before the first request.
+
+``main`` is the typer CLI, and typer imports rich for its help output and tracebacks, which a service never
+shows. The ``private-assistant-time-skill-service`` entry point takes the config path as its only argument
+and reads every option from the environment variables ``main`` accepts, without importing typer.
+"""
+
+import asyncio
+import compileall
+import os
+import pathlib
+import sys
+
+import jinja2
+from private_assistant_commons import mqtt_connection_handler, skill_config, skill_logger
+
+from private_assistant_time_skill import capture, config, metrics, profiler, time_skill
+
+CONFIG_PATH_ENV = "PRIVATE_ASSISTANT_CONFIG_PATH"
+PROFILE_ENV = "PRIVATE_ASSISTANT_TIME_SKILL_PROFILE"
+PROFILE_RATE_ENV = "PRIVATE_ASSISTANT_TIME_SKILL_PROFILE_RATE"
+SHARD_ID_ENV = "PRIVATE_ASSISTANT_TIME_SKILL_SHARD_ID"
+CAPTURE_ENV = "PRIVATE_ASSISTANT_TIME_SKILL_CAPTURE"
+COMPILED_TEMPLATES_ENV = "PRIVATE_ASSISTANT_TIME_SKILL_COMPILED_TEMPLATES"
+DEFAULT_PROFILE_RATE = 0.01
+
+
+def create_template_env(compiled_templates: pathlib.Path | None = None) -> jinja2.Environment:
+    """Load templates from the package, or from the modules ``compile_templates`` wrote to ``compiled_templates``.
+
+    Compiled templates skip lexing, parsing and code generation when the skill loads them. They do not
+    follow later edits of the ``.j2`` files, so they are only built along with an installed package.
+    """
+    if compiled_templates is not None:
+        return jinja2.Environment(loader=jinja2.ModuleLoader(compiled_templates))
+    return jinja2.Environment(
+        loader=jinja2.PackageLoader(
+            "private_assistant_time_skill",
+            "templates",
+        )
+    )
+
+
+def compile_templates(target: pathlib.Path) -> list[str]:
+    """Compile every package template to a Python module in ``target`` and byte-compile the modules.
+
+    Returns the names of the compiled templates. A template with a syntax error fails the build rather
+    than going missing at startup.
+    """
+    template_env = create_template_env()
+    names = template_env.list_templates(extensions=["j2"])
+    template_env.compile_templates(target, extensions=["j2"], zip=None, ignore_errors=False)
+    # The service may not be allowed to write bytecode caches next to the modules
+    compileall.compile_dir(target, quiet=1)
+    return names
+
+
+async def start_skill(  # noqa: PLR0913, PLR0917
+    config_path: pathlib.Path,
+    profile_path: pathlib.Path | None = None,
+    profile_rate: float = DEFAULT_PROFILE_RATE,
+    shard_id: str | None = None,
+    capture_path: pathlib.Path | None = None,
+    compiled_templates: pathlib.Path | None = None,
+):
+    # Load configuration
+    config_obj = skill_config.load_config(config_path, config.TimeSkillConfig)
+    if shard_id is not None:
+        config_obj.shard_instance_id = shard_id
+
+    # Set up logger
+    logger = skill_logger.SkillLogger.get_logger("Private Assistant TimeSkill")
+
+    # Set up Jinja2 template environment
+    template_env = create_template_env(compiled_templates)
+
+    skill_kwargs: dict[str, object] = {}
+    async with asyncio.TaskGroup() as task_group:
+        if config_obj.metrics_enabled:
+            # The registry outlives reconnects, which create a new skill instance each time
+            registry = metrics.MetricsRegistry()
+            skill_kwargs["metrics_registry"] = registry
+            task_group.create_task(
+                metrics.monitor_loop_lag(
+                    registry.histogram(
+                        "time_skill_loop_lag_seconds", "Delay of the event loop resuming a sleeping task."
+                    )
+                )
+            )
+            if config_obj.metrics_port is not None:
+                task_group.create_task(
+                    metrics.serve_prometheus(registry, config_obj.metrics_host, config_obj.metrics_port, logger)
+                )
+        if profile_path is not None:
+            stage_profiler = profiler.StageProfiler(profile_path, profile_rate, logger)
+            skill_kwargs["profiler"] = stage_profiler
+            task_group.create_task(stage_profiler.run())
+        if capture_path is not None:
+            recorder = capture.TrafficRecorder(capture_path, logger)
+            skill_kwargs["recorder"] = recorder
+            task_group.create_task(recorder.run())
+
+        # Start the skill using the async MQTT connection handler
+        await mqtt_connection_handler.mqtt_connection_handler(
+            time_skill.TimeSkill,
+            config_obj,
+            retry_interval=5,
+            logger=logger,
+            template_env=template_env,
+            **skill_kwargs,
+        )
+
+
+def _path_from_env(name: str) -> pathlib.Path | None:
+    value = os.environ.get(name)
+    return pathlib.Path(value) if value else None
+
+
+def run() -> None:
+    """Console entry point: ``private-assistant-time-skill-service [CONFIG_PATH]``."""
+    arguments = sys.argv[1:]
+    if len(arguments) > 1:
+        sys.exit(
+            f"Usage: {pathlib.Path(sys.argv[0]).name} [CONFIG_PATH], further options are read from the environment."
+        )
+    config_path = pathlib.Path(arguments[0]) if arguments else _path_from_env(CONFIG_PATH_ENV)
+    if config_path is None:
+        sys.exit(f"Pass the config path as argument or set {CONFIG_PATH_ENV}.")
+    profile_rate = float(os.environ.get(PROFILE_RATE_ENV, DEFAULT_PROFILE_RATE))
+    if not 0.0 <= profile_rate <= 1.0:
+        sys.exit(f"{PROFILE_RATE_ENV} must be between 0 and 1.")
+    asyncio.run(
+        start_skill(
+            config_path,
+            _path_from_env(PROFILE_ENV),
+            profile_rate,
+            os.environ.get(SHARD_ID_ENV) or None,
+            _path_from_env(CAPTURE_ENV),
+            _path_from_env(COMPILED_TEMPLATES_ENV),
+        )
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,129 @@
+import asyncio
+import bisect
+import contextlib
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+
+# Virtual nodes per instance; more points even out the share of rooms each instance owns
+DEFAULT_REPLICAS = 64
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hash ring mapping rooms to instances.
+
+    Adding or removing an instance only moves the rooms between it and its ring neighbours, so a
+    membership change hands off a proportional share of timers instead of reshuffling all of them.
+    """
+
+    def __init__(self, members: Iterable[str], replicas: int = DEFAULT_REPLICAS) -> None:
+        self.members = frozenset(members)
+        points = sorted(
+            (_hash(f"{member}#{replica}"), member) for member in self.members for replica in range(replicas)
+        )
+        self._hashes = [point for point, _ in points]
+        self._owners = [member for _, member in points]
+
+    def owner(self, key: str) -> str | None:
+        if not self._hashes:
+            return None
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._owners[index]
+
+
+class ShardCoordinator:
+    """Track the instances of a sharded deployment through heartbeats on a shared MQTT topic.
+
+    Every instance publishes ``alive`` heartbeats and answers a new peer's first heartbeat right away, so
+    a joining instance learns the membership within one round trip. Peers that stop sending heartbeats
+    for ``member_timeout`` seconds, or announce ``leaving``, are dropped from the ring. A new instance
+    owns nothing until its first ``heartbeat_interval`` has passed, which keeps it from claiming rooms of
+    peers it has not heard from yet. ``on_change`` runs whenever the ring changes once ready, and when a
+    peer reports that it ``released`` rooms to the shared store.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        instance_id: str,
+        publish: Callable[[dict[str, str]], Awaitable[None]],
+        on_change: Callable[[], None],
+        logger: logging.Logger,
+        *,
+        heartbeat_interval: float = 1.0,
+        member_timeout: float = 5.0,
+    ) -> None:
+        self.instance_id = instance_id
+        self.publish = publish
+        self.on_change = on_change
+        self.logger = logger
+        self.heartbeat_interval = heartbeat_interval
+        self.member_timeout = member_timeout
+        self.ready = False
+        self.ring = HashRing([instance_id])
+        self._last_seen: dict[str, float] = {}
+        self._heartbeat_now = asyncio.Event()
+
+    def owns(self, room: str) -> bool:
+        return self.ready and self.ring.owner(room) == self.instance_id
+
+    def handle_message(self, message: dict[str, str]) -> None:
+        instance = message.get("instance")
+        if not isinstance(instance, str) or instance == self.instance_id:
+            return
+        state = message.get("state")
+        if state == "leaving":
+            if self._last_seen.pop(instance, None) is not None:
+                self._update_ring()
+        elif state == "released":
+            if self.ready:
+                self.on_change()
+        else:
+            is_new = instance not in self._last_seen
+            self._last_seen[instance] = asyncio.get_running_loop().time()
+            if is_new:
+                # Answer with our own heartbeat so the peer does not wait a full interval to learn about us
+                self._heartbeat_now.set()
+                self._update_ring()
+
+    def _update_ring(self) -> None:
+        self.ring = HashRing([self.instance_id, *self._last_seen])
+        self.logger.info("Shard ring changed, members: %s", ", ".join(sorted(self.ring.members)))
+        if self.ready:
+            self.on_change()
+
+    def _expire_members(self, now: float) -> None:
+        expired = [instance for instance, seen in self._last_seen.items() if now - seen > self.member_timeout]
+        for instance in expired:
+            self.logger.warning("Shard instance '%s' stopped sending heartbeats.", instance)
+            del self._last_seen[instance]
+        if expired:
+            self._update_ring()
+
+    async def announce_released(self) -> None:
+        await self.publish({"instance": self.instance_id, "state": "released"})
+
+    async def run(self) -> None:
+        """Send heartbeats and expire silent peers until cancelled, then announce leaving."""
+        loop = asyncio.get_running_loop()
+        ready_at = loop.time() + self.heartbeat_interval
+        try:
+            while True:
+                self._heartbeat_now.clear()
+                await self.publish({"instance": self.instance_id, "state": "alive"})
+                now = loop.time()
+                self._expire_members(now)
+                if not self.ready and now >= ready_at:
+                    self.ready = True
+                    self.logger.info(
+                        "Shard instance '%s' ready with %d members.", self.instance_id, len(self.ring.members)
+                    )
+                    self.on_change()
+                timeout = self.heartbeat_interval if self.ready else ready_at - now
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._heartbeat_now.wait(), timeout)
+        finally:
+            await self.publish({"instance": self.instance_id, "state": "leaving"})
@@ -1,7 +1,12 @@
 import asyncio
 import enum
+import json
 import logging
-import string
+import sys
+import time
+import uuid
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Self
 
@@ -11,198 +16,995 @@ import private_assistant_commons as commons
 from private_assistant_commons import messages
 from pydantic import BaseModel
 
-from private_assistant_time_skill.tools_time_units import format_time_difference, format_time_for_tts
+from private_assistant_time_skill.action_matcher import ActionMatcher, tokenize
+from private_assistant_time_skill.capture import INCOMING, OUTGOING, TrafficRecorder
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.metrics import MetricsRegistry
+from private_assistant_time_skill.profiler import StageProfiler
+from private_assistant_time_skill.publish_queue import PublishQueue
+from private_assistant_time_skill.response_cache import ResponseCache
+from private_assistant_time_skill.scheduler import LATENESS_BUCKETS, TimerScheduler
+from private_assistant_time_skill.schedules import Schedule, parse_schedule
+from private_assistant_time_skill.sharding import ShardCoordinator
+from private_assistant_time_skill.time_zones import ZoneClock, get_zone_clock
+from private_assistant_time_skill.timer_store import TimerRecord, TimerStore
+from private_assistant_time_skill.tools_time_units import TimeFormatter, get_formatter, join_units
 
 
 class Parameters(BaseModel):
     hours: int | None = None
     minutes: int | None = None
     seconds: int | None = None
+    label: str | None = None
     is_deleted: bool | None = None
     timers: list[dict[str, str | int]] = []
     current_time: datetime | None = None
+    alarms: list[dict[str, str]] = []
+    schedule: Schedule | None = None
 
     @property
     def duration_name(self) -> str:
-        parts = []
-        if self.hours is not None and self.hours > 0:
-            parts.append(f"{self.hours} hour{'s' if self.hours != 1 else ''}")
-        if self.minutes is not None and self.minutes > 0:
-            parts.append(f"{self.minutes} minute{'s' if self.minutes != 1 else ''}")
-        if self.seconds is not None and self.seconds > 0:
-            parts.append(f"{self.seconds} second{'s' if self.seconds != 1 else ''}")
+        return join_units(self.hours or 0, self.minutes or 0, self.seconds or 0)
+
+
+@dataclass(slots=True, eq=False)
+class Timer:
+    """An active timer, kept per running timer and therefore slotted.
+
+    The record is the scheduler key itself, so its deadline lives in the scheduler entry only. Room and
+    output topic strings are interned by ``TimeSkill.register_timer``, as many timers share them. A timer
+    is named by its label if it has one, otherwise by its duration.
+    """
+
+    room: str
+    name: str
+    output_topic: str
+    hours: int | None
+    minutes: int | None
+    seconds: int | None
+    label: str | None = None
+    # Seconds left while paused; a paused timer has no scheduler entry
+    remaining: float | None = None
+
+    def to_record(self, deadline: float) -> TimerRecord:
+        return TimerRecord(
+            self.room,
+            self.name,
+            self.output_topic,
+            self.hours,
+            self.minutes,
+            self.seconds,
+            deadline,
+            None,
+            self.remaining,
+        )
+
 
-        return " and ".join(parts)
+@dataclass(slots=True, eq=False)
+class Alarm:
+    """An alarm at a wall-clock time. The scheduler only holds its next occurrence, which a repeating
+    alarm recomputes from its schedule each time it fires.
+    """
 
-    def format_time(self, with_date: bool = False) -> str:
-        return format_time_for_tts(self.current_time, with_date) if self.current_time else ""
+    room: str
+    name: str
+    output_topic: str
+    schedule: Schedule
+
+    def to_record(self, deadline: float) -> TimerRecord:
+        return TimerRecord(self.room, self.name, self.output_topic, None, None, None, deadline, self.schedule.to_spec())
 
 
 class Action(enum.Enum):
     HELP = ["help"]  # noqa: RUF012
+    # Alarm actions come first, they win over the timer actions sharing their verbs
+    LIST_ALARMS = ["list", "alarm"]  # noqa: RUF012
+    # Silences the alarm going off and keeps its schedule, so "stop" is no synonym of "delete"
+    STOP_ALARM = ["stop", "alarm"]  # noqa: RUF012
+    DELETE_ALARM = ["delete", "alarm"]  # noqa: RUF012
+    SET_ALARM = ["alarm"]  # noqa: RUF012
+    PAUSE = ["pause"]  # noqa: RUF012
+    RESUME = ["resume"]  # noqa: RUF012
+    EXTEND = ["extend"]  # noqa: RUF012
     SET = ["set"]  # noqa: RUF012
     LIST = ["list"]  # noqa: RUF012
     DELETE_LAST = ["delete", "last"]  # noqa: RUF012
+    # Deletes the timer named by label or duration; "delete the timer" stays with DELETE_LAST
+    DELETE = ["delete", "timer"]  # noqa: RUF012
     CURRENT_TIME = ["whats", "time"]  # noqa: RUF012
 
     @classmethod
     def find_matching_action(cls, text: str) -> Self | None:
-        text = text.translate(str.maketrans("", "", string.punctuation))
-        text_words = set(text.lower().split())
-
-        for action in cls:
-            if all(word in text_words for word in action.value):
-                return action
-        return None
+        return _action_matcher.match(text)  # type: ignore[no-any-return]
+
+
+# Built once at import; the enum values remain the canonical keyword set of each action
+_action_matcher = ActionMatcher(
+    keywords={
+        **{action: [action.value] for action in Action},
+        # Recurring schedules are often asked for without the word alarm: "every weekday at 7"
+        Action.SET_ALARM: [Action.SET_ALARM.value, ["every", "at"], ["daily", "at"]],
+        Action.EXTEND: [Action.EXTEND.value, ["add", "to"]],
+        Action.DELETE_LAST: [Action.DELETE_LAST.value, ["stop", "last"]],
+        Action.DELETE: [Action.DELETE.value, ["stop", "timer"]],
+    },
+    phrases={
+        Action.SET_ALARM: ["wake me", "wake us", "wake up"],
+        Action.DELETE_LAST: ["delete timer", "delete the timer", "stop timer", "stop the timer"],
+        Action.CURRENT_TIME: ["what time is it", "what is the time", "how late is it", "tell me the time"],
+    },
+    synonyms={
+        "cancel": "delete",
+        "remove": "delete",
+        "show": "list",
+        "start": "set",
+        "create": "set",
+        "latest": "last",
+        "continue": "resume",
+        "unpause": "resume",
+        "alarms": "alarm",
+        "previous": "last",
+    },
+)
+
+
+# Words of the intent analysis that make a request the skill's business
+TIMER_NOUNS = frozenset({"timer", "timers"})
+ALARM_NOUNS = frozenset({"alarm", "alarms"})
+ALARM_VERBS = frozenset({"wake"})
+DAY_NOUNS = frozenset(
+    {"day", "days", "weekday", "weekdays", "weekend", "weekends"}
+    | {
+        f"{day}{suffix}"
+        for day in ("mon", "tues", "wednes", "thurs", "fri", "satur", "sun")
+        for suffix in ("day", "days")
+    }
+)
+TIME_NOUNS = frozenset({"time"})
+TIMER_VERBS = frozenset(
+    {"set", "start", "create", "list", "show", "delete", "cancel", "remove", "stop", "tell"}
+    | {"pause", "resume", "continue", "extend", "add"}
+)
+DURATION_UNITS = frozenset({"hour", "hours", "minute", "minutes", "second", "seconds"})
+# Determiners, quantifiers and ordinals pick or count timers, they never name one
+_DETERMINERS = frozenset(
+    {"a", "an", "the", "my", "our", "your", "this", "that", "these", "those", "any", "each", "every", "some"}
+    | {"another", "other", "more", "same", "extra", "single", "all", "both", "new", "active"}
+    | {"one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten"}
+    | {"first", "third", "fourth", "fifth", "last", "latest", "previous", "next"}
+)
+# Words in front of "timer" that do not name it
+_UNNAMED_WORDS = _DETERMINERS | TIMER_VERBS | DURATION_UNITS
+# Seconds past a repeating alarm's deadline its next occurrence is searched from
+ALARM_REFIRE_MARGIN = 60.0
+# Substrings one of which every payload with a non-zero certainty contains, checked before JSON validation
+PAYLOAD_MARKERS = ("time", "hour", "minute", "second", "alarm", "wake", "day", "weekend")
+
+
+def rate_intent(intent_analysis_result: messages.IntentAnalysisResult) -> float:
+    """Grade how clearly a request concerns timers, alarms or the clock, from its nouns, verbs and numbers.
+
+    A timer or alarm noun or the verb "wake" settles it. The noun "time" also occurs in requests for
+    other skills, so it only bids the full certainty together with a timer verb or a duration. A
+    duration with a timer verb ("set 5 minutes") and days with a time of day ("every weekday at 7")
+    still pass the default threshold, a bare duration does not.
+    """
+    nouns = intent_analysis_result.nouns
+    if not TIMER_NOUNS.isdisjoint(nouns) or not ALARM_NOUNS.isdisjoint(nouns):
+        return 1.0
+    if not ALARM_VERBS.isdisjoint(intent_analysis_result.verbs):
+        return 1.0
+    if not DAY_NOUNS.isdisjoint(nouns) and any(
+        number.previous_token == "at" for number in intent_analysis_result.numbers
+    ):
+        return 0.8
+    has_verb = not TIMER_VERBS.isdisjoint(intent_analysis_result.verbs)
+    has_duration = any(number.next_token in DURATION_UNITS for number in intent_analysis_result.numbers)
+    if not TIME_NOUNS.isdisjoint(nouns):
+        return 1.0 if has_verb or has_duration else 0.8
+    if has_duration:
+        return 0.8 if has_verb else 0.5
+    return 0.0
+
+
+def _is_label(word: str) -> bool:
+    return word not in _UNNAMED_WORDS and not word.isdigit()
+
+
+def find_timer_label(text: str) -> str | None:
+    """Return the name a request gives a timer, like "pasta" in "add 5 minutes to the pasta timer" or in
+    "stop the timer for the pasta".
+    """
+    tokens = tokenize(text)
+    for position, token in enumerate(tokens):
+        if token != "timer":
+            continue
+        if position and _is_label(tokens[position - 1]):
+            return tokens[position - 1]
+        # Only "for the" names a timer after the word, "for" alone mostly leads a duration
+        if tokens[position + 1 : position + 3] == ["for", "the"] and position + 3 < len(tokens):
+            following = tokens[position + 3]
+            if _is_label(following):
+                return following
+    return None
+
+
+def answer_cache_key(action: Action, parameters: Parameters) -> Hashable | None:  # noqa: PLR0911
+    """Return the inputs an action's answer depends on, or None if the answer must always be rendered."""
+    if action == Action.HELP:
+        return ()
+    if action == Action.CURRENT_TIME and parameters.current_time is not None:
+        # The spoken time is the local wall time with minute resolution; aware datetimes compare in UTC
+        return parameters.current_time.replace(second=0, microsecond=0, tzinfo=None)
+    if action == Action.SET:
+        return parameters.label, parameters.duration_name
+    if action == Action.DELETE:
+        return tuple(timer["id"] for timer in parameters.timers)
+    if action == Action.DELETE_LAST:
+        return parameters.is_deleted, parameters.label or parameters.duration_name
+    if action == Action.SET_ALARM:
+        return parameters.schedule
+    if action in (Action.LIST_ALARMS, Action.STOP_ALARM, Action.DELETE_ALARM):
+        return tuple(alarm["id"] for alarm in parameters.alarms)
+    # LIST, PAUSE, RESUME and EXTEND answers contain remaining times
+    return None
 
 
 class TimeSkill(commons.BaseSkill):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
-        config_obj: commons.SkillConfig,
+        config_obj: TimeSkillConfig,
         mqtt_client: aiomqtt.Client,
         template_env: jinja2.Environment,
         task_group: asyncio.TaskGroup,
         logger: logging.Logger,
+        *,
+        metrics_registry: MetricsRegistry | None = None,
+        profiler: StageProfiler | None = None,
+        recorder: TrafficRecorder | None = None,
+        wall_clock: Callable[[], float] = time.time,
     ) -> None:
         super().__init__(config_obj, mqtt_client, task_group, logger=logger)
-        self.active_timers: dict[str, dict] = {}
+        self.profiler = profiler
+        self.recorder = recorder
+        # Seconds since the epoch; a simulation passes the clock of its VirtualTimeEventLoop
+        self.wall_clock = wall_clock
+        # Without a shared registry the metrics stay private to this instance and requests are not timed
+        self.metrics_enabled = metrics_registry is not None
+        self.metrics = metrics_registry if metrics_registry is not None else MetricsRegistry()
+        self.metrics_topic = config_obj.metrics_topic
+        self.metrics_publish_interval = config_obj.metrics_publish_interval
+        self._register_metrics()
+        self.publish_queue = PublishQueue(
+            self.publish_response,
+            logger,
+            max_size=config_obj.publish_queue_size,
+            workers=config_obj.publish_workers,
+            batch_size=config_obj.publish_batch_size,
+            latency=self.metrics.histogram(
+                "time_skill_publish_queue_latency_seconds", "Time from queueing a message to its publish."
+            ),
+            shed=self.metrics.counter("time_skill_publish_shed_total", "Messages dropped because the queue was full."),
+        )
+        # Timers are namespaced by the room of the originating request
+        self.active_timers: dict[str, dict[str, Timer]] = {}
+        # Alarms per room, named by their schedule spec
+        self.alarms: dict[str, dict[str, Alarm]] = {}
+        self.scheduler = TimerScheduler(
+            self.fire_scheduled,
+            logger,
+            compensate_drift=config_obj.timer_drift_compensation,
+            lateness_warning=config_obj.timer_lateness_warning,
+            lateness=self.metrics.histogram(
+                "time_skill_trigger_lateness_seconds", "Delay between timer deadline and firing.", LATENESS_BUCKETS
+            ),
+        )
+        self.trigger_coalescing_window = config_obj.trigger_coalescing_window
+        self.pending_triggers: dict[str, list[Timer]] = {}
+        self.timer_store: TimerStore | None = None
+        if config_obj.timer_store_path is not None:
+            self.timer_store = TimerStore(config_obj.timer_store_path, logger, config_obj.timer_store_flush_interval)
+        self.shard_topic = config_obj.shard_topic
+        self.shard_coordinator: ShardCoordinator | None = None
+        if config_obj.shard_instance_id is not None:
+            if self.timer_store is None:
+                raise ValueError("Sharding requires timer_store_path to hand timers off between instances.")
+            self.shard_coordinator = ShardCoordinator(
+                config_obj.shard_instance_id,
+                self.publish_shard_message,
+                self.schedule_rebalance,
+                logger,
+                heartbeat_interval=config_obj.shard_heartbeat_interval,
+                member_timeout=config_obj.shard_member_timeout,
+            )
+        self._rebalance_lock = asyncio.Lock()
         self.template_env = template_env
-        self.last_created_timer_name: str | None = None
-        self.action_to_template: dict[Action, jinja2.Template] = {}
+        self.response_cache = ResponseCache()
+        self.last_created_timer_names: dict[str, str] = {}
+        self.last_created_alarm_names: dict[str, str] = {}
+        # Rooms without an entry in client_locales speak the default locale
+        self.default_locale = config_obj.default_locale
+        self.client_locales = dict(config_obj.client_locales)
+        self.formatters: dict[str, TimeFormatter] = {
+            code: get_formatter(code, config_obj.duration_phrase_table_seconds)
+            for code in {self.default_locale, *self.client_locales.values()}
+        }
+        self.default_clock = get_zone_clock(config_obj.default_time_zone)
+        self.client_clocks: dict[str, ZoneClock] = {
+            room: get_zone_clock(zone_name) for room, zone_name in config_obj.client_time_zones.items()
+        }
+        # Templates per locale code, loaded once so requests never look up template files
+        self.action_to_template: dict[str, dict[Action, jinja2.Template]] = {code: {} for code in self.formatters}
         # Adding a separate template dictionary for non-action-related operations
-        self.non_action_templates: dict[str, jinja2.Template] = {
-            "triggered": template_env.get_template("triggered.j2"),
+        self.non_action_templates: dict[str, dict[str, jinja2.Template]] = {
+            code: {
+                name: template_env.get_template(f"{formatter.locale.template_dir}{name}.j2")
+                for name in ("triggered", "alarm_triggered")
+            }
+            for code, formatter in self.formatters.items()
         }
 
+    def _register_metrics(self) -> None:
+        self.request_durations = {
+            action: self.metrics.histogram(
+                "time_skill_request_duration_seconds", "Time to handle a request.", action=action.name.lower()
+            )
+            for action in Action
+        }
+        self.certainty_duration = self.metrics.histogram(
+            "time_skill_certainty_duration_seconds", "Time to calculate the certainty of a request."
+        )
+        self.render_durations = {
+            template: self.metrics.histogram(
+                "time_skill_render_duration_seconds", "Time to render an answer template.", template=template
+            )
+            for template in [action.name.lower() for action in Action] + ["triggered", "alarm_triggered"]
+        }
+        self.publish_duration = self.metrics.histogram(
+            "time_skill_publish_duration_seconds", "Time to hand a response to the MQTT client."
+        )
+        self.publish_failures = self.metrics.counter(
+            "time_skill_publish_failures_total", "Responses that failed to publish."
+        )
+        self.prefiltered_requests = self.metrics.counter(
+            "time_skill_prefiltered_requests_total", "Requests rejected from the raw payload without validation."
+        )
+        self.trigger_publishes_saved = self.metrics.counter(
+            "time_skill_trigger_publishes_saved_total", "Trigger publishes avoided by coalescing timers of one client."
+        )
+        self.cache_hits = {
+            action: self.metrics.counter(
+                "time_skill_response_cache_hits_total",
+                "Answers served from the response cache.",
+                action=action.name.lower(),
+            )
+            for action in Action
+        }
+        self.cache_misses = {
+            action: self.metrics.counter(
+                "time_skill_response_cache_misses_total",
+                "Cacheable answers that had to be rendered.",
+                action=action.name.lower(),
+            )
+            for action in Action
+        }
+        self.metrics.gauge(
+            "time_skill_active_timers", "Timers currently scheduled.", function=lambda: len(self.scheduler)
+        )
+        self.metrics.gauge(
+            "time_skill_publish_queue_depth",
+            "Messages waiting to be published.",
+            function=lambda: len(self.publish_queue),
+        )
+
     def _load_templates(self) -> None:
         try:
-            for action in Action:
-                self.action_to_template[action] = self.template_env.get_template(f"{action.name.lower()}.j2")
+            for code, formatter in self.formatters.items():
+                for action in Action:
+                    self.action_to_template[code][action] = self.template_env.get_template(
+                        f"{formatter.locale.template_dir}{action.name.lower()}.j2"
+                    )
             self.logger.debug("Templates loaded successfully")
         except jinja2.TemplateNotFound as e:
             self.logger.error("Failed to load template: %s", e)
 
+    async def setup_mqtt_subscriptions(self) -> None:
+        await super().setup_mqtt_subscriptions()
+        if self.shard_coordinator is not None:
+            await self.mqtt_client.subscribe(topic=self.shard_topic, qos=1)
+            self.logger.info("Subscribed to shard topic: %s", self.shard_topic)
+
+    async def listen_to_messages(self, client: aiomqtt.Client) -> None:
+        """Dispatch shard membership messages besides the intent analysis results ``BaseSkill`` handles."""
+        async for message in client.messages:
+            self.logger.debug("Received message on topic %s", message.topic)
+            payload_str = self.decode_message_payload(message.payload)
+            if payload_str is None:
+                continue
+            if message.topic.matches(self.config_obj.intent_analysis_result_topic):
+                await self.handle_client_request_message(payload_str)
+            elif self.shard_coordinator is not None and message.topic.matches(self.shard_topic):
+                try:
+                    self.shard_coordinator.handle_message(json.loads(payload_str))
+                except (json.JSONDecodeError, AttributeError) as e:
+                    self.logger.error("Invalid shard message: %s", e)
+
     async def skill_preparations(self) -> None:
         self._load_templates()
+        for code, templates in self.action_to_template.items():
+            if Action.HELP in templates:
+                # The help text is constant, render it before the first request asks for it
+                self.get_answer(Action.HELP, Parameters(), code)
+        if self.timer_store is not None:
+            await asyncio.to_thread(self.timer_store.open)
+            # A sharded instance adopts its share of the store once it knows its peers
+            if self.shard_coordinator is None:
+                self.restore_timers(await asyncio.to_thread(self.timer_store.load))
+            self.add_task(self.timer_store.run())
+        self.add_task(self.scheduler.run())
+        self.add_task(self.publish_queue.run())
+        if self.shard_coordinator is not None:
+            self.add_task(self.shard_coordinator.run())
+        if self.metrics_publish_interval is not None:
+            self.add_task(self.publish_metrics(self.metrics_publish_interval))
+        self.add_task(self.invalidate_current_time_answers())
+
+    async def invalidate_current_time_answers(self) -> None:
+        """Drop cached CURRENT_TIME answers at every minute boundary so the cache holds only the current one."""
+        while True:
+            await asyncio.sleep(60 - self.wall_clock() % 60)
+            self.response_cache.invalidate(Action.CURRENT_TIME)
+
+    async def publish_shard_message(self, message: dict[str, str]) -> None:
+        try:
+            await self.mqtt_client.publish(self.shard_topic, json.dumps(message), qos=1)
+        except aiomqtt.MqttError as e:
+            self.logger.warning("Failed to publish shard message to topic '%s': %s", self.shard_topic, e)
+
+    def schedule_rebalance(self) -> None:
+        self.add_task(self.rebalance_shards())
+
+    async def rebalance_shards(self) -> None:
+        """Release rooms that moved to another instance and adopt persisted timers of rooms that moved here."""
+        if self.shard_coordinator is None or self.timer_store is None:
+            return
+        async with self._rebalance_lock:
+            released = [
+                room for room in self.active_timers.keys() | self.alarms.keys() if not self.shard_coordinator.owns(room)
+            ]
+            for room in released:
+                self.release_room(room)
+            # Peers adopt from the store, so everything written so far must be on disk before announcing
+            await self.timer_store.flush()
+            if released:
+                self.logger.info("Released %d rooms to other shard instances.", len(released))
+                await self.shard_coordinator.announce_released()
+            timer_records = await asyncio.to_thread(self.timer_store.load)
+            adopted = [
+                timer_record
+                for timer_record in timer_records
+                if self.shard_coordinator.owns(timer_record.room)
+                and timer_record.name not in self.active_timers.get(timer_record.room, {})
+                and timer_record.name not in self.alarms.get(timer_record.room, {})
+            ]
+            if adopted:
+                self.restore_timers(adopted)
+
+    def release_room(self, room: str) -> None:
+        """Stop handling a room's timers here without removing them from the store."""
+        for timer in self.active_timers.pop(room, {}).values():
+            self.scheduler.cancel(timer)
+        for alarm in self.alarms.pop(room, {}).values():
+            self.scheduler.cancel(alarm)
+        self.last_created_timer_names.pop(room, None)
+        self.last_created_alarm_names.pop(room, None)
+
+    async def publish_metrics(self, interval: float) -> None:
+        """Periodically publish a JSON snapshot of the metrics registry to the metrics topic."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.mqtt_client.publish(self.metrics_topic, json.dumps(self.metrics.snapshot()), qos=0)
+            except aiomqtt.MqttError as e:
+                self.logger.warning("Failed to publish metrics to topic '%s': %s", self.metrics_topic, e)
+
+    async def handle_client_request_message(self, payload: str) -> None:
+        """Reject payloads without any time related word before ``BaseSkill`` validates them."""
+        if self.recorder is not None:
+            self.recorder.record(INCOMING, self.config_obj.intent_analysis_result_topic, payload)
+        if not any(marker in payload for marker in PAYLOAD_MARKERS):
+            self.prefiltered_requests.inc()
+            return
+        await super().handle_client_request_message(payload)
 
     async def calculate_certainty(self, intent_analysis_result: messages.IntentAnalysisResult) -> float:
         """Calculate how confident the skill is about handling the given request."""
-        keywords = ["timer", "timers", "time"]
-        if any(noun in keywords for noun in intent_analysis_result.nouns):
-            self.logger.debug("Timer noun detected, certainty set to 1.0.")
-            return 1.0
-        self.logger.debug("No timer noun detected, certainty set to 0.0.")
-        return 0.0
+        start = time.perf_counter() if self.metrics_enabled else 0.0
+        room = intent_analysis_result.client_request.room
+        if self.shard_coordinator is not None and not self.shard_coordinator.owns(room):
+            self.logger.debug("Room '%s' belongs to another shard instance, certainty set to 0.0.", room)
+            certainty = 0.0
+        else:
+            certainty = rate_intent(intent_analysis_result)
+        if self.metrics_enabled:
+            self.certainty_duration.observe(time.perf_counter() - start)
+        return certainty
 
     def find_parameters(self, action: Action, intent_analysis_result: messages.IntentAnalysisResult) -> Parameters:
         parameters = Parameters()
-        if action == Action.SET:
+        if action in (Action.SET, Action.PAUSE, Action.RESUME, Action.EXTEND, Action.DELETE, Action.DELETE_LAST):
             for result in intent_analysis_result.numbers:
-                if result.next_token == "hours":
+                if result.next_token in ("hour", "hours"):
                     parameters.hours = result.number_token
-                elif result.next_token == "minutes":
+                elif result.next_token in ("minute", "minutes"):
                     parameters.minutes = result.number_token
-                elif result.next_token == "seconds":
+                elif result.next_token in ("second", "seconds"):
                     parameters.seconds = result.number_token
+            parameters.label = find_timer_label(intent_analysis_result.client_request.text)
         elif action == Action.LIST:
-            parameters.timers = self.find_active_timers()
+            parameters.timers = self.find_active_timers(intent_analysis_result.client_request.room)
+        elif action in (Action.SET_ALARM, Action.DELETE_ALARM):
+            # Numbers in the intent analysis are integers, so clock times like 6:30 are read from the text
+            parameters.schedule = parse_schedule(intent_analysis_result.client_request.text)
+        elif action in (Action.LIST_ALARMS, Action.STOP_ALARM):
+            parameters.alarms = self.find_alarms(intent_analysis_result.client_request.room)
         return parameters
 
-    def get_answer(self, action: Action, parameters: Parameters) -> str:
-        template = self.action_to_template[action]
-        return template.render(parameters=parameters)
-
-    def register_timer(self, parameters: Parameters) -> None:
+    def locale_for(self, room: str) -> str:
+        return self.client_locales.get(room, self.default_locale)
+
+    def clock_for(self, room: str) -> ZoneClock:
+        return self.client_clocks.get(room, self.default_clock)
+
+    def get_answer(self, action: Action, parameters: Parameters, locale: str | None = None) -> str:
+        locale = locale or self.default_locale
+        template = self.action_to_template[locale][action]
+        key = answer_cache_key(action, parameters)
+        if key is None:
+            return self._render(template, action.name.lower(), parameters, locale)
+        answer = self.response_cache.get(action, (locale, key))
+        if answer is not None:
+            self.cache_hits[action].inc()
+            return answer
+        self.cache_misses[action].inc()
+        answer = self._render(template, action.name.lower(), parameters, locale)
+        self.response_cache.put(action, (locale, key), answer)
+        return answer
+
+    def _render(self, template: jinja2.Template, template_name: str, parameters: Parameters, locale: str) -> str:
+        formatter = self.formatters[locale]
+        if not self.metrics_enabled:
+            return template.render(parameters=parameters, locale=formatter)
+        start = time.perf_counter()
+        answer = template.render(parameters=parameters, locale=formatter)
+        self.render_durations[template_name].observe(time.perf_counter() - start)
+        return answer
+
+    def register_timer(self, parameters: Parameters, client_request: messages.ClientRequest) -> None:
         total_diff = timedelta(
             hours=parameters.hours or 0,
             minutes=parameters.minutes or 0,
             seconds=parameters.seconds or 0,
         )
-        duration_name = parameters.duration_name
+        duration_name = sys.intern(parameters.duration_name)
         if not duration_name:
             self.logger.error("No valid timer duration provided.")
             return
 
-        # Cancel any existing timer for the same duration and remove it from active_timers
-        if duration_name in self.active_timers:
-            self.active_timers[duration_name]["task"].cancel()
-            # The done callback will handle removing it from active_timers
-            self.logger.debug("Existing timer '%s' canceled before registering a new one.", duration_name)
-
-        # Create a new async task for the timer
-        task = self.add_task(self._timer_task(total_diff, parameters))
-        # Attach a callback to ensure the timer is removed from active_timers when it completes
-        task.add_done_callback(lambda _: self.cleanup_timer(duration_name))
-        self.active_timers[duration_name] = {
-            "task": task,
-            "start_time": datetime.now(),
-            "total_duration": total_diff,
-        }
-        self.last_created_timer_name = duration_name
-        self.logger.debug("Timer '%s' registered and started.", duration_name)
+        name = sys.intern(parameters.label) if parameters.label is not None else duration_name
+        room = sys.intern(client_request.room)
+        room_timers = self.active_timers.setdefault(room, {})
+        # A new timer of the same name in this room replaces the pending one
+        previous = room_timers.get(name)
+        if previous is not None:
+            self.scheduler.cancel(previous)
+            self.logger.debug("Existing timer '%s' in room '%s' rescheduled.", name, room)
+
+        timer = Timer(
+            room,
+            name,
+            sys.intern(client_request.output_topic),
+            parameters.hours,
+            parameters.minutes,
+            parameters.seconds,
+            parameters.label,
+        )
+        self.scheduler.schedule(timer, total_diff.total_seconds())
+        room_timers[name] = timer
+        if self.timer_store is not None:
+            self.timer_store.record_create(timer.to_record(self.wall_clock() + total_diff.total_seconds()))
+        self.last_created_timer_names[room] = name
+        self.logger.debug("Timer '%s' registered and started in room '%s'.", name, room)
+
+    def restore_timers(self, timer_records: list[TimerRecord]) -> None:
+        """Reschedule persisted timers after a restart; overdue ones fire on the next scheduler pass."""
+        now = self.wall_clock()
+        delays: list[tuple[Timer | Alarm, float]] = []
+        for timer_record in timer_records:
+            if timer_record.schedule is not None:
+                alarm = Alarm(
+                    sys.intern(timer_record.room),
+                    timer_record.name,
+                    sys.intern(timer_record.output_topic),
+                    Schedule.from_spec(timer_record.schedule),
+                )
+                delays.append((alarm, max(timer_record.deadline - now, 0.0)))
+                previous_alarm = self.alarms.setdefault(alarm.room, {}).get(alarm.name)
+                if previous_alarm is not None:
+                    self.scheduler.cancel(previous_alarm)
+                self.alarms[alarm.room][alarm.name] = alarm
+                continue
+            duration_name = join_units(timer_record.hours or 0, timer_record.minutes or 0, timer_record.seconds or 0)
+            timer = Timer(
+                sys.intern(timer_record.room),
+                sys.intern(timer_record.name),
+                sys.intern(timer_record.output_topic),
+                timer_record.hours,
+                timer_record.minutes,
+                timer_record.seconds,
+                # Only labelled timers are named differently from their duration
+                timer_record.name if timer_record.name != duration_name else None,
+                timer_record.remaining,
+            )
+            if timer.remaining is None:
+                delays.append((timer, max(timer_record.deadline - now, 0.0)))
+            previous = self.active_timers.setdefault(timer.room, {}).get(timer.name)
+            if previous is not None:
+                self.scheduler.cancel(previous)
+            self.active_timers[timer.room][timer.name] = timer
+        self.scheduler.schedule_many(delays)
+        overdue = sum(1 for _, delay in delays if delay == 0.0)
+        self.logger.info("Restored %d timers from store, %d overdue.", len(timer_records), overdue)
+
+    def register_alarm(self, parameters: Parameters, client_request: messages.ClientRequest) -> None:
+        """Schedule the next occurrence of an alarm; the same schedule in a room replaces the existing alarm."""
+        schedule = parameters.schedule
+        if schedule is None:
+            self.logger.debug("No valid alarm time provided.")
+            return
+        room = sys.intern(client_request.room)
+        alarm = Alarm(room, schedule.to_spec(), sys.intern(client_request.output_topic), schedule)
+        room_alarms = self.alarms.setdefault(room, {})
+        previous = room_alarms.get(alarm.name)
+        if previous is not None:
+            self.scheduler.cancel(previous)
+        room_alarms[alarm.name] = alarm
+        self.schedule_alarm(alarm, self.wall_clock())
+        self.last_created_alarm_names[room] = alarm.name
+        parameters.alarms = [{"id": self.formatters[self.locale_for(room)].describe_schedule(schedule)}]
+        self.logger.debug("Alarm '%s' registered in room '%s'.", alarm.name, room)
+
+    def schedule_alarm(self, alarm: Alarm, after: float) -> None:
+        """Schedule the first occurrence of ``alarm`` after epoch second ``after`` in its room's time zone."""
+        now = self.wall_clock()
+        deadline = alarm.schedule.next_fire(after, self.clock_for(alarm.room).zone)
+        self.scheduler.schedule(alarm, deadline - now)
+        if self.timer_store is not None:
+            self.timer_store.record_create(alarm.to_record(deadline))
+
+    def fire_scheduled(self, key: Timer | Alarm) -> None:
+        """Scheduler callback, dispatching a due entry to the timer or alarm handling."""
+        if isinstance(key, Alarm):
+            self.fire_alarm(key)
+        else:
+            self.fire_timer(key)
 
-    async def _timer_task(self, total_diff: timedelta, parameters: Parameters) -> None:
-        await asyncio.sleep(total_diff.total_seconds())
-        await self.publish_triggered_timer(parameters)
+    def fire_alarm(self, alarm: Alarm) -> None:
+        """Announce a due alarm, then schedule its next occurrence or remove it if it does not repeat."""
+        if alarm.schedule.repeat:
+            # Occurrences are at least a day apart, the margin skips this one even if it fired a little early
+            self.schedule_alarm(alarm, self.wall_clock() + ALARM_REFIRE_MARGIN)
+        else:
+            self.cleanup_alarm(alarm.room, alarm.name)
+        formatter = self.formatters[self.locale_for(alarm.room)]
+        parameters = Parameters(alarms=[{"id": formatter.describe_schedule(alarm.schedule)}])
+        self.publish_announcement(
+            "alarm_triggered", parameters, alarm.room, alarm.output_topic, "publish_triggered_alarm"
+        )
 
-    async def publish_triggered_timer(self, parameters: Parameters) -> None:
-        # Use the triggered template from the non-action templates
-        template = self.non_action_templates["triggered"]
-        answer = template.render(parameters=parameters)
-        await self.publish_with_alert(answer, broadcast=True)
-        # Cleanup is already handled by the task's done callback
+    def cleanup_alarm(self, room: str, name: str) -> None:
+        room_alarms = self.alarms.get(room)
+        if room_alarms is not None and name in room_alarms:
+            self.scheduler.cancel(room_alarms.pop(name))
+            if not room_alarms:
+                del self.alarms[room]
+            if self.timer_store is not None:
+                self.timer_store.record_removal(room, name)
+            self.logger.info("Alarm '%s' in room '%s' removed.", name, room)
+
+    def find_alarms(self, room: str) -> list[dict[str, str]]:
+        """Describe the alarms of a room, the one due next first."""
+        formatter = self.formatters[self.locale_for(room)]
+        alarms = sorted(
+            self.alarms.get(room, {}).values(), key=lambda alarm: self.scheduler.deadline(alarm) or float("inf")
+        )
+        return [{"id": formatter.describe_schedule(alarm.schedule)} for alarm in alarms]
+
+    def delete_alarm(self, parameters: Parameters, room: str) -> None:
+        """Delete the alarms at the requested time of day, or the last created alarm if none was named."""
+        schedule = parameters.schedule
+        if schedule is not None:
+            names = [
+                name
+                for name, alarm in self.alarms.get(room, {}).items()
+                if (alarm.schedule.hour, alarm.schedule.minute) == (schedule.hour, schedule.minute)
+            ]
+        else:
+            last_name = self.last_created_alarm_names.get(room)
+            names = [last_name] if last_name is not None and last_name in self.alarms.get(room, {}) else []
+        formatter = self.formatters[self.locale_for(room)]
+        parameters.alarms = []
+        for name in names:
+            parameters.alarms.append({"id": formatter.describe_schedule(self.alarms[room][name].schedule)})
+            self.cleanup_alarm(room, name)
+            if self.last_created_alarm_names.get(room) == name:
+                del self.last_created_alarm_names[room]
+        parameters.is_deleted = bool(names)
+
+    def fire_timer(self, timer: Timer) -> None:
+        """Scheduler callback for a due timer; queues it for a coalesced announcement to its client."""
+        self.cleanup_timer(timer.room, timer.name)
+        pending = self.pending_triggers.get(timer.output_topic)
+        if pending is None:
+            self.pending_triggers[timer.output_topic] = [timer]
+            # Even a zero window merges timers fired in the same scheduler pass
+            asyncio.get_running_loop().call_later(
+                self.trigger_coalescing_window, self.flush_triggers, timer.output_topic
+            )
+        else:
+            pending.append(timer)
 
-    def cleanup_timer(self, duration_name: str) -> None:
-        """Remove a timer from active_timers once it completes or is canceled."""
-        if duration_name in self.active_timers:
-            del self.active_timers[duration_name]
-            self.logger.info("Timer '%s' cleaned up from active timers.", duration_name)
+    def flush_triggers(self, output_topic: str) -> None:
+        """Publish one announcement for all timers of a client that became due within the coalescing window."""
+        timers = self.pending_triggers.pop(output_topic, [])
+        if not timers:
+            return
+        if len(timers) == 1:
+            timer = timers[0]
+            parameters = Parameters(hours=timer.hours, minutes=timer.minutes, seconds=timer.seconds, label=timer.label)
+        else:
+            formatter = self.formatters[self.locale_for(timers[0].room)]
+            parameters = Parameters(timers=[{"id": self.spoken_timer_name(timer, formatter)} for timer in timers])
+            self.trigger_publishes_saved.inc(len(timers) - 1)
+        # Only room and output topic are needed to route the announcement back to its origin
+        client_request = messages.ClientRequest(
+            id=uuid.uuid4(), text="", room=timers[0].room, output_topic=output_topic
+        )
+        self.publish_triggered_timer(parameters, client_request)
 
-    def find_active_timers(self) -> list[dict]:
-        """Find all currently active timers with remaining time."""
-        active_timers_info = []
-        for timer_name, timer_data in self.active_timers.items():
-            total_duration = timer_data["total_duration"]
-            start_time = timer_data["start_time"]
-            time_passed = datetime.now() - start_time
-            time_left = total_duration - time_passed
+    def publish_triggered_timer(self, parameters: Parameters, client_request: messages.ClientRequest) -> None:
+        """Render a timer announcement and queue it with the default alert, dropping it if the queue is full."""
+        self.publish_announcement(
+            "triggered", parameters, client_request.room, client_request.output_topic, "publish_triggered_timer"
+        )
 
-            if time_left.total_seconds() > 0:
-                active_timers_info.append({"id": timer_name, "time_left": format_time_difference(time_left)})
+    def publish_announcement(
+        self, template_name: str, parameters: Parameters, room: str, output_topic: str, stack: str
+    ) -> None:
+        """Render a non-action template and offer it with the default alert; ``stack`` names profile samples."""
+        sample = self.profiler.sample() if self.profiler is not None else None
+        locale = self.locale_for(room)
+        template = self.non_action_templates[locale][template_name]
+        answer = self._render(template, template_name, parameters, locale)
+        if sample is not None:
+            sample.mark("render")
+        response = messages.Response(text=answer, alert=self.default_alert)
+        self.publish_queue.offer(output_topic, response.model_dump_json(exclude_none=True))
+        if sample is not None:
+            sample.mark("publish_enqueue")
+            sample.finish(stack)
+
+    async def send_response(
+        self,
+        response_text: str,
+        client_request: messages.ClientRequest,
+        alert: messages.Alert | None = None,
+    ) -> None:
+        """Queue a response for the publisher workers, waiting while the publish queue is full."""
+        response = messages.Response(text=response_text, alert=alert)
+        await self.publish_queue.put(client_request.output_topic, response.model_dump_json(exclude_none=True))
+
+    async def publish_response(self, topic: str, payload: str) -> None:
+        """Publish a queued response like ``BaseSkill.send_response``, counting failures and timing the publish."""
+        start = time.perf_counter()
+        try:
+            self.logger.debug("Publishing response as JSON to topic '%s'.", topic)
+            await self.mqtt_client.publish(topic=topic, payload=payload, qos=1, retain=False)
+            self.logger.info("Published response to topic '%s'.", topic)
+            if self.recorder is not None:
+                self.recorder.record(OUTGOING, topic, payload)
+        except asyncio.CancelledError:
+            self.logger.warning("Publishing to topic '%s' was cancelled.", topic)
+            raise
+        except Exception as e:
+            self.publish_failures.inc()
+            self.logger.error("Failed to publish response to topic '%s': %s", topic, e, exc_info=True)
+        else:
+            self.publish_duration.observe(time.perf_counter() - start)
+
+    def cleanup_timer(self, room: str, duration_name: str) -> None:
+        """Remove a timer from active_timers once it completes or is canceled."""
+        room_timers = self.active_timers.get(room)
+        if room_timers is not None and duration_name in room_timers:
+            self.scheduler.cancel(room_timers.pop(duration_name))
+            if not room_timers:
+                del self.active_timers[room]
+            if self.timer_store is not None:
+                self.timer_store.record_removal(room, duration_name)
+            self.logger.info("Timer '%s' in room '%s' cleaned up from active timers.", duration_name, room)
+
+    def find_active_timers(self, room: str) -> list[dict]:
+        """Find all currently active timers of a room with remaining time, paused ones included."""
+        active_timers_info = []
+        formatter = self.formatters[self.locale_for(room)]
+        for timer in self.active_timers.get(room, {}).values():
+            time_left = self.timer_time_left(timer)
+            if time_left is not None and time_left > 0:
+                active_timers_info.append(self.describe_timer(timer, time_left, formatter))
 
         return active_timers_info
 
-    def delete_last_timer(self, parameters: Parameters) -> None:
-        if self.last_created_timer_name and self.last_created_timer_name in self.active_timers:
-            self.active_timers[self.last_created_timer_name]["task"].cancel()
-            # The done callback will handle removing it from active_timers
-            self.logger.debug("Last created timer '%s' deleted.", self.last_created_timer_name)
-            self.last_created_timer_name = None
+    @staticmethod
+    def spoken_timer_name(timer: Timer, formatter: TimeFormatter) -> str:
+        return timer.label or formatter.spoken_duration(timer.hours, timer.minutes, timer.seconds)
+
+    def describe_timer(self, timer: Timer, time_left: float, formatter: TimeFormatter) -> dict[str, str | int]:
+        info: dict[str, str | int] = {
+            "id": self.spoken_timer_name(timer, formatter),
+            "time_left": formatter.format_time_difference(timedelta(seconds=time_left)),
+        }
+        if timer.remaining is not None:
+            info["paused"] = True
+        return info
+
+    def timer_time_left(self, timer: Timer) -> float | None:
+        """Seconds until a timer is due; a paused timer keeps what it had left when it was paused."""
+        return timer.remaining if timer.remaining is not None else self.scheduler.time_left(timer)
+
+    def find_timer(self, room: str, parameters: Parameters, *, by_duration: bool = True) -> Timer | None:
+        """Look up the timer a request names, by label, by duration unless its numbers mean something else,
+        or else the room's last created timer. Timers are indexed by name, so this is a dict lookup.
+        """
+        if parameters.label is not None:
+            name: str | None = parameters.label
+        elif by_duration and parameters.duration_name:
+            name = parameters.duration_name
+        else:
+            name = self.last_created_timer_names.get(room)
+        return self.active_timers.get(room, {}).get(name) if name is not None else None
+
+    def store_timer(self, timer: Timer) -> None:
+        """Queue the current state of a changed timer for the timer store."""
+        if self.timer_store is not None:
+            time_left = self.timer_time_left(timer) or 0.0
+            self.timer_store.record_create(timer.to_record(self.wall_clock() + time_left))
+
+    def pause_timer(self, parameters: Parameters, room: str) -> None:
+        """Take the named timer out of the scheduler, keeping its remaining time on the timer itself."""
+        timer = self.find_timer(room, parameters)
+        time_left = self.timer_time_left(timer) if timer is not None else None
+        if timer is None or time_left is None:
+            parameters.timers = []
+            return
+        if timer.remaining is None:
+            self.scheduler.cancel(timer)
+            timer.remaining = time_left = max(time_left, 0.0)
+            self.store_timer(timer)
+            self.logger.debug("Timer '%s' in room '%s' paused.", timer.name, room)
+        parameters.timers = [self.describe_timer(timer, time_left, self.formatters[self.locale_for(room)])]
+
+    def resume_timer(self, parameters: Parameters, room: str) -> None:
+        """Schedule a paused timer again with the time it had left."""
+        timer = self.find_timer(room, parameters)
+        if timer is None:
+            parameters.timers = []
+            return
+        if timer.remaining is not None:
+            self.scheduler.schedule(timer, timer.remaining)
+            timer.remaining = None
+            self.store_timer(timer)
+            self.logger.debug("Timer '%s' in room '%s' resumed.", timer.name, room)
+        time_left = self.timer_time_left(timer) or 0.0
+        parameters.timers = [self.describe_timer(timer, time_left, self.formatters[self.locale_for(room)])]
+
+    def extend_timer(self, parameters: Parameters, room: str) -> None:
+        """Add the requested duration to a timer, moving its scheduler entry or its paused remaining time.
+
+        The numbers of the request are the time to add, so the timer is found by label or is the last created.
+        """
+        timer = self.find_timer(room, parameters, by_duration=False)
+        extension = timedelta(
+            hours=parameters.hours or 0, minutes=parameters.minutes or 0, seconds=parameters.seconds or 0
+        ).total_seconds()
+        if timer is None or not extension:
+            parameters.timers = []
+            return
+        if timer.remaining is not None:
+            timer.remaining += extension
+        else:
+            self.scheduler.postpone(timer, extension)
+        self.store_timer(timer)
+        self.logger.debug("Timer '%s' in room '%s' extended by %s seconds.", timer.name, room, extension)
+        time_left = self.timer_time_left(timer) or 0.0
+        parameters.timers = [self.describe_timer(timer, time_left, self.formatters[self.locale_for(room)])]
+
+    def delete_timer(self, parameters: Parameters, room: str) -> None:
+        """Delete the timer a request names by label or duration."""
+        timer = self.find_timer(room, parameters)
+        if timer is None:
+            parameters.timers = []
+            parameters.is_deleted = False
+            return
+        parameters.timers = [{"id": self.spoken_timer_name(timer, self.formatters[self.locale_for(room)])}]
+        self.cleanup_timer(room, timer.name)
+        if self.last_created_timer_names.get(room) == timer.name:
+            del self.last_created_timer_names[room]
+        parameters.is_deleted = True
+
+    def delete_last_timer(self, parameters: Parameters, room: str) -> None:
+        last_created_timer_name = self.last_created_timer_names.pop(room, None)
+        if last_created_timer_name and last_created_timer_name in self.active_timers.get(room, {}):
+            timer = self.active_timers[room][last_created_timer_name]
+            parameters.hours, parameters.minutes, parameters.seconds = timer.hours, timer.minutes, timer.seconds
+            parameters.label = timer.label
+            self.cleanup_timer(room, last_created_timer_name)
+            self.logger.debug("Last created timer '%s' in room '%s' deleted.", last_created_timer_name, room)
             parameters.is_deleted = True
         else:
-            self.logger.debug("No active timer to delete.")
+            self.logger.debug("No active timer to delete in room '%s'.", room)
             parameters.is_deleted = False
 
-    async def process_request(self, intent_analysis_result: messages.IntentAnalysisResult) -> None:
+    async def process_request(self, intent_analysis_result: messages.IntentAnalysisResult) -> None:  # noqa: PLR0912
+        sample = self.profiler.sample() if self.profiler is not None else None
         action = Action.find_matching_action(intent_analysis_result.client_request.text)
         if action is None:
             self.logger.error("Unrecognized action in text: %s", intent_analysis_result.client_request.text)
             return
+        start = time.perf_counter() if self.metrics_enabled else 0.0
+        if sample is not None:
+            sample.mark("match")
 
         parameters = self.find_parameters(action, intent_analysis_result=intent_analysis_result)
+        if sample is not None:
+            sample.mark("parameters")
 
         if action == Action.CURRENT_TIME:
-            parameters.current_time = datetime.now()
+            parameters.current_time = self.clock_for(intent_analysis_result.client_request.room).now(self.wall_clock())
         elif action == Action.SET:
-            self.register_timer(parameters)
-        elif action in (Action.HELP, Action.LIST):
+            self.register_timer(parameters, intent_analysis_result.client_request)
+        elif action in (Action.HELP, Action.LIST, Action.LIST_ALARMS, Action.STOP_ALARM):
             pass
         elif action == Action.DELETE_LAST:
-            self.delete_last_timer(parameters)
+            if parameters.label is not None or parameters.duration_name:
+                # "cancel the timer for 10 minutes" names its timer, only a bare request means the last one
+                action = Action.DELETE
+                self.delete_timer(parameters, intent_analysis_result.client_request.room)
+            else:
+                self.delete_last_timer(parameters, intent_analysis_result.client_request.room)
+        elif action == Action.SET_ALARM:
+            self.register_alarm(parameters, intent_analysis_result.client_request)
+        elif action == Action.DELETE_ALARM:
+            self.delete_alarm(parameters, intent_analysis_result.client_request.room)
+        elif action == Action.PAUSE:
+            self.pause_timer(parameters, intent_analysis_result.client_request.room)
+        elif action == Action.RESUME:
+            self.resume_timer(parameters, intent_analysis_result.client_request.room)
+        elif action == Action.EXTEND:
+            self.extend_timer(parameters, intent_analysis_result.client_request.room)
+        elif action == Action.DELETE:
+            self.delete_timer(parameters, intent_analysis_result.client_request.room)
         else:
             self.logger.debug("No specific action implemented for action: %s", action)
             return
-
-        answer = self.get_answer(action, parameters)
-        self.add_task(self.send_response(answer, client_request=intent_analysis_result.client_request))
+        if sample is not None:
+            sample.mark("action")
+
+        answer = self.get_answer(action, parameters, self.locale_for(intent_analysis_result.client_request.room))
+        if sample is not None:
+            sample.mark("render")
+        await self.send_response(answer, client_request=intent_analysis_result.client_request)
+        if self.metrics_enabled:
+            self.request_durations[action].observe(time.perf_counter() - start)
+        if sample is not None:
+            sample.mark("publish_enqueue")
+            sample.finish(f"process_request;{action.name.lower()}")
@@ -0,0 +1,78 @@
+import time
+import zoneinfo
+from datetime import UTC, datetime, timedelta, timezone, tzinfo
+
+# How far ahead a refresh looks for the next offset change; zones without one are rechecked after this
+TRANSITION_SEARCH_DAYS = 400
+_DAY = 86400
+
+
+class ZoneClock:
+    """Current time in one zone, using a cached UTC offset that is only recomputed at the next transition.
+
+    ``zone`` None stands for the host's local zone. Resolving the offset through the zone rules happens
+    on a refresh; in between, ``now`` is a timestamp plus a fixed offset.
+    """
+
+    def __init__(self, zone: tzinfo | None) -> None:
+        self.zone = zone
+        self._offset: timezone = UTC
+        # The cached offset holds from the last refresh until the next transition
+        self._valid_from = float("inf")
+        self._valid_until = float("-inf")
+
+    def _offset_at(self, timestamp: float) -> timedelta:
+        local = (
+            datetime.fromtimestamp(timestamp, self.zone)
+            if self.zone is not None
+            else datetime.fromtimestamp(timestamp).astimezone()
+        )
+        offset = local.utcoffset()
+        return offset if offset is not None else timedelta()
+
+    def _next_transition(self, timestamp: float) -> int:
+        """Find the first second after ``timestamp`` with a different offset, scanning by day then bisecting."""
+        offset = self._offset_at(timestamp)
+        start = int(timestamp)
+        for _ in range(TRANSITION_SEARCH_DAYS):
+            end = start + _DAY
+            if self._offset_at(end) != offset:
+                low, high = start, end
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._offset_at(middle) == offset:
+                        low = middle
+                    else:
+                        high = middle
+                return high
+            start = end
+        return start
+
+    def refresh(self, timestamp: float) -> None:
+        self._offset = timezone(self._offset_at(timestamp))
+        self._valid_from = timestamp
+        self._valid_until = self._next_transition(timestamp)
+
+    def now(self, timestamp: float | None = None) -> datetime:
+        """Return the local time at ``timestamp``, seconds since the epoch, which defaults to the current time."""
+        if timestamp is None:
+            timestamp = time.time()
+        if not self._valid_from <= timestamp < self._valid_until:
+            self.refresh(timestamp)
+        return datetime.fromtimestamp(timestamp, self._offset)
+
+
+# Clocks are shared by every skill instance of the process, keyed by zone name
+_clocks: dict[str | None, ZoneClock] = {}
+
+
+def get_zone_clock(name: str | None = None) -> ZoneClock:
+    """Return the shared clock of an IANA zone such as ``Europe/Berlin``, or of the local zone for None."""
+    clock = _clocks.get(name)
+    if clock is None:
+        try:
+            zone = zoneinfo.ZoneInfo(name) if name is not None else None
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError) as e:
+            raise ValueError(f"Unknown time zone '{name}'.") from e
+        clock = _clocks[name] = ZoneClock(zone)
+    return clock
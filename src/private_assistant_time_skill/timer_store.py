@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import pathlib
+import sqlite3
+import threading
+from typing import NamedTuple
+
+
+class TimerRecord(NamedTuple):
+    """Everything needed to announce a timer and to restore it after a restart."""
+
+    room: str
+    name: str
+    output_topic: str
+    hours: int | None
+    minutes: int | None
+    seconds: int | None
+    # Wall-clock deadline in seconds since the epoch; monotonic time does not survive a restart
+    deadline: float
+    # ``Schedule.to_spec`` of an alarm, whose deadline is its next occurrence; None for timers
+    schedule: str | None = None
+    # Seconds left on a paused timer, which is not scheduled and whose deadline is then informational only
+    remaining: float | None = None
+
+
+# Columns added to the table after its first release, with their types, migrated in on open
+_ADDED_COLUMNS = {"schedule": "TEXT", "remaining": "REAL"}
+
+
+class TimerStore:
+    """Persist running timers in SQLite so they survive restarts and reconnects.
+
+    Mutations are only queued on the request path. The ``run`` task writes them in batches from a worker
+    thread, coalescing repeated changes to the same timer into one statement. Only the current state is
+    stored, so cancelled and fired timers are deleted rather than accumulating as journal entries.
+    """
+
+    def __init__(self, path: pathlib.Path, logger: logging.Logger, flush_interval: float = 0.5) -> None:
+        self.path = path
+        self.logger = logger
+        self.flush_interval = flush_interval
+        # Latest pending change per (room, name); None marks a removal
+        self._pending: dict[tuple[str, str], TimerRecord | None] = {}
+        self._connection: sqlite3.Connection | None = None
+        # The asyncio lock keeps batches in order, the thread lock guards the connection against close()
+        self._lock = asyncio.Lock()
+        self._write_lock = threading.Lock()
+
+    def open(self) -> None:
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS timers ("
+            "room TEXT NOT NULL, name TEXT NOT NULL, output_topic TEXT NOT NULL, "
+            "hours INTEGER, minutes INTEGER, seconds INTEGER, deadline REAL NOT NULL, schedule TEXT, "
+            "remaining REAL, PRIMARY KEY (room, name))"
+        )
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(timers)")}
+        for column, column_type in _ADDED_COLUMNS.items():
+            if column not in columns:
+                # Rows of older stores get NULL, which is what their timers meant
+                self._connection.execute(f"ALTER TABLE timers ADD COLUMN {column} {column_type}")
+        self.logger.debug("Timer store opened at %s", self.path)
+
+    def close(self) -> None:
+        self._write(self._take_pending())
+        with self._write_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def load(self) -> list[TimerRecord]:
+        if self._connection is None:
+            raise RuntimeError("Timer store is not open.")
+        rows = self._connection.execute(
+            "SELECT room, name, output_topic, hours, minutes, seconds, deadline, schedule, remaining FROM timers"
+        ).fetchall()
+        return [TimerRecord._make(row) for row in rows]
+
+    def record_create(self, timer: TimerRecord) -> None:
+        self._pending[timer.room, timer.name] = timer
+
+    def record_removal(self, room: str, name: str) -> None:
+        self._pending[room, name] = None
+
+    def _take_pending(self) -> dict[tuple[str, str], TimerRecord | None]:
+        pending, self._pending = self._pending, {}
+        return pending
+
+    def _write(self, pending: dict[tuple[str, str], TimerRecord | None]) -> None:
+        if not pending:
+            return
+        upserts = [timer for timer in pending.values() if timer is not None]
+        removals = [key for key, timer in pending.items() if timer is None]
+        with self._write_lock:
+            if self._connection is None:
+                self.logger.warning("Timer store closed, dropping %d timer changes.", len(pending))
+                return
+            self._connection.execute("BEGIN")
+            try:
+                self._connection.executemany("DELETE FROM timers WHERE room = ? AND name = ?", removals)
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO timers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", upserts
+                )
+            except sqlite3.Error:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    async def flush(self) -> None:
+        async with self._lock:
+            pending = self._take_pending()
+            try:
+                await asyncio.to_thread(self._write, pending)
+            except sqlite3.Error as e:
+                self.logger.error("Failed to persist %d timer changes: %s", len(pending), e, exc_info=True)
+                # Keep newer changes that arrived while writing
+                self._pending = pending | self._pending
+
+    async def run(self) -> None:
+        """Flush queued changes periodically until cancelled, then write whatever is left."""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                if self._pending:
+                    await self.flush()
+        finally:
+            self.close()
@@ -1,33 +1,142 @@
 from datetime import datetime, timedelta
 
+from private_assistant_time_skill.locales import DEFAULT_LOCALE, LOCALES, Locale
+from private_assistant_time_skill.schedules import WEEKEND, WORKING_DAYS, Schedule
+
+# Durations below this many seconds are looked up in a phrase table
+DEFAULT_DURATION_TABLE_SECONDS = 4 * 3600
+# Unit counts up to this value are looked up when naming a timer from its hours, minutes and seconds
+UNIT_TABLE_SIZE = 1000
+
+
+class TimeFormatter:
+    """Spoken times and durations of one locale, served from phrase tables kept for the process lifetime.
+
+    The clock table holds every minute of the day and the unit tables every count below ``UNIT_TABLE_SIZE``.
+    The duration table has a slot for every duration below its bound, filled when a duration is first
+    spoken, as building all of them would dominate startup. Values outside the tables are formatted on demand.
+    """
+
+    def __init__(self, locale: Locale, duration_table_seconds: int = DEFAULT_DURATION_TABLE_SECONDS) -> None:
+        self.locale = locale
+        self._unit_phrases = {
+            unit: tuple(locale.unit(value, unit) for value in range(UNIT_TABLE_SIZE)) for unit in locale.units
+        }
+        # One phrase per minute of the day, indexed by hour * 60 + minute
+        self._clock_phrases = tuple(self._format_clock(hour, minute) for hour in range(24) for minute in range(60))
+        self.duration_table_seconds = 0
+        self._duration_phrases: list[str | None] = []
+        self.resize_duration_table(duration_table_seconds)
+
+    def resize_duration_table(self, max_seconds: int) -> None:
+        self.duration_table_seconds = max_seconds
+        self._duration_phrases = [None] * max_seconds
+
+    def _format_clock(self, hour: int, minute: int) -> str:
+        period = ""
+        if self.locale.twelve_hour:
+            period = self.locale.periods[hour // 12]
+            hour = hour % 12 or 12
+        pattern = self.locale.full_hour if minute == 0 else self.locale.past_hour
+        return pattern.format(hour=hour, minute=minute, period=period)
+
+    def _format_seconds(self, total_seconds: int) -> str:
+        hours, remainder = divmod(total_seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return self.join_units(hours, minutes, seconds)
+
+    def unit_phrase(self, value: int, unit: str) -> str:
+        """Return ``value`` with its singular or plural ``unit`` (hour, minute or second)."""
+        if 0 <= value < UNIT_TABLE_SIZE:
+            return self._unit_phrases[unit][value]
+        return self.locale.unit(value, unit)
+
+    def join_units(self, hours: int, minutes: int, seconds: int) -> str:
+        parts = []
+        if hours > 0:
+            parts.append(self.unit_phrase(hours, "hour"))
+        if minutes > 0:
+            parts.append(self.unit_phrase(minutes, "minute"))
+        if seconds > 0:
+            parts.append(self.unit_phrase(seconds, "second"))
+        return self.locale.conjunction.join(parts)
+
+    def spoken_duration(self, hours: int | None, minutes: int | None, seconds: int | None) -> str:
+        return self.join_units(hours or 0, minutes or 0, seconds or 0)
+
+    def format_time_difference(self, time_diff: timedelta) -> str:
+        total_seconds = int(time_diff.total_seconds())
+        if 0 <= total_seconds < len(self._duration_phrases):
+            phrase = self._duration_phrases[total_seconds]
+            if phrase is None:
+                phrase = self._duration_phrases[total_seconds] = self._format_seconds(total_seconds)
+            return phrase
+        return self._format_seconds(total_seconds)
+
+    def format_time_for_tts(self, time: datetime, with_date: bool = False) -> str:
+        time_str = self._clock_phrases[time.hour * 60 + time.minute]
+
+        if with_date:
+            return self.locale.date_format.format(
+                weekday=self.locale.weekdays[time.weekday()],
+                month=self.locale.months[time.month - 1],
+                day=time.day,
+                time=time_str,
+            )
+        return time_str
+
+    def format_time(self, time: datetime | None, with_date: bool = False) -> str:
+        return self.format_time_for_tts(time, with_date) if time else ""
+
+    def describe_schedule(self, schedule: Schedule) -> str:
+        """Speak a schedule's time of day with its days, e.g. "7 o'clock on weekdays" or "30 past 6"."""
+        phrases = self.locale.schedule_phrases
+        weekdays = schedule.weekdays
+        if not weekdays:
+            pattern = phrases["daily"] if schedule.repeat else phrases["once"]
+        elif schedule.repeat and weekdays == WORKING_DAYS:
+            pattern = phrases["weekdays"]
+        elif schedule.repeat and weekdays == WEEKEND:
+            pattern = phrases["weekends"]
+        else:
+            pattern = phrases["every"] if schedule.repeat else phrases["on"]
+        names = [self.locale.weekdays[day] for day in sorted(weekdays)]
+        days = self.locale.conjunction.join([", ".join(names[:-1]), names[-1]]) if len(names) > 1 else "".join(names)
+        return pattern.format(time=self._clock_phrases[schedule.hour * 60 + schedule.minute], days=days)
+
+
+# Formatters are shared by every skill instance of the process, so reconnects do not rebuild the tables
+_formatters: dict[str, TimeFormatter] = {}
+
+
+def get_formatter(
+    code: str = DEFAULT_LOCALE, duration_table_seconds: int = DEFAULT_DURATION_TABLE_SECONDS
+) -> TimeFormatter:
+    """Return the shared formatter of a locale, rebuilding its duration table if the bound changed."""
+    formatter = _formatters.get(code)
+    if formatter is None:
+        if code not in LOCALES:
+            raise ValueError(f"Unknown locale '{code}', expected one of {', '.join(LOCALES)}.")
+        formatter = _formatters[code] = TimeFormatter(LOCALES[code], duration_table_seconds)
+    elif formatter.duration_table_seconds != duration_table_seconds:
+        formatter.resize_duration_table(duration_table_seconds)
+    return formatter
+
+
+_default_formatter = get_formatter()
+
+
+def unit_phrase(value: int, unit: str) -> str:
+    return _default_formatter.unit_phrase(value, unit)
+
+
+def join_units(hours: int, minutes: int, seconds: int) -> str:
+    return _default_formatter.join_units(hours, minutes, seconds)
+
 
 def format_time_difference(time_diff: timedelta) -> str:
-    total_seconds = int(time_diff.total_seconds())
-    hours, remainder = divmod(total_seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    parts = []
-    if hours > 0:
-        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-    if minutes > 0:
-        parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-    if seconds > 0:
-        parts.append(f"{seconds} second{'s' if seconds != 1 else ''}")
-    return " and ".join(parts)
+    return _default_formatter.format_time_difference(time_diff)
 
 
 def format_time_for_tts(time: datetime, with_date: bool = False) -> str:
-    hour = time.hour
-    minute = time.minute
-    minute_threshold = 10
-
-    if minute == 0:
-        time_str = f"{hour} o'clock"
-    elif minute < minute_threshold:
-        time_str = f"{minute} past {hour}"
-    else:
-        time_str = f"{minute} past {hour}"
-
-    if with_date:
-        date_str = time.strftime("%A, %B %d")
-        return f"{date_str} at {time_str}"
-    return time_str
+    return _default_formatter.format_time_for_tts(time, with_date)
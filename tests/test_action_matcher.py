@@ -0,0 +1,35 @@
+import pytest
+
+from private_assistant_time_skill.action_matcher import ActionMatcher, tokenize
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return ActionMatcher(
+        keywords={"first": [["alpha"]], "second": [["beta", "gamma"], ["delta"]]},
+        phrases={"third": ["one two three"], "first": ["omega"]},
+        synonyms={"b": "beta"},
+    )
+
+
+def test_tokenize_strips_punctuation_and_case():
+    assert tokenize("What's the TIME?") == ["whats", "the", "time"]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("alpha", "first"),
+        ("gamma and beta", "second"),
+        ("gamma and b", "second"),
+        ("delta", "second"),
+        ("beta beta", None),
+        ("one two three", "third"),
+        ("three two one", None),
+        ("one two", None),
+        ("delta omega", "first"),
+        ("", None),
+    ],
+)
+def test_match(matcher, text, expected):
+    assert matcher.match(text) == expected
@@ -1,6 +1,6 @@
 import pytest
 
-from private_assistant_time_skill.time_skill import Action
+from private_assistant_time_skill.time_skill import Action, find_timer_label
 
 
 @pytest.mark.parametrize(
@@ -12,9 +12,56 @@ from private_assistant_time_skill.time_skill import Action
         ("list all active timers", Action.LIST),
         ("can you list the timers?", Action.LIST),
         ("delete the last timer", Action.DELETE_LAST),
+        ("cancel the previous timer", Action.DELETE_LAST),
+        ("please cancel the timer", Action.DELETE_LAST),
+        ("What's the time?", Action.CURRENT_TIME),
+        ("how late is it", Action.CURRENT_TIME),
+        ("what time is it", Action.CURRENT_TIME),
+        ("show my timers", Action.LIST),
+        ("start a timer for 5 minutes", Action.SET),
+        ("help me set a timer", Action.HELP),
+        ("wake me at 6:30", Action.SET_ALARM),
+        ("set an alarm for 7 pm", Action.SET_ALARM),
+        ("every weekday at 7", Action.SET_ALARM),
+        ("list my alarms", Action.LIST_ALARMS),
+        ("show all alarms", Action.LIST_ALARMS),
+        ("delete the alarm at 6:30", Action.DELETE_ALARM),
+        ("cancel my alarms", Action.DELETE_ALARM),
+        ("stop the alarm", Action.STOP_ALARM),
+        ("stop the timer", Action.DELETE_LAST),
+        ("stop the last timer", Action.DELETE_LAST),
+        ("pause the pasta timer", Action.PAUSE),
+        ("continue the pasta timer", Action.RESUME),
+        ("add 5 minutes to the pasta timer", Action.EXTEND),
+        ("extend the timer by 2 minutes", Action.EXTEND),
+        ("delete the pasta timer", Action.DELETE),
+        ("stop the 10 minute timer", Action.DELETE),
+        ("it is late, how", None),
         ("this should return none", None),
         ("trigger something else", None),
     ],
 )
 def test_find_matching_action(text, expected):
     assert Action.find_matching_action(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("set a pasta timer for 10 minutes", "pasta"),
+        ("add 5 minutes to the egg timer!", "egg"),
+        ("pause the timer", None),
+        ("delete the 10 minute timer", None),
+        ("set timer for 10 minutes", None),
+        ("set another timer for 10 minutes", None),
+        ("start one more timer", None),
+        ("pause the other timer", None),
+        ("delete the first timer", None),
+        ("set a second timer", None),
+        ("stop the timer for the pasta", "pasta"),
+        ("set a timer for the next 10 minutes", None),
+        ("set a timer for half an hour", None),
+    ],
+)
+def test_find_timer_label(text, expected):
+    assert find_timer_label(text) == expected
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import logging
+import pathlib
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from private_assistant_commons.messages import ClientRequest, IntentAnalysisResult, NumberAnalysisResult
+
+from private_assistant_time_skill import capture, clock, main
+
+START = datetime(2024, 1, 1, 8, 0, tzinfo=UTC).timestamp()
+INTENT_TOPIC = "assistant/intent_engine/result"
+
+
+def intent(text: str, nouns: list[str], numbers: list[NumberAnalysisResult]) -> str:
+    return IntentAnalysisResult(
+        client_request=ClientRequest(id=uuid.uuid4(), text=text, room="kitchen", output_topic="kitchen/output"),
+        numbers=numbers,
+        nouns=nouns,
+        verbs=["set"] if "timer" in nouns else [],
+    ).model_dump_json()
+
+
+def make_traffic() -> list[capture.CapturedMessage]:
+    timer = intent("set a timer for 5 minutes", ["timer"], [NumberAnalysisResult(number_token=5, next_token="minutes")])
+    current_time = intent("whats the time", ["time"], [])
+    return [
+        capture.CapturedMessage(0.0, capture.INCOMING, INTENT_TOPIC, timer),
+        capture.CapturedMessage(0.01, capture.OUTGOING, "kitchen/output", '{"text":"Timer set for 5 minutes."}'),
+        capture.CapturedMessage(60.0, capture.INCOMING, INTENT_TOPIC, current_time),
+        capture.CapturedMessage(60.03, capture.OUTGOING, "kitchen/output", '{"text":"It\'s 1 past 8"}'),
+        capture.CapturedMessage(
+            300.0,
+            capture.OUTGOING,
+            "kitchen/output",
+            '{"text":"The timer 5 minutes is due.","alert":{"play_before":true}}',
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recorder_round_trip(tmp_path: pathlib.Path):
+    recorder = capture.TrafficRecorder(tmp_path / "capture.jsonl", logging.getLogger(__name__), flush_interval=0.01)
+    traffic = make_traffic()
+    task = asyncio.create_task(recorder.run())
+    for message in traffic:
+        recorder.record(message.direction, message.topic, message.payload)
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    started, recorded = capture.read_capture(recorder.path)
+
+    assert started == pytest.approx(datetime.now(UTC).timestamp(), abs=5)
+    assert [message[1:] for message in recorded] == [message[1:] for message in traffic]
+    assert recorder.recorded == len(traffic)
+
+
+def test_read_capture_rejects_unknown_version(tmp_path: pathlib.Path):
+    path = tmp_path / "capture.jsonl"
+    path.write_text(json.dumps({"version": capture.CAPTURE_VERSION + 1, "started": START}) + "\n")
+
+    with pytest.raises(ValueError, match="Unsupported capture version"):
+        capture.read_capture(path)
+
+
+@pytest.mark.asyncio
+async def test_read_capture_joins_segments_of_restarted_recorders(tmp_path: pathlib.Path):
+    path = tmp_path / "capture.jsonl"
+    traffic = make_traffic()
+    for segment in (traffic[:2], traffic[2:]):
+        recorder = capture.TrafficRecorder(path, logging.getLogger(__name__))
+        for message in segment:
+            recorder.record(message.direction, message.topic, message.payload)
+        recorder.write(recorder._take_lines())
+    lines = path.read_text().splitlines()
+    # Place the second segment a minute after the first
+    first_header, second_header = json.loads(lines[0]), json.loads(lines[3])
+    second_header["started"] = first_header["started"] + 60
+    lines[3] = json.dumps(second_header)
+    path.write_text("\n".join(lines) + "\n")
+
+    started, recorded = capture.read_capture(path)
+
+    assert started == first_header["started"]
+    assert [message[1:] for message in recorded] == [message[1:] for message in traffic]
+    assert recorded[2].offset == pytest.approx(60, abs=1)
+
+
+def test_summarize_traffic():
+    summary = capture.summarize_traffic(make_traffic())
+
+    assert summary["requests"] == summary["responses"] == len(make_traffic()) // 2
+    assert summary["triggers"] == 1
+    assert summary["response_latency"] == {"p50_ms": 20.0, "p99_ms": 30.0, "max_ms": 30.0}
+
+
+def test_simulated_replay_reproduces_capture():
+    traffic = make_traffic()
+
+    replayed = clock.run_simulated(main.run_replay(traffic, 1.0, 1.0, None), START)
+
+    summary = capture.summarize_traffic(replayed)
+    assert (summary["requests"], summary["responses"], summary["triggers"]) == (2, 2, 1)
+    trigger = replayed[-1]
+    assert trigger.offset == pytest.approx(300.0)
+    # Simulated time starts where the capture did, so even the spoken time matches
+    assert capture.count_mismatches(traffic, replayed) == 0
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+import zoneinfo
+from datetime import UTC, datetime
+
+import jinja2
+from private_assistant_commons.messages import ClientRequest, IntentAnalysisResult, NumberAnalysisResult
+
+from private_assistant_time_skill.clock import VirtualTimeEventLoop, run_simulated
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.local_broker import LocalBroker
+from private_assistant_time_skill.schedules import parse_schedule
+from private_assistant_time_skill.time_skill import Parameters, TimeSkill
+
+START = datetime(2024, 1, 1, 8, 0, tzinfo=UTC).timestamp()
+DAY = 86400
+
+
+def test_sleep_advances_virtual_time_instantly():
+    async def sleep_a_day() -> float:
+        loop = asyncio.get_running_loop()
+        assert isinstance(loop, VirtualTimeEventLoop)
+        await asyncio.sleep(DAY)
+        # Worker threads still complete while the clock stands still
+        await asyncio.to_thread(time.sleep, 0)
+        return loop.wall_time()
+
+    wall_start = time.perf_counter()
+    assert run_simulated(sleep_a_day(), START) == START + DAY
+    assert time.perf_counter() - wall_start < 1.0
+
+
+def test_skill_runs_on_simulated_time():
+    async def scenario() -> tuple[list[tuple[float, str]], str]:
+        loop = asyncio.get_running_loop()
+        assert isinstance(loop, VirtualTimeEventLoop)
+        broker = LocalBroker()
+        observer = broker.client()
+        await observer.subscribe("kitchen/output")
+        template_env = jinja2.Environment(loader=jinja2.PackageLoader("private_assistant_time_skill", "templates"))
+        async with asyncio.TaskGroup() as task_group:
+            skill = TimeSkill(
+                TimeSkillConfig(default_time_zone="UTC"),
+                broker.client(),  # type: ignore[arg-type]
+                template_env,
+                task_group,
+                logging.getLogger("simulation"),
+                wall_clock=loop.wall_time,
+            )
+            await skill.skill_preparations()
+            client_request = ClientRequest(id=uuid.uuid4(), text="", room="kitchen", output_topic="kitchen/output")
+            for parameters in (Parameters(hours=2), Parameters(minutes=10), Parameters(hours=1)):
+                skill.register_timer(parameters, client_request)
+
+            triggers = []
+            for _ in range(3):
+                message = await observer.queue.get()
+                triggers.append((loop.time(), json.loads(message.payload)["text"]))
+
+            await skill.process_request(
+                IntentAnalysisResult(
+                    client_request=ClientRequest(
+                        id=uuid.uuid4(), text="whats the time", room="kitchen", output_topic="kitchen/output"
+                    ),
+                    numbers=[NumberAnalysisResult(number_token=1)],
+                    nouns=["time"],
+                    verbs=[],
+                )
+            )
+            current_time = json.loads((await observer.queue.get()).payload)["text"]
+            for task in asyncio.all_tasks() - {asyncio.current_task()}:
+                task.cancel()
+        return triggers, current_time
+
+    triggers, current_time = run_simulated(scenario(), START)
+
+    assert triggers == [
+        (600.0, "The timer 10 minutes is due."),
+        (3600.0, "The timer 1 hour is due."),
+        (7200.0, "The timer 2 hours is due."),
+    ]
+    assert current_time == "It's 10 o'clock"
+
+
+def test_weekday_alarm_keeps_its_wall_time_across_dst():
+    berlin = zoneinfo.ZoneInfo("Europe/Berlin")
+    # Friday before Berlin leaves daylight saving time on Sunday, October 27 2024
+    start = datetime(2024, 10, 25, 12, 0, tzinfo=berlin).timestamp()
+    fire_count = 4
+
+    async def scenario() -> list[datetime]:
+        loop = asyncio.get_running_loop()
+        assert isinstance(loop, VirtualTimeEventLoop)
+        broker = LocalBroker()
+        observer = broker.client()
+        await observer.subscribe("kitchen/output")
+        template_env = jinja2.Environment(loader=jinja2.PackageLoader("private_assistant_time_skill", "templates"))
+        async with asyncio.TaskGroup() as task_group:
+            skill = TimeSkill(
+                TimeSkillConfig(default_time_zone="Europe/Berlin"),
+                broker.client(),  # type: ignore[arg-type]
+                template_env,
+                task_group,
+                logging.getLogger("simulation"),
+                wall_clock=loop.wall_time,
+            )
+            await skill.skill_preparations()
+            client_request = ClientRequest(id=uuid.uuid4(), text="", room="kitchen", output_topic="kitchen/output")
+            skill.register_alarm(Parameters(schedule=parse_schedule("every weekday at 7")), client_request)
+
+            fires = []
+            for _ in range(fire_count):
+                await observer.queue.get()
+                fires.append(datetime.fromtimestamp(loop.wall_time(), berlin))
+            for task in asyncio.all_tasks() - {asyncio.current_task()}:
+                task.cancel()
+        return fires
+
+    fires = run_simulated(scenario(), start)
+
+    assert [(fire.day, fire.hour, fire.minute) for fire in fires] == [(28, 7, 0), (29, 7, 0), (30, 7, 0), (31, 7, 0)]
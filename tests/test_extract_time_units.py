@@ -1,9 +1,14 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 import pytest
 
+from private_assistant_time_skill.locales import LOCALES
 from private_assistant_time_skill.tools_time_units import (
+    TimeFormatter,
     format_time_difference,
+    format_time_for_tts,
+    get_formatter,
+    unit_phrase,
 )
 
 
@@ -22,3 +27,53 @@ from private_assistant_time_skill.tools_time_units import (
 def test_format_time_difference(time_diff, expected_output):
     result = format_time_difference(time_diff)
     assert result == expected_output
+
+
+@pytest.mark.parametrize(
+    "time, expected_output",
+    [
+        (datetime(2024, 3, 1, 0, 0), "0 o'clock"),
+        (datetime(2024, 3, 1, 7, 5), "5 past 7"),
+        (datetime(2024, 3, 1, 23, 59), "59 past 23"),
+    ],
+)
+def test_format_time_for_tts(time, expected_output):
+    assert format_time_for_tts(time) == expected_output
+    assert format_time_for_tts(time, with_date=True) == f"Friday, March 01 at {expected_output}"
+
+
+def test_format_time_difference_beyond_phrase_table():
+    formatter = TimeFormatter(LOCALES["en"], duration_table_seconds=60)
+
+    assert formatter.format_time_difference(timedelta(seconds=59)) == "59 seconds"
+    assert formatter.format_time_difference(timedelta(hours=1, seconds=1)) == "1 hour and 1 second"
+
+
+@pytest.mark.parametrize("value, expected_output", [(1, "1 minute"), (2, "2 minutes"), (5000, "5000 minutes")])
+def test_unit_phrase(value, expected_output):
+    assert unit_phrase(value, "minute") == expected_output
+
+
+@pytest.mark.parametrize(
+    "code, expected_output",
+    [
+        ("en", "Friday, March 01 at 3 past 15"),
+        ("en-US", "Friday, March 1 at 3 past 3 p.m."),
+        ("de", "Freitag, 1. März um 15 Uhr 3"),
+    ],
+)
+def test_localized_date(code, expected_output):
+    assert get_formatter(code).format_time_for_tts(datetime(2024, 3, 1, 15, 3), with_date=True) == expected_output
+
+
+def test_unknown_locale():
+    with pytest.raises(ValueError, match="Unknown locale"):
+        get_formatter("xx")
+
+
+def test_duration_phrases_are_kept_once_spoken():
+    formatter = TimeFormatter(LOCALES["en"], duration_table_seconds=60)
+
+    first = formatter.format_time_difference(timedelta(seconds=42))
+
+    assert formatter.format_time_difference(timedelta(seconds=42)) is first
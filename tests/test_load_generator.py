@@ -0,0 +1,34 @@
+import pytest
+
+from private_assistant_time_skill import load_generator, main
+
+
+@pytest.mark.parametrize(
+    "mix, expected",
+    [
+        ("set=4,list=1", {"set": 4.0, "list": 1.0}),
+        ("SET, current_time=0.5", {"set": 1.0, "current_time": 0.5}),
+    ],
+)
+def test_parse_mix(mix, expected):
+    assert load_generator.parse_mix(mix) == expected
+
+
+def test_parse_mix_rejects_unknown_action():
+    with pytest.raises(ValueError, match="Unknown action"):
+        load_generator.parse_mix("set=1,snooze=2")
+
+
+@pytest.mark.asyncio
+async def test_embedded_load_test_reports_responses_and_triggers():
+    profile = load_generator.LoadProfile(
+        rooms=3, duration=0.5, rate=10, mix={"set": 1, "list": 1}, timer_durations=[1], drain=1.5
+    )
+
+    report = await main.run_load_test(profile, config_path=None)
+
+    assert report.requests_sent > 0
+    assert report.responses == report.requests_sent
+    assert report.triggers > 0
+    assert len(report.trigger_lateness) == report.triggers
+    assert report.summary()["response_latency"]
@@ -0,0 +1,51 @@
+import asyncio
+import unittest
+
+from private_assistant_time_skill.local_broker import LocalBroker, SocketBroker, SocketClient
+
+
+class TestLocalBroker(unittest.IsolatedAsyncioTestCase):
+    async def test_routes_to_matching_subscriptions(self):
+        broker = LocalBroker()
+        kitchen = broker.client()
+        everything = broker.client()
+        await kitchen.subscribe("assistant/kitchen/+")
+        await everything.subscribe("assistant/#")
+
+        publisher = broker.client()
+        await publisher.publish("assistant/kitchen/output", payload="ready")
+        await publisher.publish("assistant/office/output", payload=b"busy")
+
+        message = await asyncio.wait_for(anext(kitchen.messages), timeout=1)
+        self.assertEqual((message.topic.value, message.payload), ("assistant/kitchen/output", b"ready"))
+        self.assertTrue(kitchen.queue.empty())
+        self.assertEqual(everything.queue.qsize(), 2)
+        self.assertEqual(broker.published, 2)
+
+    async def test_unsubscribe_stops_delivery(self):
+        broker = LocalBroker()
+        client = broker.client()
+        await client.subscribe("topic")
+        await client.unsubscribe("topic")
+        await client.publish("topic", payload="ignored")
+
+        self.assertTrue(client.queue.empty())
+
+    async def test_socket_broker_routes_between_connections(self):
+        async with (
+            SocketBroker() as broker,
+            SocketClient(broker.host, broker.port) as kitchen,
+            SocketClient(broker.host, broker.port) as other,
+        ):
+            await kitchen.subscribe("assistant/kitchen/+")
+            in_process = broker.client()
+            await in_process.subscribe("assistant/#")
+
+            await other.publish("assistant/kitchen/output", payload="ready")
+            await other.publish("assistant/office/output", payload=b"busy")
+
+            message = await asyncio.wait_for(anext(kitchen.messages), timeout=1)
+            self.assertEqual((message.topic.value, message.payload), ("assistant/kitchen/output", b"ready"))
+            office = [await asyncio.wait_for(in_process.queue.get(), timeout=1) for _ in range(2)][1]
+            self.assertEqual(office.payload, b"busy")
+            self.assertTrue(kitchen.queue.empty())
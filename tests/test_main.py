@@ -0,0 +1,48 @@
+import pathlib
+from unittest.mock import AsyncMock
+
+import pytest
+from typer.testing import CliRunner
+
+from private_assistant_time_skill import main, service
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["config.yaml", "--shard-id", "a"],
+        ["--shard-id", "a", "config.yaml"],
+        ["main", "config.yaml", "--shard-id", "a"],
+    ],
+)
+def test_main_is_the_default_command(monkeypatch: pytest.MonkeyPatch, args: list[str]):
+    start_skill = AsyncMock()
+    monkeypatch.setattr(service, "start_skill", start_skill)
+
+    result = CliRunner().invoke(main.app, args)
+
+    assert result.exit_code == 0, result.output
+    start_skill.assert_awaited_once_with(
+        pathlib.Path("config.yaml"), None, service.DEFAULT_PROFILE_RATE, "a", None, None
+    )
+
+
+def test_commands_are_still_dispatched(tmp_path: pathlib.Path):
+    result = CliRunner().invoke(main.app, ["compile-templates", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert result.output.startswith("Compiled ")
+    assert list(tmp_path.glob("*.py"))
+
+
+def test_main_reads_config_path_from_environment(monkeypatch: pytest.MonkeyPatch):
+    start_skill = AsyncMock()
+    monkeypatch.setattr(service, "start_skill", start_skill)
+    monkeypatch.setenv(service.CONFIG_PATH_ENV, "config.yaml")
+
+    result = CliRunner().invoke(main.app, [])
+
+    assert result.exit_code == 0, result.output
+    start_skill.assert_awaited_once_with(
+        pathlib.Path("config.yaml"), None, service.DEFAULT_PROFILE_RATE, None, None, None
+    )
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import socket
+
+import pytest
+
+from private_assistant_time_skill.metrics import Histogram, MetricsRegistry, serve_prometheus
+
+
+def test_histogram_cumulative_buckets():
+    histogram = Histogram([0.1, 1.0])
+    values = (-0.5, 0.05, 0.1, 0.5, 2.0)
+    for value in values:
+        histogram.observe(value)
+
+    assert histogram.cumulative_counts() == [(0.1, 3), (1.0, 4), (float("inf"), 5)]
+    assert histogram.count == len(values)
+    assert histogram.sum == pytest.approx(2.15)
+
+
+@pytest.mark.parametrize("fraction, expected", [(0.5, 0.1), (0.8, 1.0), (1.0, float("inf"))])
+def test_histogram_quantile(fraction, expected):
+    histogram = Histogram([0.1, 1.0])
+    for value in (0.05, 0.1, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.quantile(fraction) == expected
+
+
+def test_empty_histogram_quantile():
+    assert Histogram().quantile(0.99) == 0.0
+
+
+def test_registry_returns_same_metric_for_name_and_labels():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", action="set")
+    counter.inc()
+
+    assert registry.counter("requests_total", "Requests.", action="set") is counter
+    assert registry.counter("requests_total", "Requests.", action="list") is not counter
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("requests_total", "Requests.")
+
+
+def test_render_prometheus():
+    registry = MetricsRegistry()
+    registry.counter("failures_total", "Failures.").inc(3)
+    registry.gauge("active", "Active.", function=lambda: 7)
+    registry.histogram("duration_seconds", "Duration.", [0.1], action="set").observe(0.05)
+
+    assert registry.render_prometheus() == (
+        "# HELP failures_total Failures.\n"
+        "# TYPE failures_total counter\n"
+        "failures_total 3\n"
+        "# HELP active Active.\n"
+        "# TYPE active gauge\n"
+        "active 7\n"
+        "# HELP duration_seconds Duration.\n"
+        "# TYPE duration_seconds histogram\n"
+        'duration_seconds_bucket{action="set",le="0.1"} 1\n'
+        'duration_seconds_bucket{action="set",le="+Inf"} 1\n'
+        'duration_seconds_sum{action="set"} 0.05\n'
+        'duration_seconds_count{action="set"} 1\n'
+    )
+
+
+def test_snapshot():
+    registry = MetricsRegistry()
+    registry.gauge("active", "Active.").set(2)
+    registry.histogram("duration_seconds", "Duration.", [0.1, 1.0], action="set").observe(0.5)
+
+    assert registry.snapshot() == {
+        "active": [{"value": 2}],
+        "duration_seconds": [{"action": "set", "count": 1, "sum": 0.5, "p50": 1.0, "p99": 1.0}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_serve_prometheus():
+    registry = MetricsRegistry()
+    registry.counter("failures_total", "Failures.").inc()
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = asyncio.create_task(serve_prometheus(registry, "127.0.0.1", port, logging.getLogger(__name__)))
+    try:
+        for _ in range(50):
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                break
+            except ConnectionError:
+                await asyncio.sleep(0.01)
+        writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+    finally:
+        server.cancel()
+
+    assert response.startswith(b"HTTP/1.1 200 OK")
+    assert response.endswith(b"failures_total 1\n")
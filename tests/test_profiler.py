@@ -0,0 +1,47 @@
+import asyncio
+import logging
+import pathlib
+
+import pytest
+
+from private_assistant_time_skill.profiler import StageProfiler
+
+
+def make_profiler(tmp_path: pathlib.Path, sample_rate: float) -> StageProfiler:
+    return StageProfiler(tmp_path / "profile.folded", sample_rate, logging.getLogger(__name__), flush_interval=0.01)
+
+
+def test_sample_rate_bounds(tmp_path: pathlib.Path):
+    assert make_profiler(tmp_path, 0.0).sample() is None
+    assert make_profiler(tmp_path, 1.0).sample() is not None
+
+
+def test_samples_accumulate_per_stack(tmp_path: pathlib.Path):
+    profiler = make_profiler(tmp_path, 1.0)
+    sample_count = 2
+    for _ in range(sample_count):
+        sample = profiler.sample()
+        assert sample is not None
+        sample.mark("match")
+        sample.mark("render")
+        sample.finish("process_request;help")
+
+    stacks = [line.rsplit(" ", 1)[0] for line in profiler.folded().splitlines()]
+    assert stacks == ["process_request;help;match", "process_request;help;render"]
+    assert profiler.samples == sample_count
+
+
+@pytest.mark.asyncio
+async def test_run_writes_folded_file(tmp_path: pathlib.Path):
+    profiler = make_profiler(tmp_path, 1.0)
+    sample = profiler.sample()
+    assert sample is not None
+    sample.mark("render")
+    sample.finish("publish_triggered_timer")
+
+    task = asyncio.create_task(profiler.run())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert profiler.output_path.read_text().startswith("publish_triggered_timer;render ")
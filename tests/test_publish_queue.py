@@ -0,0 +1,83 @@
+import asyncio
+import contextlib
+from unittest.mock import Mock
+
+import pytest
+
+from private_assistant_time_skill.publish_queue import PublishQueue
+
+
+class Recorder:
+    """Publish callback that records messages and can be held to let the queue fill up."""
+
+    def __init__(self) -> None:
+        self.published: list[tuple[str, str]] = []
+        self.released = asyncio.Event()
+        self.released.set()
+
+    async def publish(self, topic: str, payload: str) -> None:
+        await self.released.wait()
+        self.published.append((topic, payload))
+
+
+@contextlib.asynccontextmanager
+async def running(queue: PublishQueue):
+    task = asyncio.create_task(queue.run())
+    try:
+        yield queue
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_messages_of_a_topic_keep_their_order():
+    recorder = Recorder()
+    message_count = 20
+    async with running(PublishQueue(recorder.publish, Mock(), workers=4, batch_size=3)) as queue:
+        for i in range(message_count):
+            await queue.put(f"room-{i % 5}/output", str(i))
+        await queue.join()
+
+    assert len(recorder.published) == message_count
+    for room in range(5):
+        payloads = [int(payload) for topic, payload in recorder.published if topic == f"room-{room}/output"]
+        assert payloads == sorted(payloads)
+    assert queue.latency.count == message_count
+
+
+@pytest.mark.asyncio
+async def test_offer_sheds_when_full():
+    recorder = Recorder()
+    recorder.released.clear()
+    logger = Mock()
+    max_size = 2
+    queue = PublishQueue(recorder.publish, logger, max_size=max_size, workers=1)
+
+    accepted = [queue.offer("kitchen/output", str(i)) for i in range(max_size + 1)]
+
+    assert accepted == [True, True, False]
+    assert len(queue) == max_size
+    assert queue.shed.value == 1
+    logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_put_waits_for_space():
+    recorder = Recorder()
+    recorder.released.clear()
+    async with running(PublishQueue(recorder.publish, Mock(), max_size=1, workers=1, batch_size=1)) as queue:
+        await queue.put("kitchen/output", "first")
+        await asyncio.sleep(0)
+        # The worker holds the first message, the second fills the queue and the third has to wait
+        await queue.put("kitchen/output", "second")
+        blocked = asyncio.create_task(queue.put("kitchen/output", "third"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        recorder.released.set()
+        await blocked
+        await queue.join()
+
+    assert [payload for _, payload in recorder.published] == ["first", "second", "third"]
@@ -0,0 +1,30 @@
+from private_assistant_time_skill.response_cache import ResponseCache
+
+
+def test_get_returns_put_answer_per_action_and_key():
+    cache = ResponseCache()
+    cache.put("set", "5 minutes", "Timer set for 5 minutes.")
+
+    assert cache.get("set", "5 minutes") == "Timer set for 5 minutes."
+    assert cache.get("set", "10 minutes") is None
+    assert cache.get("help", "5 minutes") is None
+
+
+def test_invalidate_drops_only_that_action():
+    cache = ResponseCache()
+    cache.put("current_time", 1, "It's 1 past 8")
+    cache.put("help", (), "Help")
+
+    cache.invalidate("current_time")
+
+    assert cache.get("current_time", 1) is None
+    assert cache.get("help", ()) == "Help"
+
+
+def test_full_cache_starts_over():
+    cache = ResponseCache(max_entries=2)
+    for key in range(3):
+        cache.put("set", key, str(key))
+
+    assert len(cache) == 1
+    assert cache.get("set", 2) == "2"
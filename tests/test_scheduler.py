@@ -0,0 +1,108 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import Mock
+
+from private_assistant_time_skill.scheduler import TimerScheduler
+
+
+class TestTimerScheduler(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.fired = []
+        self.scheduler = TimerScheduler(self.fired.append, Mock())
+        self.run_task = asyncio.create_task(self.scheduler.run())
+
+    async def asyncTearDown(self):
+        self.run_task.cancel()
+        await asyncio.gather(self.run_task, return_exceptions=True)
+
+    async def test_fires_in_deadline_order(self):
+        self.scheduler.schedule("late", 0.03)
+        self.scheduler.schedule("early", 0.01)
+        await asyncio.sleep(0.06)
+
+        self.assertEqual(self.fired, ["early", "late"])
+        self.assertEqual(len(self.scheduler), 0)
+
+    async def test_insert_wakes_sleeping_loop(self):
+        self.scheduler.schedule("long", 60)
+        await asyncio.sleep(0)
+        self.scheduler.schedule("short", 0.01)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.fired, ["short"])
+        self.assertIn("long", self.scheduler)
+
+    async def test_cancel_prevents_fire(self):
+        self.scheduler.schedule("cancelled", 0.01)
+        self.assertTrue(self.scheduler.cancel("cancelled"))
+        self.assertFalse(self.scheduler.cancel("cancelled"))
+        await asyncio.sleep(0.03)
+
+        self.assertEqual(self.fired, [])
+
+    async def test_reschedule_replaces_entry(self):
+        self.scheduler.schedule("timer", 0.01)
+        self.scheduler.schedule("timer", 60)
+        await asyncio.sleep(0.03)
+
+        self.assertEqual(self.fired, [])
+        time_left = self.scheduler.time_left("timer")
+        assert time_left is not None
+        self.assertGreater(time_left, 59)
+
+    async def test_postpone_moves_deadline(self):
+        deadline = self.scheduler.schedule("timer", 0.01)
+        self.assertEqual(self.scheduler.postpone("timer", 60), deadline + 60)
+        self.assertIsNone(self.scheduler.postpone("unknown", 60))
+        await asyncio.sleep(0.03)
+
+        self.assertEqual(self.fired, [])
+        self.assertEqual(len(self.scheduler), 1)
+
+    async def test_mass_cancel_compacts_heap(self):
+        for i in range(100):
+            self.scheduler.schedule(f"timer-{i}", 60)
+        for i in range(100):
+            self.scheduler.cancel(f"timer-{i}")
+
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertLessEqual(len(self.scheduler._heap), 1)
+
+    async def test_records_lateness(self):
+        self.scheduler.schedule("blocked", 0.01)
+        await asyncio.sleep(0)
+        # Stall the loop past the deadline
+        time.sleep(0.05)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.fired, ["blocked"])
+        self.assertEqual(self.scheduler.lateness.count, 1)
+        self.assertGreaterEqual(self.scheduler.lateness.sum, 0.03)
+
+
+class TestTimerSchedulerDriftCompensation(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.fired = []
+        self.scheduler = TimerScheduler(self.fired.append, Mock(), compensate_drift=True)
+        self.run_task = asyncio.create_task(self.scheduler.run())
+
+    async def asyncTearDown(self):
+        self.run_task.cancel()
+        await asyncio.gather(self.run_task, return_exceptions=True)
+
+    async def test_wakeup_lead_follows_loop_lag(self):
+        self.scheduler.schedule("stalled", 0.01)
+        await asyncio.sleep(0)
+        time.sleep(0.05)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.fired, ["stalled"])
+        self.assertGreater(self.scheduler.wakeup_lead, 0.0)
+
+    async def test_fires_entries_due_within_lead(self):
+        self.scheduler.wakeup_lead = 0.1
+        self.scheduler.schedule("early", 0.2)
+        await asyncio.sleep(0.15)
+
+        self.assertEqual(self.fired, ["early"])
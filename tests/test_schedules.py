@@ -0,0 +1,71 @@
+import zoneinfo
+from datetime import datetime
+
+import pytest
+
+from private_assistant_time_skill.schedules import WEEKEND, WORKING_DAYS, Schedule, parse_schedule
+
+BERLIN = zoneinfo.ZoneInfo("Europe/Berlin")
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("wake me at 6:30", Schedule(6, 30)),
+        ("set an alarm for 7 pm", Schedule(19, 0)),
+        ("alarm at 12 a.m.", Schedule(0, 0)),
+        ("every weekday at 7", Schedule(7, 0, WORKING_DAYS, True)),
+        ("wake me at 9.15 on weekends", Schedule(9, 15, WEEKEND, True)),
+        ("wake me on monday at 7 o'clock", Schedule(7, 0, frozenset({0}), False)),
+        ("alarm at 8 on mondays and fridays", Schedule(8, 0, frozenset({0, 4}), True)),
+        ("daily alarm at 6", Schedule(6, 0, frozenset(), True)),
+        ("set an alarm", None),
+        ("wake me at 25", None),
+        ("wake me at 13 pm", None),
+        ("set an alarm for 10 minutes", None),
+        ("set an alarm for 8 hours", None),
+        ("alarm for 1 hour", None),
+        ("alarm for 30 seconds", None),
+        ("set an alarm for 5 minutes at 7", Schedule(7, 0)),
+    ],
+)
+def test_parse_schedule(text, expected):
+    assert parse_schedule(text) == expected
+
+
+def test_spec_round_trip():
+    schedule = Schedule(7, 5, WORKING_DAYS, True)
+
+    assert schedule.to_spec() == "07:05/01234/1"
+    assert Schedule.from_spec(schedule.to_spec()) == schedule
+
+
+def test_weekday_schedule_skips_the_weekend():
+    friday_evening = datetime(2024, 10, 25, 20, 0, tzinfo=BERLIN).timestamp()
+
+    next_fire = Schedule(7, 0, WORKING_DAYS, True).next_fire(friday_evening, BERLIN)
+
+    assert datetime.fromtimestamp(next_fire, BERLIN) == datetime(2024, 10, 28, 7, 0, tzinfo=BERLIN)
+
+
+def test_next_fire_keeps_wall_time_across_dst_changes():
+    schedule = Schedule(7, 0, frozenset(), True)
+    # Berlin leaves daylight saving time in the night to Sunday, October 27 2024
+    fire = datetime(2024, 10, 26, 7, 0, tzinfo=BERLIN).timestamp()
+    fires = []
+    for _ in range(3):
+        fire = schedule.next_fire(fire, BERLIN)
+        fires.append(fire)
+
+    assert [datetime.fromtimestamp(fire, BERLIN).hour for fire in fires] == [7, 7, 7]
+    # The day of the change has 25 hours
+    assert fires[1] - fires[0] == 24 * 3600
+    assert fires[0] - datetime(2024, 10, 26, 7, 0, tzinfo=BERLIN).timestamp() == 25 * 3600
+
+
+def test_time_in_spring_forward_gap_fires_after_the_gap():
+    before = datetime(2024, 3, 30, 12, 0, tzinfo=BERLIN).timestamp()
+
+    next_fire = Schedule(2, 30).next_fire(before, BERLIN)
+
+    assert datetime.fromtimestamp(next_fire, BERLIN).replace(tzinfo=None) == datetime(2024, 3, 31, 3, 30)
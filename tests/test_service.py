@@ -0,0 +1,72 @@
+import logging
+import pathlib
+import subprocess
+import sys
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from private_assistant_time_skill import service
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.time_skill import Parameters, TimeSkill
+from private_assistant_time_skill.tools_time_units import get_formatter
+
+
+def test_compiled_templates_render_like_package_templates(tmp_path: pathlib.Path):
+    names = service.compile_templates(tmp_path)
+    package_env = service.create_template_env()
+    compiled_env = service.create_template_env(tmp_path)
+    parameters = Parameters(
+        minutes=5,
+        label="pasta",
+        is_deleted=True,
+        timers=[{"id": "pasta", "time_left": "4 minutes"}],
+        alarms=[{"id": "30 past 6"}],
+        current_time=datetime(2024, 3, 1, 7, 5),
+    )
+    locale = get_formatter()
+
+    assert "set.j2" in names
+    assert "de/help.j2" in names
+    assert list(tmp_path.glob("__pycache__/*.pyc"))
+    for name in names:
+        compiled = compiled_env.get_template(name).render(parameters=parameters, locale=locale)
+        assert compiled == package_env.get_template(name).render(parameters=parameters, locale=locale), name
+
+
+def test_skill_loads_every_template_from_compiled_modules(tmp_path: pathlib.Path):
+    service.compile_templates(tmp_path)
+    logger = Mock(spec=logging.Logger)
+
+    skill = TimeSkill(
+        TimeSkillConfig(client_locales={"kitchen": "de"}),
+        Mock(),
+        service.create_template_env(tmp_path),
+        Mock(),
+        logger,
+    )
+    skill._load_templates()
+
+    logger.error.assert_not_called()
+    assert all(len(templates) == len(skill.action_to_template["en"]) for templates in skill.action_to_template.values())
+
+
+def test_service_does_not_import_the_cli():
+    modules = subprocess.run(
+        [sys.executable, "-c", "import sys, private_assistant_time_skill.service; print(*sorted(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    assert "typer" not in modules
+    assert "rich" not in modules
+
+
+def test_run_requires_config_path(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv(service.CONFIG_PATH_ENV, raising=False)
+    monkeypatch.setattr(sys, "argv", ["private-assistant-time-skill-service"])
+
+    with pytest.raises(SystemExit, match=service.CONFIG_PATH_ENV):
+        service.run()
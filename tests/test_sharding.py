@@ -0,0 +1,239 @@
+import asyncio
+import collections
+import json
+import logging
+import os
+import pathlib
+import sys
+import uuid
+from unittest.mock import Mock
+
+import jinja2
+import pytest
+from private_assistant_commons.messages import ClientRequest, IntentAnalysisResult, NumberAnalysisResult
+
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.local_broker import LocalBroker, SocketBroker, SocketClient
+from private_assistant_time_skill.schedules import WORKING_DAYS, Schedule
+from private_assistant_time_skill.sharding import HashRing
+from private_assistant_time_skill.time_skill import Parameters, TimeSkill
+
+ROOMS = [f"room-{i}" for i in range(200)]
+HEARTBEAT_INTERVAL = 0.05
+# Separate processes start and schedule less predictably than tasks on one loop
+PROCESS_HEARTBEAT_INTERVAL = 0.1
+PROCESS_ROOMS = ROOMS[:40]
+
+
+def test_ring_spreads_rooms_over_members():
+    ring = HashRing(["a", "b", "c"])
+    owners = [ring.owner(room) for room in ROOMS]
+
+    for member in "abc":
+        assert owners.count(member) > len(ROOMS) / 6
+
+
+def test_joining_member_only_takes_rooms():
+    before = HashRing(["a", "b"])
+    after = HashRing(["a", "b", "c"])
+
+    for room in ROOMS:
+        assert after.owner(room) in (before.owner(room), "c")
+
+
+def test_empty_ring_has_no_owner():
+    assert HashRing([]).owner("kitchen") is None
+
+
+class ShardInstance:
+    """One sharded skill on the local broker, with its own store connection as a separate process would have."""
+
+    def __init__(self, broker: LocalBroker, store_path: pathlib.Path, instance_id: str) -> None:
+        self.tasks: list[asyncio.Task] = []
+        task_group = Mock()
+        task_group.create_task.side_effect = self._create_task
+        self.client = broker.client()
+        config_obj = TimeSkillConfig(
+            timer_store_path=store_path,
+            timer_store_flush_interval=0.01,
+            shard_instance_id=instance_id,
+            shard_heartbeat_interval=HEARTBEAT_INTERVAL,
+            shard_member_timeout=HEARTBEAT_INTERVAL * 4,
+        )
+        template_env = jinja2.Environment(loader=jinja2.PackageLoader("private_assistant_time_skill", "templates"))
+        self.skill = TimeSkill(config_obj, self.client, template_env, task_group, logging.getLogger(instance_id))  # type: ignore[arg-type]
+
+    def _create_task(self, coro):
+        task = asyncio.get_running_loop().create_task(coro)
+        self.tasks.append(task)
+        return task
+
+    async def start(self) -> None:
+        await self.skill.setup_mqtt_subscriptions()
+        await self.skill.skill_preparations()
+        self._create_task(self.skill.listen_to_messages(self.client))  # type: ignore[arg-type]
+
+    async def stop(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    def rooms(self) -> set[str]:
+        return set(self.skill.active_timers)
+
+    def alarm_rooms(self) -> set[str]:
+        return set(self.skill.alarms)
+
+
+@pytest.mark.asyncio
+async def test_instances_split_and_hand_off_rooms(tmp_path: pathlib.Path):
+    broker = LocalBroker()
+    first = ShardInstance(broker, tmp_path / "timers.sqlite3", "first")
+    second = ShardInstance(broker, tmp_path / "timers.sqlite3", "second")
+    try:
+        await first.start()
+        await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+        for room in ROOMS:
+            client_request = ClientRequest(id=uuid.uuid4(), text="", room=room, output_topic=f"{room}/output")
+            first.skill.register_timer(Parameters(minutes=10), client_request)
+
+        # A joining instance takes over its share of the rooms through the shared store
+        await second.start()
+        await asyncio.sleep(HEARTBEAT_INTERVAL * 4)
+        assert first.rooms().isdisjoint(second.rooms())
+        assert first.rooms() | second.rooms() == set(ROOMS)
+        assert second.rooms()
+        assert all(second.skill.shard_coordinator.owns(room) for room in second.rooms())  # type: ignore[union-attr]
+
+        # Only the owning instance answers requests from a room
+        intent_analysis_result = Mock(nouns=["timer"])
+        intent_analysis_result.client_request.room = next(iter(second.rooms()))
+        assert await first.skill.calculate_certainty(intent_analysis_result) == 0.0
+        assert await second.skill.calculate_certainty(intent_analysis_result) == 1.0
+
+        # Once it leaves, the remaining instance adopts the rooms again
+        await second.stop()
+        await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+        assert first.rooms() == set(ROOMS)
+    finally:
+        await first.stop()
+        await second.stop()
+
+
+@pytest.mark.asyncio
+async def test_instances_hand_off_rooms_with_only_alarms(tmp_path: pathlib.Path):
+    broker = LocalBroker()
+    first = ShardInstance(broker, tmp_path / "timers.sqlite3", "first")
+    second = ShardInstance(broker, tmp_path / "timers.sqlite3", "second")
+    try:
+        await first.start()
+        await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+        for room in ROOMS:
+            client_request = ClientRequest(id=uuid.uuid4(), text="", room=room, output_topic=f"{room}/output")
+            first.skill.register_alarm(Parameters(schedule=Schedule(7, 0, WORKING_DAYS, True)), client_request)
+
+        # Rooms without timers are released as well, so no alarm is scheduled by both instances
+        await second.start()
+        await asyncio.sleep(HEARTBEAT_INTERVAL * 4)
+        assert first.alarm_rooms().isdisjoint(second.alarm_rooms())
+        assert first.alarm_rooms() | second.alarm_rooms() == set(ROOMS)
+        assert second.alarm_rooms()
+        assert len(first.skill.scheduler) + len(second.skill.scheduler) == len(ROOMS)
+    finally:
+        await first.stop()
+        await second.stop()
+
+
+def process_config(store_path: pathlib.Path, instance_id: str) -> TimeSkillConfig:
+    return TimeSkillConfig(
+        timer_store_path=store_path,
+        timer_store_flush_interval=0.01,
+        shard_instance_id=instance_id,
+        shard_heartbeat_interval=PROCESS_HEARTBEAT_INTERVAL,
+        shard_member_timeout=PROCESS_HEARTBEAT_INTERVAL * 20,
+    )
+
+
+async def run_shard_process(port: int, store_path: pathlib.Path, instance_id: str) -> None:
+    """Run one sharded skill against a ``SocketBroker`` until the process is terminated."""
+    template_env = jinja2.Environment(loader=jinja2.PackageLoader("private_assistant_time_skill", "templates"))
+    async with SocketClient("127.0.0.1", port) as client, asyncio.TaskGroup() as task_group:
+        config_obj = process_config(store_path, instance_id)
+        skill = TimeSkill(config_obj, client, template_env, task_group, logging.getLogger(instance_id))  # type: ignore[arg-type]
+        await skill.setup_mqtt_subscriptions()
+        await skill.skill_preparations()
+        await skill.listen_to_messages(client)  # type: ignore[arg-type]
+
+
+async def wait_for_members(observer, shard_topic: str, members: set[str]) -> None:
+    seen: set[str] = set()
+    while seen != members:
+        message = await observer.queue.get()
+        if message.topic.matches(shard_topic):
+            seen.add(json.loads(message.payload)["instance"])
+
+
+@pytest.mark.asyncio
+async def test_processes_answer_and_fire_each_room_once(tmp_path: pathlib.Path):
+    config_obj = process_config(tmp_path / "timers.sqlite3", "observer")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    async with SocketBroker() as broker:
+        observer = broker.client()
+        await observer.subscribe(config_obj.shard_topic)
+        await observer.subscribe("+/output")
+        processes = []
+        try:
+            for instance_id in ("first", "second"):
+                # The child keeps its own copy of the log file descriptor
+                with (tmp_path / f"{instance_id}.log").open("w") as log:
+                    processes.append(
+                        await asyncio.create_subprocess_exec(
+                            sys.executable,
+                            __file__,
+                            str(broker.port),
+                            str(config_obj.timer_store_path),
+                            instance_id,
+                            env=env,
+                            stderr=log,
+                        )
+                    )
+            await asyncio.wait_for(wait_for_members(observer, config_obj.shard_topic, {"first", "second"}), 30)
+            # Both instances are ready once a heartbeat interval passed after they learned of each other
+            await asyncio.sleep(PROCESS_HEARTBEAT_INTERVAL * 5)
+
+            publisher = broker.client()
+            for room in PROCESS_ROOMS:
+                payload = IntentAnalysisResult(
+                    client_request=ClientRequest(
+                        id=uuid.uuid4(), text="set a timer for 1 second", room=room, output_topic=f"{room}/output"
+                    ),
+                    numbers=[NumberAnalysisResult(number_token=1, next_token="second")],
+                    nouns=["timer"],
+                    verbs=["set"],
+                ).model_dump_json()
+                await publisher.publish(config_obj.intent_analysis_result_topic, payload)
+
+            answers: collections.Counter[str] = collections.Counter()
+            triggers: collections.Counter[str] = collections.Counter()
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 3.0
+            while loop.time() < deadline:
+                try:
+                    message = await asyncio.wait_for(observer.queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+                if message.topic.matches("+/output"):
+                    room = message.topic.value.removesuffix("/output")
+                    (triggers if "alert" in json.loads(message.payload) else answers)[room] += 1
+        finally:
+            for process in processes:
+                process.terminate()
+                await process.wait()
+
+    logs = "".join(path.read_text() for path in tmp_path.glob("*.log"))
+    assert answers == dict.fromkeys(PROCESS_ROOMS, 1), logs
+    assert triggers == dict.fromkeys(PROCESS_ROOMS, 1), logs
+
+
+if __name__ == "__main__":
+    asyncio.run(run_shard_process(int(sys.argv[1]), pathlib.Path(sys.argv[2]), sys.argv[3]))
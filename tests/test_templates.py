@@ -1,7 +1,11 @@
+from datetime import datetime
+
 import jinja2
 import pytest
 
+from private_assistant_time_skill.schedules import WORKING_DAYS, Schedule
 from private_assistant_time_skill.time_skill import Parameters
+from private_assistant_time_skill.tools_time_units import get_formatter
 
 
 # Fixture to set up the Jinja environment
@@ -15,9 +19,9 @@ def jinja_env():
     )
 
 
-def get_template_output(template_name, parameters, env):
+def get_template_output(template_name, parameters, env, locale="en"):
     template = env.get_template(template_name)
-    return template.render(parameters=parameters)
+    return template.render(parameters=parameters, locale=get_formatter(locale))
 
 
 # Test for set.j2 template
@@ -38,6 +42,7 @@ def get_template_output(template_name, parameters, env):
             Parameters(hours=1, minutes=1, seconds=1),
             "Timer set for 1 hour and 1 minute and 1 second.",
         ),
+        (Parameters(minutes=10, label="pasta"), "Timer pasta set for 10 minutes."),
     ],
 )
 def test_set_template(jinja_env, parameters, expected_output):
@@ -64,6 +69,10 @@ def test_set_template(jinja_env, parameters, expected_output):
             "Timer 5 minutes will be due in 3 minutes.\n"
             "Timer 10 minutes will be due in 8 minutes.\n",
         ),
+        (
+            Parameters(timers=[{"id": "pasta", "time_left": "4 minutes", "paused": True}]),
+            "There are 1 active timer.\nTimer pasta is paused with 4 minutes left.\n",
+        ),
     ],
 )
 def test_list_template(jinja_env, parameters, expected_output):
@@ -78,6 +87,10 @@ def test_list_template(jinja_env, parameters, expected_output):
             Parameters(minutes=10, is_deleted=True),
             "The last created timer for 10 minutes has been deleted.",
         ),
+        (
+            Parameters(minutes=10, label="pasta", is_deleted=True),
+            "The last created timer pasta has been deleted.",
+        ),
         (
             Parameters(is_deleted=False),
             "No active timer to delete.",
@@ -100,7 +113,116 @@ def test_delete_last_template(jinja_env, parameters, expected_output):
             Parameters(hours=1),
             "The timer 1 hour is due.",
         ),
+        (
+            Parameters(timers=[{"id": "5 minutes"}, {"id": "10 minutes"}, {"id": "1 hour"}]),
+            "The timers 5 minutes, 10 minutes and 1 hour are due.",
+        ),
+        (Parameters(minutes=10, label="pasta"), "The timer pasta is due."),
     ],
 )
 def test_triggered_template(jinja_env, parameters, expected_output):
     assert get_template_output("triggered.j2", parameters, jinja_env) == expected_output
+
+
+@pytest.mark.parametrize(
+    "template_name, parameters, expected_output",
+    [
+        ("set_alarm.j2", Parameters(alarms=[{"id": "30 past 6"}]), "Alarm set for 30 past 6."),
+        ("set_alarm.j2", Parameters(), "Please tell me when the alarm should go off, for example at 6:30."),
+        ("list_alarms.j2", Parameters(), "There are no alarms.\n"),
+        (
+            "list_alarms.j2",
+            Parameters(alarms=[{"id": "30 past 6"}, {"id": "7 o'clock on weekdays"}]),
+            "There are 2 alarms.\nAlarm for 30 past 6.\nAlarm for 7 o'clock on weekdays.\n",
+        ),
+        ("delete_alarm.j2", Parameters(alarms=[{"id": "30 past 6"}]), "The alarm for 30 past 6 has been deleted."),
+        ("delete_alarm.j2", Parameters(), "No alarm to delete."),
+        ("stop_alarm.j2", Parameters(), "Alarm stopped."),
+        (
+            "stop_alarm.j2",
+            Parameters(alarms=[{"id": "7 o'clock on weekdays"}]),
+            "Alarm stopped. Your next alarm is for 7 o'clock on weekdays.",
+        ),
+        ("alarm_triggered.j2", Parameters(alarms=[{"id": "30 past 6"}]), "Your alarm for 30 past 6 is going off."),
+    ],
+)
+def test_alarm_templates(jinja_env, template_name, parameters, expected_output):
+    assert get_template_output(template_name, parameters, jinja_env) == expected_output
+
+
+@pytest.mark.parametrize(
+    "template_name, parameters, expected_output",
+    [
+        (
+            "pause.j2",
+            Parameters(timers=[{"id": "pasta", "time_left": "4 minutes"}]),
+            "Timer pasta paused with 4 minutes left.",
+        ),
+        ("pause.j2", Parameters(), "There is no such timer to pause."),
+        (
+            "resume.j2",
+            Parameters(timers=[{"id": "pasta", "time_left": "4 minutes"}]),
+            "Timer pasta resumed, it will be due in 4 minutes.",
+        ),
+        (
+            "extend.j2",
+            Parameters(minutes=5, timers=[{"id": "pasta", "time_left": "9 minutes"}]),
+            "Added 5 minutes to timer pasta, it will be due in 9 minutes.",
+        ),
+        ("extend.j2", Parameters(minutes=5), "There is no such timer to extend."),
+        ("delete.j2", Parameters(is_deleted=True, timers=[{"id": "pasta"}]), "Timer pasta has been deleted."),
+        ("delete.j2", Parameters(is_deleted=False), "There is no such timer to delete."),
+    ],
+)
+def test_timer_change_templates(jinja_env, template_name, parameters, expected_output):
+    assert get_template_output(template_name, parameters, jinja_env) == expected_output
+
+
+@pytest.mark.parametrize(
+    "code, schedule, expected",
+    [
+        ("en", Schedule(6, 30), "30 past 6"),
+        ("en", Schedule(7, 0, WORKING_DAYS, True), "7 o'clock on weekdays"),
+        ("en", Schedule(8, 0, frozenset({0, 2, 4}), True), "8 o'clock every Monday, Wednesday and Friday"),
+        ("en-US", Schedule(19, 0, frozenset({5}), False), "7 o'clock p.m. on Saturday"),
+        ("de", Schedule(6, 0, frozenset(), True), "täglich um 6 Uhr"),
+    ],
+)
+def test_describe_schedule(code, schedule, expected):
+    assert get_formatter(code).describe_schedule(schedule) == expected
+
+
+@pytest.mark.parametrize(
+    "template_name, parameters, expected_output",
+    [
+        ("de/set.j2", Parameters(hours=1, minutes=2), "Timer für 1 Stunde und 2 Minuten gestellt."),
+        ("de/current_time.j2", Parameters(current_time=datetime(2024, 3, 1, 7, 0)), "Es ist 7 Uhr"),
+        (
+            "de/list.j2",
+            Parameters(timers=[{"id": "5 Minuten", "time_left": "3 Minuten"}]),
+            "Es gibt einen aktiven Timer.\nDer Timer 5 Minuten läuft in 3 Minuten ab.\n",
+        ),
+        ("de/triggered.j2", Parameters(seconds=30), "Der Timer 30 Sekunden ist abgelaufen."),
+        (
+            "de/extend.j2",
+            Parameters(minutes=5, timers=[{"id": "Nudeln", "time_left": "9 Minuten"}]),
+            "Der Timer Nudeln wurde um 5 Minuten verlängert und ist in 9 Minuten abgelaufen.",
+        ),
+        ("de/set_alarm.j2", Parameters(alarms=[{"id": "werktags um 7 Uhr"}]), "Wecker gestellt für werktags um 7 Uhr."),
+        ("de/list_alarms.j2", Parameters(alarms=[{"id": "6 Uhr 30"}]), "Es gibt einen Wecker.\nWecker 6 Uhr 30.\n"),
+        ("de/alarm_triggered.j2", Parameters(alarms=[{"id": "6 Uhr 30"}]), "Dein Wecker 6 Uhr 30 klingelt."),
+        (
+            "de/stop_alarm.j2",
+            Parameters(alarms=[{"id": "werktags um 7 Uhr"}]),
+            "Wecker gestoppt. Dein nächster Wecker ist werktags um 7 Uhr.",
+        ),
+    ],
+)
+def test_german_templates(jinja_env, template_name, parameters, expected_output):
+    assert get_template_output(template_name, parameters, jinja_env, "de") == expected_output
+
+
+def test_twelve_hour_current_time(jinja_env):
+    parameters = Parameters(current_time=datetime(2024, 3, 1, 15, 20))
+
+    assert get_template_output("current_time.j2", parameters, jinja_env, "en-US") == "It's 20 past 3 p.m."
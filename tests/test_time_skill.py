@@ -1,26 +1,39 @@
 import asyncio
+import json
+import pathlib
+import time
 import unittest
 import uuid
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock, patch
 
 import jinja2
-from private_assistant_commons.messages import ClientRequest, IntentAnalysisResult, NumberAnalysisResult
+from private_assistant_commons.messages import ClientRequest, IntentAnalysisResult, NumberAnalysisResult, Response
 
-from private_assistant_time_skill.time_skill import Parameters, TimeSkill
+from private_assistant_time_skill.capture import INCOMING, OUTGOING
+from private_assistant_time_skill.config import TimeSkillConfig
+from private_assistant_time_skill.metrics import MetricsRegistry
+from private_assistant_time_skill.profiler import StageProfiler
+from private_assistant_time_skill.schedules import WORKING_DAYS, Schedule
+from private_assistant_time_skill.time_skill import Action, Parameters, TimeSkill
+from private_assistant_time_skill.timer_store import TimerRecord
 
 
 class TestTimeSkill(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         # Mock the MQTT client, config, and Jinja2 template environment
         self.mock_mqtt_client = AsyncMock()
-        self.mock_config = Mock()
+        self.mock_config = TimeSkillConfig()
         self.mock_template_env = jinja2.Environment(
             loader=jinja2.PackageLoader(
                 "private_assistant_time_skill",
                 "templates",
             )
         )
-        self.mock_task_group = AsyncMock()
+        # Run tasks on the test loop so the timer scheduler is live
+        self.tasks = []
+        self.mock_task_group = Mock()
+        self.mock_task_group.create_task.side_effect = self._create_task
 
         # Instantiate TimeSkill with the mocks
         self.skill = TimeSkill(
@@ -32,62 +45,151 @@ class TestTimeSkill(unittest.IsolatedAsyncioTestCase):
         )
         await self.skill.skill_preparations()
 
+    def _create_task(self, coro):
+        task = asyncio.get_running_loop().create_task(coro)
+        self.tasks.append(task)
+        return task
+
+    async def asyncTearDown(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    def make_client_request(self, room="livingroom", text="set timer"):
+        return ClientRequest(id=uuid.uuid4(), text=text, output_topic=f"{room}/output", room=room)
+
     async def test_register_timer(self):
         # Mock client request and parameters
         parameters = Parameters(hours=1, minutes=30, seconds=0)
+        client_request = self.make_client_request()
 
         # Call the register_timer method
         with patch.object(self.skill, "add_task") as mock_create_task:
-            mock_create_task.return_value = Mock(spec=asyncio.Task)
-            self.skill.register_timer(parameters)
+            self.skill.register_timer(parameters, client_request)
+
+            # Verify that no per-timer task was created
+            mock_create_task.assert_not_called()
+
+            # Verify the timer is added to the room's active timers and scheduled
+            self.assertIn(parameters.duration_name, self.skill.active_timers["livingroom"])
+            self.assertIn(self.skill.active_timers["livingroom"][parameters.duration_name], self.skill.scheduler)
 
-            # Verify that a new async task was created
-            mock_create_task.assert_called_once()
+    async def test_register_same_duration_replaces_timer(self):
+        parameters = Parameters(minutes=5)
+        self.skill.register_timer(parameters, self.make_client_request())
+        first = self.skill.active_timers["livingroom"]["5 minutes"]
 
-            # Verify the timer is added to active_timers
-            self.assertTrue(self.skill.active_timers)
-            self.assertIn(parameters.duration_name, self.skill.active_timers)
+        self.skill.register_timer(parameters, self.make_client_request())
+
+        self.assertNotIn(first, self.skill.scheduler)
+        self.assertEqual(len(self.skill.scheduler), 1)
+        self.assertFalse(hasattr(first, "__dict__"))
 
     async def test_delete_last_timer(self):
         # Mock parameters for creating and deleting a timer
         parameters = Parameters(hours=1, minutes=30, seconds=0)
 
         # Register a timer first
-        with patch.object(self.skill, "add_task") as mock_create_task:
-            mock_create_task.return_value = Mock(spec=asyncio.Task)
-            self.skill.register_timer(parameters)
-
-            # Verify the timer was registered
-            self.assertTrue(self.skill.active_timers)
+        self.skill.register_timer(parameters, self.make_client_request())
+        timer = self.skill.active_timers["livingroom"][parameters.duration_name]
 
         # Call delete_last_timer method
-        self.skill.delete_last_timer(parameters)
+        self.skill.delete_last_timer(parameters, "livingroom")
 
         # Verify the timer has been deleted
-        self.assertIsNone(self.skill.last_created_timer_name)
+        self.assertTrue(parameters.is_deleted)
+        self.assertNotIn("livingroom", self.skill.last_created_timer_names)
+        self.assertNotIn(timer, self.skill.scheduler)
+
+    async def test_delete_last_timer_names_the_deleted_timer(self):
+        answers = []
+        self.mock_mqtt_client.publish.side_effect = lambda **kwargs: answers.append(
+            json.loads(kwargs["payload"])["text"]
+        )
+        for parameters in (Parameters(minutes=10), Parameters(minutes=1, label="pasta")):
+            self.skill.register_timer(parameters, self.make_client_request())
+            await self.skill.process_request(
+                IntentAnalysisResult(
+                    client_request=self.make_client_request(text="delete the last timer"),
+                    numbers=[],
+                    nouns=["timer"],
+                    verbs=[],
+                )
+            )
+        await self.skill.publish_queue.join()
+
+        self.assertEqual(
+            answers,
+            [
+                "The last created timer for 10 minutes has been deleted.",
+                "The last created timer pasta has been deleted.",
+            ],
+        )
+
+    async def test_delete_last_timer_only_touches_own_room(self):
+        parameters = Parameters(minutes=5)
+        self.skill.register_timer(parameters, self.make_client_request("kitchen"))
+
+        self.skill.delete_last_timer(parameters, "livingroom")
+
+        self.assertFalse(parameters.is_deleted)
+        self.assertIn(self.skill.active_timers["kitchen"][parameters.duration_name], self.skill.scheduler)
+
+    async def test_delete_request_naming_a_timer_deletes_that_timer(self):
+        answers = []
+        self.mock_mqtt_client.publish.side_effect = lambda **kwargs: answers.append(
+            json.loads(kwargs["payload"])["text"]
+        )
+        client_request = self.make_client_request()
+        for parameters in (Parameters(minutes=10), Parameters(minutes=5), Parameters(minutes=1, label="pasta")):
+            self.skill.register_timer(parameters, client_request)
+        requests = [
+            ("cancel the timer for 10 minutes", [NumberAnalysisResult(number_token=10, next_token="minutes")]),
+            ("stop the timer for the pasta", []),
+        ]
+        for text, numbers in requests:
+            await self.skill.process_request(
+                IntentAnalysisResult(
+                    client_request=self.make_client_request(text=text), numbers=numbers, nouns=["timer"], verbs=[]
+                )
+            )
+        await self.skill.publish_queue.join()
+
+        self.assertEqual(answers, ["Timer 10 minutes has been deleted.", "Timer pasta has been deleted."])
+        self.assertEqual(list(self.skill.active_timers["livingroom"]), ["5 minutes"])
 
     async def test_list_timers(self):
         # Mock parameters and client request to register timers
         parameters_1 = Parameters(hours=0, minutes=5, seconds=0)
         parameters_2 = Parameters(hours=0, minutes=10, seconds=0)
 
-        # Register two timers
-        with patch.object(self.skill, "add_task") as mock_create_task:
-            mock_create_task.return_value = Mock(spec=asyncio.Task)
-            self.skill.register_timer(parameters_1)
-            self.skill.register_timer(parameters_2)
+        # Register two timers in one room and one elsewhere
+        self.skill.register_timer(parameters_1, self.make_client_request())
+        self.skill.register_timer(parameters_2, self.make_client_request())
+        self.skill.register_timer(parameters_1, self.make_client_request("kitchen"))
 
         # Call find_active_timers method
-        result = self.skill.find_active_timers()
+        result = self.skill.find_active_timers("livingroom")
 
-        # Verify that two timers are listed
+        # Verify that only the two timers of the room are listed
         self.assertEqual(len(result), 2)
+        self.assertEqual(len(self.skill.find_active_timers("kitchen")), 1)
+        self.assertEqual(self.skill.find_active_timers("bedroom"), [])
+
+    async def test_same_duration_in_two_rooms(self):
+        parameters = Parameters(minutes=5)
+        self.skill.register_timer(parameters, self.make_client_request("kitchen"))
+        self.skill.register_timer(parameters, self.make_client_request("livingroom"))
+
+        kitchen_timer = self.skill.active_timers["kitchen"][parameters.duration_name]
+        livingroom_timer = self.skill.active_timers["livingroom"][parameters.duration_name]
+        self.assertIsNot(kitchen_timer, livingroom_timer)
+        self.assertIn(kitchen_timer, self.skill.scheduler)
+        self.assertIn(livingroom_timer, self.skill.scheduler)
 
     async def test_process_request_set(self):
         # Mock the IntentAnalysisResult and ClientRequest
-        mock_client_request = ClientRequest(
-            id=uuid.uuid4(), text="set timer for 10 minutes", output_topic="test_topic", room="livingroom"
-        )
+        mock_client_request = self.make_client_request(text="set timer for 10 minutes")
 
         mock_number_analysis_result = NumberAnalysisResult(number_token=10, next_token="minutes")
         mock_intent_result = IntentAnalysisResult(
@@ -96,47 +198,427 @@ class TestTimeSkill(unittest.IsolatedAsyncioTestCase):
 
         parameters = Parameters(minutes=10)
 
-        # Mock the TaskGroup creation
-        with patch.object(self.skill, "add_task") as mock_create_task:
-            mock_create_task.return_value = Mock(spec=asyncio.Task)
-            # Call the process_request method with SET action
-            await self.skill.process_request(mock_intent_result)
-
-            # Verify that the task was created
-            mock_create_task.assert_called()
+        # Call the process_request method with SET action
+        await self.skill.process_request(mock_intent_result)
+
+        # Verify the answer was queued and the timer is correctly registered
+        self.assertEqual(len(self.skill.publish_queue), 1)
+        self.assertIn(parameters.duration_name, self.skill.active_timers["livingroom"])
+        await self.skill.publish_queue.join()
+        self.mock_mqtt_client.publish.assert_awaited_once()
+        self.assertEqual(self.mock_mqtt_client.publish.await_args.kwargs["topic"], "livingroom/output")
+
+    async def test_certainty_grades_nouns_verbs_and_numbers(self):
+        minutes = [NumberAnalysisResult(number_token=5, next_token="minutes")]
+        cases = [
+            (["timer"], [], [], 1.0),
+            (["time"], ["is"], [], 0.8),
+            (["time"], ["set"], [], 1.0),
+            ([], ["set"], minutes, 0.8),
+            (["pasta"], ["cook"], minutes, 0.5),
+            (["lights"], ["turn"], [], 0.0),
+            (["alarm"], [], [], 1.0),
+            ([], ["wake"], [], 1.0),
+            (["weekday"], [], [NumberAnalysisResult(number_token=7, previous_token="at")], 0.8),
+        ]
+        for nouns, verbs, numbers, expected in cases:
+            intent = IntentAnalysisResult(
+                client_request=self.make_client_request(), numbers=numbers, nouns=nouns, verbs=verbs
+            )
+            with self.subTest(nouns=nouns, verbs=verbs):
+                self.assertEqual(await self.skill.calculate_certainty(intent), expected)
+
+    async def test_payload_without_time_words_is_rejected_before_validation(self):
+        with patch.object(self.skill, "process_request") as process_request:
+            await self.skill.handle_client_request_message('{"text": "turn on the lights", "nouns": ["lights"]')
+            await self.skill.handle_client_request_message(
+                IntentAnalysisResult(
+                    client_request=self.make_client_request(text="list timers"), numbers=[], nouns=["timers"], verbs=[]
+                ).model_dump_json()
+            )
 
-            # Verify the timer is correctly registered
-            self.assertTrue(self.skill.active_timers)
-            self.assertIn(parameters.duration_name, self.skill.active_timers)
+        self.assertEqual(self.skill.prefiltered_requests.value, 1)
+        self.skill.logger.error.assert_not_called()
+        process_request.assert_awaited_once()
 
     async def test_publish_triggered_timer(self):
-        # Mock parameters and setup a triggered timer
         parameters = Parameters(hours=0, minutes=5, seconds=0)
-        with patch.object(self.skill, "publish_triggered_timer") as mock_publish_triggered_timer:
-            await self.skill.publish_triggered_timer(parameters)
+        client_request = self.make_client_request("kitchen")
+        self.skill.publish_triggered_timer(parameters, client_request)
+        await self.skill.publish_queue.join()
+
+        # Verify that the announcement goes to the originating client instead of a broadcast
+        self.mock_mqtt_client.publish.assert_awaited_once_with(
+            topic="kitchen/output",
+            payload=Response(text="The timer 5 minutes is due.", alert=self.skill.default_alert).model_dump_json(
+                exclude_none=True
+            ),
+            qos=1,
+            retain=False,
+        )
 
-            # Verify that the publish_triggered_timer was called with rendered output
-            mock_publish_triggered_timer.assert_called_once()
+    async def test_recorder_captures_requests_and_responses(self):
+        self.skill.recorder = Mock()
+        payload = IntentAnalysisResult(
+            client_request=self.make_client_request("kitchen", "hello"),
+            numbers=[],
+            nouns=["weather"],
+            verbs=[],
+        ).model_dump_json()
+        await self.skill.handle_client_request_message(payload)
+        self.skill.publish_triggered_timer(Parameters(minutes=5), self.make_client_request("kitchen"))
+        await self.skill.publish_queue.join()
+
+        directions = [call.args[:2] for call in self.skill.recorder.record.call_args_list]
+        # Prefiltered requests are captured too, a replay sees exactly what the skill received
+        self.assertEqual(
+            directions, [(INCOMING, self.mock_config.intent_analysis_result_topic), (OUTGOING, "kitchen/output")]
+        )
 
     async def test_cleanup_timer(self):
         # Mock parameters and client request to register a timer
         parameters = Parameters(hours=0, minutes=5, seconds=0)
 
-        # Mock the task creation to ensure add_done_callback can be verified
-        with patch.object(self.skill, "add_task") as mock_create_task:
-            mock_create_task.return_value = Mock(spec=asyncio.Task)
-            mock_task = MagicMock()
-            mock_task.add_done_callback = MagicMock()
-            mock_create_task.return_value = mock_task
+        # Register a timer
+        self.skill.register_timer(parameters, self.make_client_request())
+        timer = self.skill.active_timers["livingroom"][parameters.duration_name]
+        self.assertIn(timer, self.skill.scheduler)
+
+        # Manually call the cleanup to simulate timer cancellation
+        self.skill.cleanup_timer("livingroom", parameters.duration_name)
+
+        # Verify that the timer was removed from active_timers and the scheduler
+        self.assertNotIn("livingroom", self.skill.active_timers)
+        self.assertNotIn(timer, self.skill.scheduler)
+
+    async def test_timer_fires_and_publishes(self):
+        parameters = Parameters(seconds=1)
+        with patch.object(self.skill, "publish_triggered_timer") as mock_publish:
+            self.skill.register_timer(parameters, self.make_client_request("kitchen"))
+            self.skill.scheduler.schedule(self.skill.active_timers["kitchen"][parameters.duration_name], 0.01)
+            await asyncio.sleep(0.05)
+
+            mock_publish.assert_called_once()
+            published_parameters, client_request = mock_publish.call_args.args
+            self.assertEqual(published_parameters, parameters)
+            self.assertEqual((client_request.room, client_request.output_topic), ("kitchen", "kitchen/output"))
+            self.assertNotIn("kitchen", self.skill.active_timers)
+
+    async def test_triggers_due_together_are_coalesced(self):
+        with patch.object(self.skill, "publish_triggered_timer") as mock_publish:
+            for seconds in (1, 2, 3):
+                self.skill.register_timer(Parameters(seconds=seconds), self.make_client_request("kitchen"))
+            self.skill.register_timer(Parameters(seconds=1), self.make_client_request("office"))
+            for room_timers in self.skill.active_timers.values():
+                for timer in room_timers.values():
+                    self.skill.scheduler.schedule(timer, 0.01)
+            await asyncio.sleep(0.05)
+
+            announcements = {call.args[1].room: call.args[0] for call in mock_publish.call_args_list}
+            self.assertEqual(
+                announcements["kitchen"],
+                Parameters(timers=[{"id": "1 second"}, {"id": "2 seconds"}, {"id": "3 seconds"}]),
+            )
+            self.assertEqual(announcements["office"], Parameters(seconds=1))
+            self.assertEqual(mock_publish.call_count, 2)
+            self.assertEqual(self.skill.trigger_publishes_saved.value, 2)
+
+    async def test_coalescing_window_merges_staggered_triggers(self):
+        self.skill.trigger_coalescing_window = 0.1
+        with patch.object(self.skill, "publish_triggered_timer") as mock_publish:
+            for seconds in (1, 2):
+                self.skill.register_timer(Parameters(seconds=seconds), self.make_client_request("kitchen"))
+            kitchen_timers = self.skill.active_timers["kitchen"]
+            self.skill.scheduler.schedule(kitchen_timers["1 second"], 0.01)
+            self.skill.scheduler.schedule(kitchen_timers["2 seconds"], 0.05)
+            await asyncio.sleep(0.07)
+            mock_publish.assert_not_called()
+
+            await asyncio.sleep(0.1)
+            mock_publish.assert_called_once()
+            self.assertEqual(len(mock_publish.call_args.args[0].timers), 2)
+
+    async def test_restore_timers(self):
+        now = time.time()
+        timer_records = [
+            TimerRecord("kitchen", "10 minutes", "kitchen/output", None, 10, None, now + 300),
+            TimerRecord("kitchen", "5 seconds", "kitchen/output", None, None, 5, now - 1),
+        ]
+        with patch.object(self.skill, "publish_triggered_timer") as mock_publish:
+            self.skill.restore_timers(timer_records)
+            await asyncio.sleep(0.01)
+
+            # The overdue timer fires right away, the other one keeps its remaining time
+            mock_publish.assert_called_once()
+            self.assertEqual(mock_publish.call_args.args[0], Parameters(seconds=5))
+            self.assertEqual(
+                self.skill.find_active_timers("kitchen"),
+                [{"id": "10 minutes", "time_left": "4 minutes and 59 seconds"}],
+            )
 
-            # Register a timer
-            self.skill.register_timer(parameters)
+    async def test_determiners_do_not_name_timers(self):
+        answers = []
+        self.mock_mqtt_client.publish.side_effect = lambda **kwargs: answers.append(
+            json.loads(kwargs["payload"])["text"]
+        )
+        for text in ("set another timer for 10 minutes", "start one more timer for 10 minutes"):
+            await self.skill.process_request(
+                IntentAnalysisResult(
+                    client_request=self.make_client_request(text=text),
+                    numbers=[NumberAnalysisResult(number_token=10, next_token="minutes")],
+                    nouns=["timer"],
+                    verbs=[],
+                )
+            )
+        await self.skill.publish_queue.join()
+
+        self.assertEqual(answers, ["Timer set for 10 minutes."] * 2)
+        self.assertTrue(all(timer.label is None for timer in self.skill.active_timers["livingroom"].values()))
+
+    async def test_find_timer_by_singular_duration(self):
+        client_request = self.make_client_request()
+        for minutes in (1, 10, 5):
+            self.skill.register_timer(Parameters(minutes=minutes), client_request)
+        for text, number in (("pause the 1 minute timer", 1), ("delete the 10 minute timer", 10)):
+            await self.skill.process_request(
+                IntentAnalysisResult(
+                    client_request=self.make_client_request(text=text),
+                    numbers=[NumberAnalysisResult(number_token=number, next_token="minute")],
+                    nouns=["timer"],
+                    verbs=[],
+                )
+            )
+
+        timers = self.skill.active_timers["livingroom"]
+        self.assertEqual(list(timers), ["1 minute", "5 minutes"])
+        self.assertIsNotNone(timers["1 minute"].remaining)
+        self.assertIsNone(timers["5 minutes"].remaining)
+
+    async def test_pause_resume_extend_and_delete_named_timer(self):
+        answers = []
+        self.mock_mqtt_client.publish.side_effect = lambda **kwargs: answers.append(
+            json.loads(kwargs["payload"])["text"]
+        )
+        requests = [
+            ("set a pasta timer for 10 minutes", 10),
+            ("pause the pasta timer", None),
+            ("list my timers", None),
+            ("add 5 minutes to the pasta timer", 5),
+            ("resume the pasta timer", None),
+        ]
+        timer = None
+        for text, minutes in requests:
+            numbers = [NumberAnalysisResult(number_token=minutes, next_token="minutes")] if minutes else []
+            await self.skill.process_request(
+                IntentAnalysisResult(
+                    client_request=self.make_client_request(text=text), numbers=numbers, nouns=["timer"], verbs=[]
+                )
+            )
+            timer = timer or self.skill.active_timers["livingroom"]["pasta"]
+            # Changes act on the registered timer instead of replacing it
+            self.assertIs(self.skill.active_timers["livingroom"]["pasta"], timer)
+        await self.skill.publish_queue.join()
+
+        self.assertEqual(answers[0], "Timer pasta set for 10 minutes.")
+        self.assertEqual(answers[1], "Timer pasta paused with 9 minutes and 59 seconds left.")
+        self.assertEqual(
+            answers[2], "There are 1 active timer.\nTimer pasta is paused with 9 minutes and 59 seconds left.\n"
+        )
+        self.assertEqual(answers[3], "Added 5 minutes to timer pasta, it will be due in 14 minutes and 59 seconds.")
+        self.assertEqual(answers[4], "Timer pasta resumed, it will be due in 14 minutes and 59 seconds.")
+        self.assertAlmostEqual(self.skill.scheduler.time_left(timer), 900, delta=1)
+
+        self.skill.delete_timer(Parameters(label="pasta"), "livingroom")
+        self.assertNotIn("livingroom", self.skill.active_timers)
+        self.assertEqual(len(self.skill.scheduler), 0)
+
+    async def test_paused_timer_does_not_fire_and_is_restored_paused(self):
+        self.skill.register_timer(Parameters(seconds=1, label="tea"), self.make_client_request("kitchen"))
+        self.skill.pause_timer(Parameters(label="tea"), "kitchen")
+        timer = self.skill.active_timers["kitchen"]["tea"]
+        record = timer.to_record(time.time() + 1)
+
+        with patch.object(self.skill, "publish_triggered_timer") as mock_publish:
+            await asyncio.sleep(1.1)
+            mock_publish.assert_not_called()
+
+        self.skill.release_room("kitchen")
+        self.skill.restore_timers([record])
+        restored = self.skill.active_timers["kitchen"]["tea"]
+        self.assertEqual((restored.label, restored.remaining), ("tea", timer.remaining))
+        self.assertNotIn(restored, self.skill.scheduler)
+
+    async def test_metrics_record_requests_and_publish_failures(self):
+        registry = MetricsRegistry()
+        skill = TimeSkill(
+            config_obj=self.mock_config,
+            mqtt_client=self.mock_mqtt_client,
+            template_env=self.mock_template_env,
+            task_group=self.mock_task_group,
+            logger=Mock(),
+            metrics_registry=registry,
+        )
+        await skill.skill_preparations()
+        self.mock_mqtt_client.publish.side_effect = RuntimeError("broker gone")
+        intent_analysis_result = Mock(spec=IntentAnalysisResult)
+        intent_analysis_result.client_request = self.make_client_request(text="help")
+
+        await skill.process_request(intent_analysis_result)
+        await skill.publish_queue.join()
+
+        self.assertEqual(registry.histogram("time_skill_request_duration_seconds", "", action="help").count, 1)
+        self.assertEqual(registry.histogram("time_skill_render_duration_seconds", "", template="help").count, 1)
+        self.assertEqual(registry.counter("time_skill_publish_failures_total", "").value, 1)
+        skill.register_timer(Parameters(minutes=5), self.make_client_request())
+        self.assertEqual(registry.gauge("time_skill_active_timers", "").value, 1)
+
+    async def test_profiler_records_request_stages(self):
+        self.skill.profiler = StageProfiler(pathlib.Path("unused"), 1.0, Mock())
+        intent_analysis_result = Mock(spec=IntentAnalysisResult)
+        intent_analysis_result.client_request = self.make_client_request(text="help")
+
+        await self.skill.process_request(intent_analysis_result)
+
+        stacks = [line.rsplit(" ", 1)[0] for line in self.skill.profiler.folded().splitlines()]
+        self.assertEqual(
+            stacks,
+            [
+                f"process_request;help;{stage}"
+                for stage in ("action", "match", "parameters", "publish_enqueue", "render")
+            ],
+        )
+
+    async def test_answers_are_cached_per_minute(self):
+        # HELP is rendered during skill_preparations already
+        self.assertEqual(self.skill.cache_misses[Action.HELP].value, 1)
+        self.skill.get_answer(Action.HELP, Parameters())
+        self.assertEqual(self.skill.cache_hits[Action.HELP].value, 1)
 
-            # Verify that add_done_callback was called to attach the cleanup method
-            mock_task.add_done_callback.assert_called_once()
+        first = self.skill.get_answer(Action.CURRENT_TIME, Parameters(current_time=datetime(2024, 1, 1, 8, 5, 1)))
+        second = self.skill.get_answer(Action.CURRENT_TIME, Parameters(current_time=datetime(2024, 1, 1, 8, 5, 59)))
+        third = self.skill.get_answer(Action.CURRENT_TIME, Parameters(current_time=datetime(2024, 1, 1, 8, 6, 0)))
 
-            # Manually call the cleanup to simulate task completion
-            self.skill.cleanup_timer(parameters.duration_name)
+        self.assertEqual((first, second, third), ("It's 5 past 8", "It's 5 past 8", "It's 6 past 8"))
+        self.assertEqual(self.skill.cache_hits[Action.CURRENT_TIME].value, 1)
+        self.skill.response_cache.invalidate(Action.CURRENT_TIME)
+        self.assertEqual(len(self.skill.response_cache), 1)
+
+    async def test_rooms_answer_in_their_locale(self):
+        skill = TimeSkill(
+            config_obj=TimeSkillConfig(client_locales={"kueche": "de"}),
+            mqtt_client=self.mock_mqtt_client,
+            template_env=self.mock_template_env,
+            task_group=self.mock_task_group,
+            logger=Mock(),
+        )
+        await skill.skill_preparations()
+        for room in ("kueche", "kitchen"):
+            skill.register_timer(Parameters(minutes=2), self.make_client_request(room=room))
 
-            # Verify that the timer was removed from active_timers
-            self.assertNotIn(parameters.duration_name, self.skill.active_timers)
+        answers = {
+            room: skill.get_answer(
+                Action.LIST, Parameters(timers=skill.find_active_timers(room)), skill.locale_for(room)
+            )
+            for room in ("kueche", "kitchen")
+        }
+        self.assertTrue(answers["kueche"].startswith("Es gibt einen aktiven Timer.\nDer Timer 2 Minuten läuft in"))
+        self.assertTrue(answers["kitchen"].startswith("There are 1 active timer.\nTimer 2 minutes will be due in"))
+
+    async def test_rooms_tell_the_time_of_their_zone(self):
+        skill = TimeSkill(
+            config_obj=TimeSkillConfig(default_time_zone="UTC", client_time_zones={"tokyo": "Asia/Tokyo"}),
+            mqtt_client=self.mock_mqtt_client,
+            template_env=self.mock_template_env,
+            task_group=self.mock_task_group,
+            logger=Mock(),
+        )
+        await skill.skill_preparations()
+        tokyo_offset = 9 * 3600
+
+        tokyo_now = skill.clock_for("tokyo").now()
+        utc_now = skill.clock_for("kitchen").now()
+        self.assertEqual(tokyo_now.utcoffset().total_seconds(), tokyo_offset)
+        self.assertEqual(utc_now.utcoffset().total_seconds(), 0)
+
+        # The same instant is cached separately per wall time
+        instant = datetime(2024, 1, 1, 8, 5, tzinfo=UTC)
+        answers = [
+            skill.get_answer(
+                Action.CURRENT_TIME, Parameters(current_time=instant.astimezone(skill.clock_for(room).zone))
+            )
+            for room in ("kitchen", "tokyo")
+        ]
+        self.assertEqual(answers, ["It's 5 past 8", "It's 5 past 17"])
+
+    async def test_set_list_and_delete_alarms(self):
+        answers = []
+        self.mock_mqtt_client.publish.side_effect = lambda **kwargs: answers.append(
+            json.loads(kwargs["payload"])["text"]
+        )
+        for text in (
+            "wake me at 6:30",
+            "set an alarm every weekday at 7",
+            "list my alarms",
+            "delete the alarm at 6:30",
+        ):
+            await self.skill.process_request(
+                IntentAnalysisResult(
+                    client_request=self.make_client_request(text=text), numbers=[], nouns=["alarm"], verbs=[]
+                )
+            )
+        await self.skill.publish_queue.join()
+
+        self.assertEqual(answers[0], "Alarm set for 30 past 6.")
+        self.assertEqual(answers[1], "Alarm set for 7 o'clock on weekdays.")
+        self.assertIn("There are 2 alarms.", answers[2])
+        self.assertEqual(answers[3], "The alarm for 30 past 6 has been deleted.")
+        self.assertEqual(list(self.skill.alarms["livingroom"]), ["07:00/01234/1"])
+        self.assertEqual(len(self.skill.scheduler), 1)
+
+    async def test_stop_alarm_keeps_the_schedule(self):
+        answers = []
+        self.mock_mqtt_client.publish.side_effect = lambda **kwargs: answers.append(
+            json.loads(kwargs["payload"])["text"]
+        )
+        for text in ("set an alarm every weekday at 7", "stop the alarm"):
+            await self.skill.process_request(
+                IntentAnalysisResult(
+                    client_request=self.make_client_request(text=text), numbers=[], nouns=["alarm"], verbs=[]
+                )
+            )
+        await self.skill.publish_queue.join()
+
+        self.assertEqual(answers[1], "Alarm stopped. Your next alarm is for 7 o'clock on weekdays.")
+        self.assertEqual(list(self.skill.alarms["livingroom"]), ["07:00/01234/1"])
+        self.assertEqual(len(self.skill.scheduler), 1)
+
+    async def test_repeating_alarm_is_rescheduled_and_one_shot_removed(self):
+        now = datetime(2024, 1, 5, 12, 0).timestamp()
+        self.skill.wall_clock = lambda: now
+        client_request = self.make_client_request("kitchen")
+        for schedule in (Schedule(7, 0, WORKING_DAYS, True), Schedule(13, 0)):
+            self.skill.register_alarm(Parameters(schedule=schedule), client_request)
+        repeating, one_shot = self.skill.alarms["kitchen"].values()
+
+        with patch.object(self.skill, "publish_announcement") as mock_publish:
+            self.skill.fire_scheduled(repeating)
+            self.skill.fire_scheduled(one_shot)
+
+        self.assertEqual(
+            [call.args[1].alarms for call in mock_publish.call_args_list],
+            [[{"id": "7 o'clock on weekdays"}], [{"id": "13 o'clock"}]],
+        )
+        self.assertEqual(list(self.skill.alarms["kitchen"].values()), [repeating])
+        # January 5 2024 is a Friday, the next weekday is Monday
+        time_left = self.skill.scheduler.time_left(repeating)
+        expected = datetime(2024, 1, 8, 7, 0).timestamp() - now
+        self.assertAlmostEqual(time_left, expected, delta=1)
+
+    async def test_restore_alarms(self):
+        now = time.time()
+        spec = Schedule(7, 0, frozenset(), True).to_spec()
+        self.skill.restore_timers([TimerRecord("kitchen", spec, "kitchen/output", None, None, None, now + 600, spec)])
+
+        alarm = self.skill.alarms["kitchen"][spec]
+        self.assertEqual(alarm.schedule, Schedule(7, 0, frozenset(), True))
+        self.assertAlmostEqual(self.skill.scheduler.time_left(alarm), 600, delta=1)
@@ -0,0 +1,42 @@
+import zoneinfo
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from private_assistant_time_skill.time_zones import ZoneClock, get_zone_clock
+
+BERLIN = zoneinfo.ZoneInfo("Europe/Berlin")
+
+
+def test_refresh_caches_offset_until_next_transition():
+    clock = ZoneClock(BERLIN)
+    # Daylight saving time in Berlin starts at 01:00 UTC on the last Sunday of March
+    clock.refresh(datetime(2024, 3, 1, tzinfo=UTC).timestamp())
+
+    assert clock._offset.utcoffset(None) == timedelta(hours=1)
+    assert clock._valid_until == datetime(2024, 3, 31, 1, tzinfo=UTC).timestamp()
+
+
+def test_zone_without_transitions_is_rechecked_later():
+    clock = ZoneClock(zoneinfo.ZoneInfo("UTC"))
+    start = datetime(2024, 1, 1, tzinfo=UTC).timestamp()
+    clock.refresh(start)
+
+    assert clock._valid_until > start + 300 * 86400
+
+
+def test_now_matches_zone_rules():
+    now = get_zone_clock("Europe/Berlin").now()
+
+    assert now.utcoffset() == datetime.now(BERLIN).utcoffset()
+    assert abs(now - datetime.now(UTC)) < timedelta(seconds=1)
+
+
+def test_clocks_are_shared_per_zone():
+    assert get_zone_clock("Europe/Berlin") is get_zone_clock("Europe/Berlin")
+    assert get_zone_clock().zone is None
+
+
+def test_unknown_zone_raises():
+    with pytest.raises(ValueError, match="Unknown time zone 'Mars/Olympus'"):
+        get_zone_clock("Mars/Olympus")
@@ -0,0 +1,90 @@
+import logging
+import pathlib
+import sqlite3
+
+import pytest
+
+from private_assistant_time_skill.timer_store import TimerRecord, TimerStore
+
+
+@pytest.fixture
+def store(tmp_path: pathlib.Path):
+    timer_store = TimerStore(tmp_path / "timers.sqlite3", logging.getLogger(__name__))
+    timer_store.open()
+    yield timer_store
+    timer_store.close()
+
+
+@pytest.mark.asyncio
+async def test_flush_persists_created_timers(store: TimerStore):
+    timer = TimerRecord("kitchen", "10 minutes", "kitchen/output", None, 10, None, 1000.0)
+    store.record_create(timer)
+
+    assert store.load() == []
+    await store.flush()
+    assert store.load() == [timer]
+
+
+@pytest.mark.asyncio
+async def test_removal_coalesces_with_pending_create(store: TimerStore):
+    store.record_create(TimerRecord("kitchen", "10 minutes", "kitchen/output", None, 10, None, 1000.0))
+    store.record_removal("kitchen", "10 minutes")
+    await store.flush()
+
+    assert store.load() == []
+
+
+def test_close_writes_pending_changes(tmp_path: pathlib.Path):
+    path = tmp_path / "timers.sqlite3"
+    timer = TimerRecord("kitchen", "1 hour", "kitchen/output", 1, None, None, 2000.0)
+    store = TimerStore(path, logging.getLogger(__name__))
+    store.open()
+    store.record_create(timer)
+    store.close()
+
+    reopened = TimerStore(path, logging.getLogger(__name__))
+    reopened.open()
+    assert reopened.load() == [timer]
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_same_name_in_different_rooms(store: TimerStore):
+    kitchen = TimerRecord("kitchen", "5 minutes", "kitchen/output", None, 5, None, 1000.0)
+    office = TimerRecord("office", "5 minutes", "office/output", None, 5, None, 1000.0)
+    store.record_create(kitchen)
+    store.record_create(office)
+    await store.flush()
+    store.record_removal("office", "5 minutes")
+    await store.flush()
+
+    assert store.load() == [kitchen]
+
+
+def test_store_without_added_columns_is_migrated(tmp_path: pathlib.Path):
+    path = tmp_path / "timers.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE timers (room TEXT NOT NULL, name TEXT NOT NULL, output_topic TEXT NOT NULL, "
+        "hours INTEGER, minutes INTEGER, seconds INTEGER, deadline REAL NOT NULL, PRIMARY KEY (room, name))"
+    )
+    connection.execute("INSERT INTO timers VALUES ('kitchen', '1 hour', 'kitchen/output', 1, NULL, NULL, 2000.0)")
+    connection.commit()
+    connection.close()
+    alarm = TimerRecord("kitchen", "07:00/01234/1", "kitchen/output", None, None, None, 3000.0, "07:00/01234/1")
+    paused = TimerRecord("kitchen", "pasta", "kitchen/output", None, 10, None, 2500.0, None, 240.0)
+
+    store = TimerStore(path, logging.getLogger(__name__))
+    store.open()
+    store.record_create(alarm)
+    store.record_create(paused)
+    store.close()
+
+    reopened = TimerStore(path, logging.getLogger(__name__))
+    reopened.open()
+    assert sorted(reopened.load()) == [
+        TimerRecord("kitchen", "07:00/01234/1", "kitchen/output", None, None, None, 3000.0, "07:00/01234/1"),
+        TimerRecord("kitchen", "1 hour", "kitchen/output", 1, None, None, 2000.0),
+        paused,
+    ]
+    reopened.close()